@@ -0,0 +1,35 @@
+"""
+Fast JSON responses for large API payloads.
+
+FastAPI's default path validates a returned value against ``response_model``,
+converts it to plain Python objects and then encodes those with the stdlib
+``json`` module: three passes over the data, two of them in Python.
+``model_response`` validates ORM objects against the response model once and
+serializes them straight to JSON bytes in pydantic-core.
+
+Returning a ``Response`` makes FastAPI skip its own validation, so routes
+opting in keep ``response_model`` for the OpenAPI schema only. See
+``backend/benchmarks/bench_serialization.py`` for the numbers.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(model_type: Any) -> TypeAdapter:
+    return TypeAdapter(model_type)
+
+
+def serialize_models(model_type: Any, content: Any) -> bytes:
+    """Validate ``content`` (ORM objects allowed) as ``model_type`` and encode it to JSON bytes."""
+    adapter = _adapter(model_type)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def model_response(model_type: Any, content: Any, headers: dict[str, str] | None = None) -> Response:
+    """JSON response for ``content`` serialized through ``model_type`` in a single pass."""
+    return Response(serialize_models(model_type, content), media_type="application/json", headers=headers)
@@ -1,11 +1,12 @@
 import asyncio
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, Query, Request, Response
 from sqlmodel import Session, select
 from uuid import UUID
 
 # from backend.core.database.plugins import MetadataPlugin, IndexerPlugin
+from backend.api.responses import model_response
 from backend.api.v1.utils import _install_plugin_util, _uninstall_plugin_util
 from backend.core.database.models import *
 from backend.core.database.database import get_session
@@ -41,7 +42,7 @@ async def read_series_group(*, session: Session = Depends(get_session), group_id
 
 @router.get("/series", response_model=list[SeriesPublicSimple])
 async def read_series_list(*, session: Session = Depends(get_session)):
-    return library_service.get_all_series(session)
+    return model_response(list[SeriesPublicSimple], library_service.get_all_series(session))
 
 
 @router.get("/series/{series_id}", response_model=SeriesPublicWithBooks)
@@ -51,7 +52,7 @@ async def read_series(*, session: Session = Depends(get_session), series_id: UUI
 
 @router.get("/books", response_model=list[BookPublicSimple])
 async def read_book_list(*, session: Session = Depends(get_session)):
-    return library_service.get_all_books(session)
+    return model_response(list[BookPublicSimple], library_service.get_all_books(session))
 
 
 @router.get("/books/{book_id}", response_model=BookPublicWithReleases)
@@ -61,7 +62,19 @@ async def read_book(*, session: Session = Depends(get_session), book_id: UUID):
 
 @router.get("/releases", response_model=list[ReleasePublicSimple])
 async def read_release_list(*, session: Session = Depends(get_session)):
-    return library_service.get_all_releases(session)
+    return model_response(list[ReleasePublicSimple], library_service.get_all_releases(session))
+
+
+@router.get("/library/search", response_model=list[LibrarySearchResult])
+async def search_library(
+    *,
+    session: Session = Depends(get_session),
+    q: str,
+    limit: int = Query(default=25, ge=1, le=100),
+    fuzzy: bool = True,
+):
+    """Search series and books in the local library (ranked, prefix and fuzzy matching)."""
+    return library_service.search_library(session, q, limit=limit, fuzzy=fuzzy)
 
 
 @router.patch("/toggle-book-downloaded/{book_id}", response_model=dict[str, str])
@@ -104,56 +117,19 @@ async def list_plugins(*, session: Session = Depends(get_session)):
 
 
 @router.get("/plugin-capabilities")
-async def get_plugin_capabilities(*, session: Session = Depends(get_session)):
-    """Get a summary of what capabilities are available from enabled plugins."""
-    plugins = session.exec(select(Plugin).where(Plugin.enabled == True)).all()
-    
-    capabilities = {
-        "has_indexers": False,
-        "has_download_clients": False,
-        "has_metadata_sources": False,
-        "has_parsers": False,
-    }
-    
-    for plugin in plugins:
-        try:
-            plugin_instance = plugin_manager.get_plugin(plugin.name)
-            if plugin_instance:
-                # Check for indexer capability
-                try:
-                    indexers = plugin_instance.get_available_indexers()
-                    if indexers:
-                        capabilities["has_indexers"] = True
-                except (NotImplementedError, AttributeError):
-                    pass
-                
-                # Check for download client capability
-                try:
-                    clients = plugin_instance.get_available_clients()
-                    if clients:
-                        capabilities["has_download_clients"] = True
-                except (NotImplementedError, AttributeError):
-                    pass
-                
-                # Check for metadata source capability
-                try:
-                    sources = plugin_instance.get_available_sources()
-                    if sources:
-                        capabilities["has_metadata_sources"] = True
-                except (NotImplementedError, AttributeError):
-                    pass
-                
-                # Check for parser capability
-                try:
-                    parsers = plugin_instance.get_available_parsers()
-                    if parsers:
-                        capabilities["has_parsers"] = True
-                except (NotImplementedError, AttributeError):
-                    pass
-        except Exception:
-            pass
-    
-    return capabilities
+async def get_plugin_capabilities(request: Request, response: Response):
+    """Get a summary of what capabilities are available from enabled plugins.
+
+    Served from the plugin manager's capability registry. Supports conditional
+    GETs: a matching If-None-Match header gets an empty 304 response.
+    """
+    etag = plugin_manager.capabilities_etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return plugin_manager.get_capability_summary()
 
 
 @router.post("/install-plugin", response_model=dict[str, str])
@@ -193,7 +169,7 @@ async def test_indexer_connection(*, config: dict[str, Any], session: Session =
             return {"success": False, "message": "Plugin not found"}
         
         # Get the plugin instance
-        plugin_instance = plugin_manager.get_plugin(plugin.name)
+        plugin_instance = await plugin_manager.ensure_loaded(plugin.name)
         if not plugin_instance:
             return {"success": False, "message": "Plugin instance not found"}
         
@@ -1,7 +1,7 @@
 import asyncio
 from pathlib import Path
 from urllib.parse import unquote
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from fastapi.responses import FileResponse
 from sqlmodel import SQLModel, Session, select
 import uuid
@@ -9,9 +9,8 @@ import uuid
 # from backend.core.database.plugins import MetadataPlugin, IndexerPlugin
 from backend.core.database.models import *
 from backend.core.database.database import get_session
-from backend.core.plugins.metadata import MetadataPlugin, SeriesFetchModel
-from backend.core.services import metadata_service
-from backend.plugin_manager import plugin_manager
+from backend.core.plugins.metadata import SeriesFetchModel
+from backend.core.services import image_service, metadata_service
 
 router = APIRouter()
 
@@ -82,13 +81,21 @@ async def fetch_series(
     return AddSeriesResponse(success=True, message="Series added successfully")
 
 @router.get("/image/{plugin_name}/{source_name}/{filepath:path}")  
-async def get_image(plugin_name: str, source_name: str, filepath: str, request: Request, session: Session = Depends(get_session)):
+async def get_image(
+    plugin_name: str,
+    source_name: str,
+    filepath: str,
+    request: Request,
+    w: int | None = None,
+    session: Session = Depends(get_session),
+):
     """Get an image from a metadata source's data directory.
     
     Args:
         plugin_name: Name of the plugin
         source_name: Name of the metadata source
         filepath: Path to the image file
+        w: Optional thumbnail width (200 or 400), served as WebP to clients accepting it
     """
     
     # Get the raw, undecoded path from the request scope
@@ -99,57 +106,27 @@ async def get_image(plugin_name: str, source_name: str, filepath: str, request:
     if raw_path.startswith(prefix):
         filepath = raw_path[len(prefix):]
 
-    # Query the metadata source by plugin name and source name
-    statement = (
-        select(MetadataSource)
-        .join(Plugin)
-        .where(Plugin.name == plugin_name, MetadataSource.name == source_name)
-    )
-    metadata_source = session.exec(statement).first()
-    
-    if not metadata_source or not metadata_source.enabled:
-        raise HTTPException(status_code=404, detail="Metadata source not found")
-    
-    if not metadata_source.plugin:
-        raise HTTPException(status_code=404, detail="Plugin for metadata source not found")
-
-    # Get the plugin instance and create a configured source
-    plugin = plugin_manager.get_plugin(metadata_source.plugin.name)
-    if not plugin:
-        raise HTTPException(status_code=404, detail="Plugin not found")
-    
-    source_instance = None
-    try:
-        # Use plugin's factory method to create configured source
-        source_instance = plugin.create_metadata_source(metadata_source.config or {})
-        if not isinstance(source_instance, MetadataPlugin):
-            raise HTTPException(status_code=404, detail="Metadata plugin not found")
-        
-        # Use the plugin's data directory
-        if not hasattr(source_instance, 'data_dir'):
-            raise HTTPException(status_code=500, detail="Plugin data directory not configured")
-        
-        plugin_data_dir = source_instance.data_dir
-        
-        # The filepath is URL-encoded, so we need to decode it for filesystem access
-        decoded_filepath = unquote(filepath)
-        
-        img_path = plugin_data_dir / decoded_filepath
-
-        if not img_path.exists():
-            raise HTTPException(status_code=404, detail="File not found")
-        
-        if not img_path.is_file():
-            raise HTTPException(status_code=400, detail="Not a file")
-        
-        try:
-            img_path.resolve().relative_to(plugin_data_dir.resolve())
-        except ValueError:
-            raise HTTPException(status_code=403, detail="Access denied")
-
-        return FileResponse(img_path)
-    finally:
-        # Clean up plugin instance
-        if source_instance and hasattr(source_instance, 'stop'):
-            source_instance.stop()
+    if w is not None:
+        image_service.validate_thumbnail_width(w)
+
+    data_dir = await image_service.get_source_data_dir(session, plugin_name, source_name)
+    # The filepath is URL-encoded, so we need to decode it for filesystem access
+    img_path, stat_result = image_service.resolve_image(data_dir, unquote(filepath))
+
+    thumbnail = None
+    if w is not None and "image/webp" in request.headers.get("accept", ""):
+        cache_key = f"{plugin_name}/{source_name}/{img_path.relative_to(data_dir)}"
+        thumbnail = await asyncio.to_thread(image_service.get_thumbnail, img_path, stat_result, cache_key, w)
+
+    headers = image_service.cache_headers(stat_result, f"-w{w}" if thumbnail else "")
+    if w is not None:
+        headers["Vary"] = "Accept"
+    if image_service.is_not_modified(
+        headers, request.headers.get("if-none-match"), request.headers.get("if-modified-since")
+    ):
+        return Response(status_code=304, headers=headers)
+
+    if thumbnail:
+        return FileResponse(thumbnail[0], stat_result=thumbnail[1], headers=headers, media_type="image/webp")
+    return FileResponse(img_path, stat_result=stat_result, headers=headers)
 
@@ -28,7 +28,7 @@ async def create_parser(*, session: Session = Depends(get_session), parser: Pars
         raise HTTPException(status_code=404, detail="Plugin not found")
     
     # Verify the plugin can provide this parser
-    plugin_instance = plugin_manager.get_plugin(plugin.name)
+    plugin_instance = await plugin_manager.ensure_loaded(plugin.name)
     if not plugin_instance:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin.name}' not loaded")
     
@@ -1,5 +1,6 @@
 """API endpoints for plugin discovery and capabilities."""
 
+import asyncio
 from typing import Dict, List, Any
 from fastapi import APIRouter, HTTPException, Depends, UploadFile
 from sqlmodel import Session
@@ -14,12 +15,15 @@ router = APIRouter(prefix="/plugins", tags=["plugins"])
 
 @router.get("/")
 async def get_all_plugins() -> Dict[str, Any]:
-    """Get all loaded plugins with their basic information.
+    """Get all loaded plugins, and lazy plugins not loaded yet, with their basic information.
     
     Returns:
         Dictionary mapping plugin names to their basic info
     """
-    plugins = plugin_manager.get_all_plugins()
+    plugins = {
+        **{name: plugin_manager.describe_plugin(name) for name in plugin_manager.lazy_plugins},
+        **plugin_manager.get_all_plugins(),
+    }
     
     return {
         name: {
@@ -42,15 +46,11 @@ async def get_available_sources(plugin_name: str) -> List[Dict[str, Any]]:
     Returns:
         List of available source configurations
     """
-    plugin = plugin_manager.get_plugin(plugin_name)
-    if not plugin:
+    capabilities = plugin_manager.get_capabilities(plugin_name)
+    if capabilities is None:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_name}' not found")
     
-    try:
-        sources = plugin.get_available_sources()
-        return sources
-    except NotImplementedError:
-        return []
+    return capabilities["sources"]
 
 
 @router.get("/{plugin_name}/indexers")
@@ -63,15 +63,11 @@ async def get_available_indexers(plugin_name: str) -> List[Dict[str, Any]]:
     Returns:
         List of available indexer configurations
     """
-    plugin = plugin_manager.get_plugin(plugin_name)
-    if not plugin:
+    capabilities = plugin_manager.get_capabilities(plugin_name)
+    if capabilities is None:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_name}' not found")
     
-    try:
-        indexers = plugin.get_available_indexers()
-        return indexers
-    except NotImplementedError:
-        return []
+    return capabilities["indexers"]
 
 
 @router.get("/{plugin_name}/clients")
@@ -84,15 +80,11 @@ async def get_available_clients(plugin_name: str) -> List[Dict[str, Any]]:
     Returns:
         List of available client configurations
     """
-    plugin = plugin_manager.get_plugin(plugin_name)
-    if not plugin:
+    capabilities = plugin_manager.get_capabilities(plugin_name)
+    if capabilities is None:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_name}' not found")
     
-    try:
-        clients = plugin.get_available_clients()
-        return clients
-    except NotImplementedError:
-        return []
+    return capabilities["clients"]
 
 
 @router.get("/{plugin_name}/parsers")
@@ -105,15 +97,31 @@ async def get_available_parsers(plugin_name: str) -> List[Dict[str, Any]]:
     Returns:
         List of available parser configurations
     """
-    plugin = plugin_manager.get_plugin(plugin_name)
-    if not plugin:
+    capabilities = plugin_manager.get_capabilities(plugin_name)
+    if capabilities is None:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_name}' not found")
     
+    return capabilities["parsers"]
+
+
+@router.post("/{plugin_name}/reload")
+async def reload_plugin(plugin_name: str) -> Dict[str, str]:
+    """Reload a plugin from disk without restarting the server.
+    
+    Args:
+        plugin_name: Name of the plugin
+        
+    Returns:
+        Dictionary with success message
+    """
     try:
-        parsers = plugin.get_available_parsers()
-        return parsers
-    except NotImplementedError:
-        return []
+        await asyncio.to_thread(plugin_manager.reload_plugin, plugin_name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to reload plugin '{plugin_name}': {e}")
+    
+    return {"status": "success", "message": f"Plugin '{plugin_name}' reloaded successfully."}
 
 
 @router.post("/install")
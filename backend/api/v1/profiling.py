@@ -0,0 +1,98 @@
+"""API endpoints for on-demand profiling of scheduler jobs and routes (see backend.core.profiling)."""
+
+import json
+import secrets
+import uuid
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+
+from backend.core.exceptions import ValidationError
+from backend.core.profiling import MAX_PROFILE_RUNS, profiler
+
+
+def require_profiling_token(x_profiling_token: str | None = Header(default=None)) -> None:
+    """Hide the API unless profiling is enabled, then require the configured token."""
+    if not profiler.enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_profiling_token is None or not secrets.compare_digest(x_profiling_token, profiler.token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+router = APIRouter(prefix="/profiling", tags=["profiling"], dependencies=[Depends(require_profiling_token)])
+
+
+class ProfileRequestCreate(BaseModel):
+    kind: str = Field(description='"job" or "route"')
+    target: str = Field(description='Job ID, or route template such as "/api/v1/series/{series_id}"')
+    count: int = Field(default=1, ge=1, le=MAX_PROFILE_RUNS)
+    collect_sql: bool = True
+
+
+def _describe(request) -> dict[str, Any]:
+    return {
+        "id": str(request.id),
+        "kind": request.kind,
+        "target": request.target,
+        "remaining": request.remaining,
+        "collect_sql": request.collect_sql,
+        "created_at": request.created_at.isoformat(),
+        "captures": [str(capture_id) for capture_id in request.capture_ids],
+    }
+
+
+@router.post("/requests")
+async def create_profile_request(body: ProfileRequestCreate, request: Request) -> dict[str, Any]:
+    """Profile the next `count` runs of a scheduler job or requests to a route."""
+    if body.kind == "route" and body.target not in {
+        getattr(route, "path", None) for route in request.app.routes
+    }:
+        raise ValidationError(f"Unknown route: {body.target}")
+    profile_request = profiler.arm(body.kind, body.target, body.count, body.collect_sql)
+    return {"success": True, "request": _describe(profile_request)}
+
+
+@router.get("/requests")
+async def list_profile_requests() -> dict[str, Any]:
+    """Profiling requests still waiting for runs."""
+    return {"success": True, "requests": [_describe(r) for r in profiler.requests.values()]}
+
+
+@router.delete("/requests/{request_id}")
+async def cancel_profile_request(request_id: uuid.UUID) -> dict[str, Any]:
+    profiler.cancel(request_id)
+    return {"success": True, "message": "Profiling request cancelled"}
+
+
+@router.get("/captures")
+async def list_captures() -> dict[str, Any]:
+    """Finished captures, newest first."""
+    return {
+        "success": True,
+        "captures": [capture.summary() for capture in reversed(profiler.captures.values())],
+    }
+
+
+@router.get("/captures/{capture_id}")
+async def download_capture(capture_id: uuid.UUID, format: str = "summary") -> Any:
+    """
+    Download a capture.
+
+    Args:
+        format: "summary" (top functions and SQL statements as JSON),
+            "pstats" (load with pstats/snakeviz) or "speedscope" (open in speedscope.app)
+    """
+    content, media_type = profiler.export(capture_id, format)
+    if format == "summary":
+        return content
+    if format == "speedscope":
+        filename = f"{capture_id}.speedscope.json"
+        return Response(
+            json.dumps(content, separators=(",", ":")), media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+    return Response(
+        content, media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{capture_id}.prof"'},
+    )
@@ -1,36 +1,123 @@
 import asyncio
-from pathlib import Path
 from typing import Any
-from datetime import datetime
 import uuid
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Query
 from fastapi.responses import FileResponse
-from sqlmodel import Session, select
+from sqlmodel import Session
 
-from backend.core.database.models import Notification
+from backend.core.database.models import Notification, NotificationType, NotificationBulkRequest, Task
 from backend.core.database.database import get_session, db_dir
-from backend.core.backup import backup_database, restore_database, list_backups
+from backend.core.backup import (
+    BackupMode,
+    backup_database,
+    backup_task,
+    list_backups,
+    restore_database,
+    restore_task,
+)
+from backend.core import logging_config
+from backend.core.exceptions import ResourceNotFoundError, ValidationError
+from backend.core.jobs import describe_job, get_job, job_history, run_job_now
+from backend.core.scheduler import schedule_core_jobs, scheduler
+from backend.core.services import notification_service
+from backend.core.tasks import task_manager
+from backend.api.responses import model_response
+from backend.api.v1.utils import _save_upload, MAX_BACKUP_UPLOAD_BYTES
 
 router = APIRouter()
 
-task_progress: dict[str, dict[str, Any]] = {}
+task_manager.register("backup", backup_task, max_concurrent=1)
+# Restores run in a worker process; the stored jobs are carried over, this
+# re-adds any built-in job the restored database is missing
+task_manager.register("restore", restore_task, max_concurrent=1, on_completed=schedule_core_jobs)
 
 @router.get("/system/notifications", response_model=list[Notification])
-async def read_notifications(*, session: Session = Depends(get_session)):
-    notifications = session.exec(select(Notification)).all()
-    return notifications
+async def read_notifications(
+    *,
+    session: Session = Depends(get_session),
+    limit: int = Query(
+        default=notification_service.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=notification_service.MAX_PAGE_SIZE,
+    ),
+    cursor: str | None = None,
+    type: NotificationType | None = None,
+    read: bool | None = None,
+):
+    """
+    Get one page of notifications, newest first.
+
+    When more notifications are available, the cursor for the next page is
+    returned in the ``X-Next-Cursor`` response header.
+    """
+    notifications, next_cursor = notification_service.list_notifications(
+        session, limit=limit, cursor=cursor, type=type, read=read
+    )
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return model_response(list[Notification], notifications, headers=headers)
+
+
+@router.get("/system/notifications/unread-count")
+async def read_unread_notification_count(*, session: Session = Depends(get_session)) -> dict[str, int]:
+    return {"count": notification_service.count_unread(session)}
+
+
+@router.post("/system/notifications/mark-read")
+async def mark_notifications_read(
+    *,
+    session: Session = Depends(get_session),
+    request: NotificationBulkRequest,
+    read: bool = True,
+) -> dict[str, Any]:
+    """
+    Set the read state of all notifications matching the request filters.
+
+    The state to set is the ``read`` query parameter; the body's ``read``
+    filter only applies to delete and is rejected here.
+    """
+    if request.read is not None:
+        raise ValidationError("Filtering by read state is not supported here, use the read query parameter")
+    updated = notification_service.mark_notifications_read(
+        session, read=read, ids=request.ids, before=request.before, type=request.type
+    )
+    return {"success": True, "updated": updated}
+
+
+@router.post("/system/notifications/delete")
+async def delete_notifications(
+    *,
+    session: Session = Depends(get_session),
+    request: NotificationBulkRequest,
+) -> dict[str, Any]:
+    """Delete all notifications matching the request filters (at least one is required)."""
+    deleted = notification_service.delete_notifications(
+        session, ids=request.ids, before=request.before, type=request.type, read=request.read
+    )
+    return {"success": True, "deleted": deleted}
+
+
+def _latest_backup() -> str | None:
+    """Filename of the most recent backup, used as the base of incremental backups."""
+    backups = list_backups()
+    return backups[0]["filename"] if backups else None
 
 
 @router.post("/system/backup")
-async def create_backup() -> dict[str, Any]:
+async def create_backup(
+    mode: BackupMode = BackupMode.EXPORT, incremental: bool = False
+) -> dict[str, Any]:
     """
     Creates a complete backup of the database, configuration, and plugin data.
     
+    ``mode=sqlite`` takes a fast, consistent snapshot of the database file
+    instead of exporting every table. With ``incremental=true`` plugin files
+    unchanged since the latest backup are referenced instead of stored again.
+    
     Returns a downloadable backup file path and metadata.
     """
     try:
-        backup_path = backup_database()
+        backup_path = backup_database(mode=mode, base_backup=_latest_backup() if incremental else None)
         return {
             "success": True,
             "message": "Backup created successfully",
@@ -43,65 +130,28 @@ async def create_backup() -> dict[str, Any]:
 
 
 @router.post("/system/backup/async")
-async def create_backup_async(background_tasks: BackgroundTasks) -> dict[str, Any]:
+async def create_backup_async(
+    mode: BackupMode = BackupMode.EXPORT,
+    incremental: bool = False,
+) -> dict[str, Any]:
     """
-    Creates a backup in the background and allows progress tracking.
+    Creates a backup in a background worker process.
     
-    Returns a task_id that can be used to check progress.
+    Returns a task_id that can be used to check progress. Progress is also
+    pushed over the notifications WebSocket as ``task`` events.
     """
-    task_id = str(uuid.uuid4())
-    
-    task_progress[task_id] = {
-        "status": "pending",
-        "progress": 0,
-        "message": "Backup task queued",
-        "created_at": datetime.now().isoformat(),
-        "completed_at": None,
-        "result": None,
-        "error": None,
-    }
-    
-    background_tasks.add_task(run_backup_task, task_id)
+    task = task_manager.submit(
+        "backup",
+        {"mode": mode.value, "base_backup": _latest_backup() if incremental else None},
+    )
     
     return {
         "success": True,
-        "task_id": task_id,
+        "task_id": str(task.id),
         "message": "Backup task started",
     }
 
 
-def run_backup_task(task_id: str):
-    """Background task to create backup with progress updates."""
-    def update_progress(progress: int, message: str):
-        """Callback to update task progress."""
-        task_progress[task_id]["progress"] = progress
-        task_progress[task_id]["message"] = message
-        if progress > 0:
-            task_progress[task_id]["status"] = "running"
-    
-    try:
-        task_progress[task_id]["status"] = "running"
-        
-        # Call backup_database with progress callback
-        backup_path = backup_database(progress_callback=update_progress)
-        
-        task_progress[task_id]["status"] = "completed"
-        task_progress[task_id]["progress"] = 100
-        task_progress[task_id]["message"] = "Backup completed successfully"
-        task_progress[task_id]["completed_at"] = datetime.now().isoformat()
-        task_progress[task_id]["result"] = {
-            "filename": backup_path.name,
-            "path": str(backup_path),
-            "size": backup_path.stat().st_size,
-        }
-    except Exception as e:
-        task_progress[task_id]["status"] = "failed"
-        task_progress[task_id]["progress"] = 100
-        task_progress[task_id]["message"] = f"Backup failed: {str(e)}"
-        task_progress[task_id]["error"] = str(e)
-        task_progress[task_id]["completed_at"] = datetime.now().isoformat()
-
-
 @router.get("/system/backup/download/{filename}")
 async def download_backup(filename: str) -> FileResponse:
     """
@@ -148,7 +198,8 @@ async def get_backups() -> dict[str, Any]:
 @router.post("/system/restore")
 async def restore_backup(
     file: UploadFile = File(...),
-    overwrite: bool = False
+    overwrite: bool = False,
+    sha256: str | None = None,
 ) -> dict[str, Any]:
     """
     Restores the database from an uploaded backup file.
@@ -156,29 +207,27 @@ async def restore_backup(
     Args:
         file: The backup ZIP file to restore from.
         overwrite: Whether to overwrite existing database (default: False).
+        sha256: Optional checksum of the file; the upload is rejected if it doesn't match.
     
     WARNING: This will replace all current data if overwrite=True.
     """
     if not file.filename or not file.filename.endswith(".zip"):
         raise HTTPException(status_code=400, detail="Backup file must be a ZIP file")
     
-    temp_backup = db_dir / f"temp_restore_{file.filename}"
+    temp_backup = db_dir / f"temp_restore_{uuid.uuid4().hex}.zip"
+    
+    # Stream the uploaded backup to a temporary file on disk so it can be validated and restored.
+    _, checksum = await _save_upload(file, temp_backup, MAX_BACKUP_UPLOAD_BYTES, sha256)
     
     try:
-        # Persist the uploaded backup to a temporary file on disk so it can be validated and restored.
-        with open(temp_backup, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        
         # Perform restoration
-        summary = restore_database(temp_backup, overwrite=overwrite)
-        
-        # Clean up temp file
-        temp_backup.unlink()
+        summary = await asyncio.to_thread(restore_database, temp_backup, overwrite=overwrite)
+        schedule_core_jobs()
         
         return {
             "success": True,
             "message": "Database restored successfully",
+            "sha256": checksum,
             "summary": summary,
         }
     except FileNotFoundError as e:
@@ -186,17 +235,17 @@ async def restore_backup(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        # Clean up temp file on error
-        if temp_backup.exists():
-            temp_backup.unlink()
         raise HTTPException(status_code=500, detail=f"Restoration failed: {str(e)}")
+    finally:
+        # Clean up temp file
+        temp_backup.unlink(missing_ok=True)
 
 
 @router.post("/system/restore/async")
 async def restore_backup_async(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    overwrite: bool = False
+    overwrite: bool = False,
+    sha256: str | None = None,
 ) -> dict[str, Any]:
     """
     Restores the database from an uploaded backup file in the background.
@@ -208,78 +257,33 @@ async def restore_backup_async(
     if not file.filename or not file.filename.endswith(".zip"):
         raise HTTPException(status_code=400, detail="Backup file must be a ZIP file")
     
-    # Save uploaded file
-    temp_backup = db_dir / f"temp_restore_{file.filename}"
-    
-    try:
-        with open(temp_backup, "wb") as f:
-            content = await file.read()
-            f.write(content)
-    except Exception as e:
-        if temp_backup.exists():
-            temp_backup.unlink()
-        raise HTTPException(status_code=500, detail=f"Failed to save upload: {str(e)}")
+    # Save uploaded file, the restore task removes it when done
+    temp_backup = db_dir / f"temp_restore_{uuid.uuid4().hex}.zip"
+    _, checksum = await _save_upload(file, temp_backup, MAX_BACKUP_UPLOAD_BYTES, sha256)
     
-    # Create task
-    task_id = str(uuid.uuid4())
-    
-    task_progress[task_id] = {
-        "status": "pending",
-        "progress": 0,
-        "message": "Restore task queued",
-        "created_at": datetime.now().isoformat(),
-        "completed_at": None,
-        "result": None,
-        "error": None,
-    }
-    
-    background_tasks.add_task(run_restore_task, task_id, temp_backup, overwrite)
+    task = task_manager.submit(
+        "restore", {"backup_file": str(temp_backup), "overwrite": overwrite}
+    )
     
     return {
         "success": True,
-        "task_id": task_id,
+        "task_id": str(task.id),
         "message": "Restore task started",
+        "sha256": checksum,
     }
 
 
-def run_restore_task(task_id: str, backup_file: Path, overwrite: bool):
-    """Background task to restore database with progress updates."""
-    def update_progress(progress: int, message: str):
-        """Callback to update task progress."""
-        task_progress[task_id]["progress"] = progress
-        task_progress[task_id]["message"] = message
-        if progress > 0:
-            task_progress[task_id]["status"] = "running"
-    
-    try:
-        task_progress[task_id]["status"] = "running"
-        
-        # Call restore_database with progress callback
-        summary = restore_database(backup_file, overwrite=overwrite, progress_callback=update_progress)
-        
-        # Clean up temp file
-        if backup_file.exists():
-            backup_file.unlink()
-        
-        task_progress[task_id]["status"] = "completed"
-        task_progress[task_id]["progress"] = 100
-        task_progress[task_id]["message"] = "Restore completed successfully"
-        task_progress[task_id]["completed_at"] = datetime.now().isoformat()
-        task_progress[task_id]["result"] = summary
-    except Exception as e:
-        # Clean up temp file on error
-        if backup_file.exists():
-            backup_file.unlink()
-        
-        task_progress[task_id]["status"] = "failed"
-        task_progress[task_id]["progress"] = 100
-        task_progress[task_id]["message"] = f"Restore failed: {str(e)}"
-        task_progress[task_id]["error"] = str(e)
-        task_progress[task_id]["completed_at"] = datetime.now().isoformat()
+@router.get("/system/tasks", response_model=list[Task])
+async def get_tasks(
+    type: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+):
+    """List background tasks, newest first."""
+    return task_manager.list_tasks(task_type=type, limit=limit)
 
 
 @router.get("/system/task/{task_id}")
-async def get_task_status(task_id: str) -> dict[str, Any]:
+async def get_task_status(task_id: uuid.UUID) -> dict[str, Any]:
     """
     Get the status and progress of a background task.
     
@@ -289,27 +293,35 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
     Returns:
         Task status including progress percentage and current message.
     """
-    if task_id not in task_progress:
-        raise HTTPException(status_code=404, detail="Task not found")
+    return {
+        "success": True,
+        "task": task_manager.get(task_id),
+    }
+
+
+@router.post("/system/task/{task_id}/cancel")
+async def cancel_task(task_id: uuid.UUID) -> dict[str, Any]:
+    """
+    Cancel a background task.
     
+    Pending tasks are cancelled immediately; running tasks stop at their next
+    progress update.
+    """
     return {
         "success": True,
-        "task": task_progress[task_id],
+        "task": task_manager.cancel(task_id),
     }
 
 
 @router.delete("/system/task/{task_id}")
-async def clear_task(task_id: str) -> dict[str, Any]:
+async def clear_task(task_id: uuid.UUID) -> dict[str, Any]:
     """
-    Clear a completed or failed task from memory.
+    Clear a completed, failed or cancelled task.
     
     Args:
         task_id: The task ID to clear.
     """
-    if task_id not in task_progress:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    del task_progress[task_id]
+    task_manager.delete(task_id)
     
     return {
         "success": True,
@@ -336,6 +348,13 @@ async def delete_backup(filename: str) -> dict[str, Any]:
     
     if not backup_path.exists() or not backup_path.name.startswith("backup_"):
         raise HTTPException(status_code=404, detail="Backup file not found")
+
+    dependents = [b["filename"] for b in list_backups() if filename in b["requires"]]
+    if dependents:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Backup {filename} is the base of incremental backup(s): {', '.join(dependents)}",
+        )
     
     try:
         backup_path.unlink()
@@ -345,3 +364,85 @@ async def delete_backup(filename: str) -> dict[str, Any]:
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete backup: {str(e)}")
+
+
+@router.get("/system/logging")
+async def get_logging_levels() -> dict[str, Any]:
+    """Get the root log level and the per-logger overrides."""
+    return {
+        "success": True,
+        "levels": logging_config.get_logger_levels(),
+    }
+
+
+@router.put("/system/logging")
+async def update_logging_levels(levels: dict[str, str | None]) -> dict[str, Any]:
+    """
+    Change log levels at runtime.
+    
+    Args:
+        levels: Logger name -> level name; "root" sets the global level and
+            null removes a logger's override, e.g.
+            {"root": "INFO", "plugins.RanobeDB": "DEBUG", "backend.core.scheduler": null}
+    """
+    try:
+        parsed = {
+            name: None if level is None else logging_config.parse_level(level)
+            for name, level in levels.items()
+        }
+    except ValueError as e:
+        raise ValidationError(str(e))
+    if parsed.get("root", 0) is None:
+        raise ValidationError("The root log level can't be removed")
+
+    for name, level in parsed.items():
+        if name == "root":
+            logging_config.set_log_level(level)
+        else:
+            logging_config.set_logger_level(name, level)
+    return {
+        "success": True,
+        "levels": logging_config.get_logger_levels(),
+    }
+
+
+@router.get("/system/jobs")
+async def list_jobs() -> dict[str, Any]:
+    """Scheduler jobs with their policy, next run and last run."""
+    return {
+        "success": True,
+        "jobs": [describe_job(job) for job in scheduler.get_jobs()],
+    }
+
+
+@router.get("/system/jobs/{job_id}/runs")
+async def list_job_runs(job_id: str) -> dict[str, Any]:
+    """Recent runs of a scheduler job, newest first, with outcome and duration."""
+    if scheduler.get_job(job_id) is None and job_id not in job_history.runs:
+        raise ResourceNotFoundError("Job", job_id)
+    return {
+        "success": True,
+        "runs": [run.to_dict() for run in job_history.get_runs(job_id)],
+    }
+
+
+@router.post("/system/jobs/{job_id}/pause")
+async def pause_job(job_id: str) -> dict[str, Any]:
+    """Stop scheduling a job until it is resumed; persisted jobs stay paused across restarts."""
+    get_job(scheduler, job_id)
+    return {"success": True, "job": describe_job(scheduler.pause_job(job_id))}
+
+
+@router.post("/system/jobs/{job_id}/resume")
+async def resume_job(job_id: str) -> dict[str, Any]:
+    get_job(scheduler, job_id)
+    return {"success": True, "job": describe_job(scheduler.resume_job(job_id))}
+
+
+@router.post("/system/jobs/{job_id}/run")
+async def trigger_job(job_id: str) -> dict[str, Any]:
+    """
+    Run a job now. Progress is pushed to WebSocket clients as "job" events and
+    the outcome is sent as a notification.
+    """
+    return {"success": True, "job": describe_job(run_job_now(scheduler, job_id))}
@@ -1,6 +1,8 @@
 from fastapi import HTTPException, UploadFile
 from sqlmodel import Session
 
+import asyncio
+import hashlib
 import yaml
 import zipfile
 import shutil
@@ -9,6 +11,16 @@ from tempfile import TemporaryDirectory
 from uuid import UUID
 
 from backend.core.database.models import Plugin
+from backend.core.logging_config import get_logger
+from backend.core.services.plugin_service import sync_plugins
+from backend.plugin_manager import plugin_manager
+
+
+logger = get_logger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_BACKUP_UPLOAD_BYTES = 20 * 1024**3
+MAX_PLUGIN_UPLOAD_BYTES = 500 * 1024**2
 
 
 ## TODO: For install/uninstall plugin helpers. Paths for frontend and backend directories don't seem to be correct.
@@ -25,6 +37,59 @@ from backend.core.database.models import Plugin
 #                        |-- <plugin_name>/
 
 
+async def _save_upload(
+    file: UploadFile,
+    destination: Path,
+    max_bytes: int,
+    expected_sha256: str | None = None,
+) -> tuple[int, str]:
+    """
+    Stream an upload to disk in UPLOAD_CHUNK_SIZE chunks, hashing it on the way.
+    File I/O runs in the threadpool so large uploads don't block the event loop.
+
+    The partial file is removed if the upload is too large or doesn't match
+    ``expected_sha256``. Starlette spools the whole request body to a
+    temporary file before the endpoint runs, so ``max_bytes`` bounds what is
+    copied to ``destination``, not what the client may send.
+
+    Returns:
+        The size in bytes and the SHA-256 hex digest of the upload.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        f = await asyncio.to_thread(open, destination, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Upload exceeds the {max_bytes // 1024**2} MB limit",
+                    )
+                digest.update(chunk)
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+    except HTTPException:
+        destination.unlink(missing_ok=True)
+        raise
+    except Exception as e:
+        destination.unlink(missing_ok=True)
+        raise HTTPException(status_code=500, detail="Failed to save uploaded file") from e
+
+    sha256 = digest.hexdigest()
+    if expected_sha256 and sha256 != expected_sha256.lower():
+        destination.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Upload checksum mismatch (expected {expected_sha256}, got {sha256})",
+        )
+
+    logger.info(f"Saved upload '{file.filename}' ({size} bytes, sha256 {sha256})")
+    return size, sha256
+
+
 async def _install_plugin_util(file: UploadFile, session: Session) -> dict[str, str]:
     # Validate .lna structure and manifest.yaml
     # Manage dependencies
@@ -42,17 +107,10 @@ async def _install_plugin_util(file: UploadFile, session: Session) -> dict[str,
     with TemporaryDirectory() as temp_dir:
         # Save uploaded file to temp directory
         temp_path = Path(temp_dir)
-        lna_path = temp_path / file.filename
+        lna_path = temp_path / "upload.lna"
 
         # Save uploaded file
-        try:
-            content = await file.read()
-            with open(lna_path, "wb") as f:
-                f.write(content)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail="Failed to save uploaded file"
-            ) from e
+        await _save_upload(file, lna_path, MAX_PLUGIN_UPLOAD_BYTES)
 
         # Extract .lna (zip) file
         try:
@@ -145,9 +203,24 @@ async def _install_plugin_util(file: UploadFile, session: Session) -> dict[str,
                     status_code=500, detail=f"Failed to install frontend: {str(e)}"
                 )
 
+        # Frontend components are only picked up by a frontend rebuild
+        restart_required = frontend_src.is_dir()
+
+    # Load the backend right away instead of restarting the server
+    message = f"Plugin '{plugin_name}' version {manifest['version']} installed successfully."
+    if plugin_backend_dest.exists():
+        sync_plugins(session, [manifest])
+        try:
+            await asyncio.to_thread(plugin_manager.load_plugin, plugin_name)
+        except Exception as e:
+            logger.error(f"Installed plugin '{plugin_name}' failed to load: {e}", exc_info=True)
+            message = f"Plugin '{plugin_name}' version {manifest['version']} installed, but failed to load: {e}"
+            restart_required = True
+
     return {
         "status": "success",
-        "message": f"Plugin '{plugin_name}' version {manifest['version']} installed successfully.",
+        "message": message,
+        "restart_required": str(restart_required).lower(),
     }
 
 
@@ -171,6 +244,9 @@ async def _uninstall_plugin_util(plugin_id: UUID, session: Session) -> dict[str,
     plugin_backend_path = backend_plugins_dir / plugin_name
     plugin_frontend_path = frontend_plugins_dir / plugin_name
 
+    # Stop the plugin and drop its routes and scheduled jobs before removing its files
+    await asyncio.to_thread(plugin_manager.remove_plugin, plugin_name)
+
     # Remove backend directory
     if plugin_backend_path.exists():
         try:
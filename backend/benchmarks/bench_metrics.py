@@ -0,0 +1,117 @@
+"""
+Benchmark the overhead of the built-in metrics instrumentation.
+
+Serves the same small endpoint (one indexed DB query per request) from two
+apps on separate SQLite databases: one plain, one with ``MetricsMiddleware``
+and ``instrument_engine``. Requests go through the ASGI app directly (no
+network, no TestClient thread hop) so the difference is the instrumentation
+itself. Also times the individual recording primitives and rendering
+``/metrics``.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_metrics --requests 5000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from backend.core.database.models import Series
+from backend.core.metrics import (
+    DB_QUERY_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    REGISTRY,
+    MetricsMiddleware,
+    instrument_engine,
+)
+
+
+def build_app(db_path: Path, instrumented: bool) -> FastAPI:
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+    if instrumented:
+        instrument_engine(engine)
+
+    def get_session():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI()
+
+    @app.get("/series/{title}")
+    async def read_series(title: str, session: Session = Depends(get_session)):
+        return session.exec(select(Series.id).where(Series.title == title)).first()
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _run_requests(app: FastAPI, count: int) -> float:
+    """Median seconds per request over `count` sequential requests."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i in range(100):  # Warm up
+            await client.get(f"/series/warmup-{i}")
+        timings = []
+        for i in range(count):
+            start = time.perf_counter()
+            await client.get(f"/series/title-{i}")
+            timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def _time_op(fn, count: int) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def _timed_block() -> None:
+    with DB_QUERY_DURATION.time():
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = build_app(Path(tmp) / "plain.db", instrumented=False)
+        instrumented = build_app(Path(tmp) / "instrumented.db", instrumented=True)
+        # Alternate runs so both see the same machine conditions
+        results: dict[str, list[float]] = {"plain": [], "instrumented": []}
+        for _ in range(3):
+            results["plain"].append(asyncio.run(_run_requests(plain, args.requests)))
+            results["instrumented"].append(asyncio.run(_run_requests(instrumented, args.requests)))
+
+    plain_us = min(results["plain"]) * 1e6
+    instrumented_us = min(results["instrumented"]) * 1e6
+    print(f"Request (1 query), median of {args.requests}, best of 3:")
+    print(f"  plain          {plain_us:8.1f} us")
+    print(f"  instrumented   {instrumented_us:8.1f} us  (+{instrumented_us - plain_us:.1f} us, "
+          f"{(instrumented_us / plain_us - 1) * 100:+.1f}%)")
+
+    print("\nRecording primitives (mean per call):")
+    counter = HTTP_REQUESTS.labels("GET", "/bench", "200")
+    histogram = HTTP_REQUEST_DURATION.labels("GET", "/bench")
+    print(f"  counter labels().inc()     {_time_op(lambda: HTTP_REQUESTS.labels('GET', '/bench', '200').inc(), 100_000):6.2f} us")
+    print(f"  counter child inc()        {_time_op(counter.inc, 100_000):6.2f} us")
+    print(f"  histogram child observe()  {_time_op(lambda: histogram.observe(0.012), 100_000):6.2f} us")
+    print(f"  histogram time() block     {_time_op(_timed_block, 100_000):6.2f} us")
+    print(f"  render /metrics            {_time_op(REGISTRY.render, 100):6.0f} us")
+
+
+if __name__ == "__main__":
+    main()
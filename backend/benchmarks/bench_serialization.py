@@ -0,0 +1,182 @@
+"""
+Benchmark serialization time and bytes on the wire for the largest list endpoints.
+
+Builds a throwaway SQLite library, mounts the real ``/series``, ``/books``,
+``/releases`` and ``/system/notifications`` routes (fast path:
+``backend.api.responses.model_response``) next to copies using FastAPI's
+default ``response_model`` serialization, and compares:
+
+- server time per request (median) for both paths, plus the encoder alone
+  (stdlib json / orjson / pydantic-core) on already validated models
+- response size uncompressed, gzip and (if installed) brotli, through
+  ``CompressionMiddleware``
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_serialization --series 5000 --books 5
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from statistics import median
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, insert, select
+
+from backend.api.responses import _adapter
+from backend.api.v1 import core, system
+from backend.benchmarks.synthetic import generate_library
+from backend.core import compression
+from backend.core.compression import CompressionMiddleware
+from backend.core.database.database import get_session
+from backend.core.database.models import (
+    Book,
+    BookPublicSimple,
+    Notification,
+    NotificationType,
+    Release,
+    ReleasePublicSimple,
+    Series,
+    SeriesPublicSimple,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+ENDPOINTS = {
+    "/series": (Series, list[SeriesPublicSimple]),
+    "/books": (Book, list[BookPublicSimple]),
+    "/releases": (Release, list[ReleasePublicSimple]),
+    "/system/notifications?limit=500": (Notification, list[Notification]),
+}
+
+
+def generate_releases_and_notifications(engine, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with Session(engine) as session:
+        book_ids = session.exec(select(Book.id)).all()
+        releases = [
+            {
+                "id": uuid.uuid4(),
+                "title": f"Release {i}",
+                "url": f"https://example.org/releases/{i}",
+                "format": rng.choice(["EPUB", "PDF", "Web"]),
+                "links": [{"name": "mirror", "url": f"https://mirror.example.org/{i}"}],
+                "book_id": book_id,
+            }
+            for i, book_id in enumerate(book_ids)
+        ]
+        for start in range(0, len(releases), 5000):
+            session.execute(insert(Release), releases[start:start + 5000])
+        session.execute(insert(Notification), [
+            {
+                "id": uuid.uuid4(),
+                "message": f"{rng.randint(1, 40)} new releases added to 'Series {i}'.",
+                "type": rng.choice(list(NotificationType)),
+            }
+            for i in range(500)
+        ])
+        session.commit()
+
+
+def build_app(engine) -> FastAPI:
+    """The real routes plus default-serialization copies under /baseline."""
+
+    def bench_session():
+        with Session(engine) as session:
+            yield session
+
+    def list_endpoint(table):
+        def endpoint(session: Session = Depends(get_session), limit: int = 0):
+            statement = select(table)
+            if limit:
+                statement = statement.order_by(table.timestamp.desc(), table.id.desc()).limit(limit)
+            return session.exec(statement).all()
+        return endpoint
+
+    baseline = APIRouter(prefix="/baseline")
+    for path, (table, model_type) in ENDPOINTS.items():
+        baseline.add_api_route(path.split("?")[0], list_endpoint(table), response_model=model_type)
+
+    app = FastAPI()
+    app.include_router(core.router, prefix="/api/v1")
+    app.include_router(system.router, prefix="/api/v1")
+    app.include_router(baseline, prefix="/api/v1")
+    app.add_middleware(CompressionMiddleware)
+    app.dependency_overrides[get_session] = bench_session
+    return app
+
+
+def _time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return median(timings) * 1000
+
+
+def _encoders(engine, table, model_type, repeat: int) -> dict[str, float]:
+    """Encoder-only timings on already validated models."""
+    adapter = _adapter(model_type)
+    with Session(engine) as session:
+        models = adapter.validate_python(session.exec(select(table)).all(), from_attributes=True)
+    timings = {
+        "json": _time(lambda: json.dumps(adapter.dump_python(models, mode="json")).encode(), repeat),
+        "pydantic-core": _time(lambda: adapter.dump_json(models), repeat),
+    }
+    if orjson is not None:
+        timings["orjson"] = _time(lambda: orjson.dumps(adapter.dump_python(models, mode="json")), repeat)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=5_000)
+    parser.add_argument("--books", type=int, default=5, help="Books per series")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        generate_library(engine, args.series, args.books)
+        generate_releases_and_notifications(engine)
+        client = TestClient(build_app(engine))
+
+        print(f"{'endpoint':<34}{'default (ms)':>13}{'fast (ms)':>11}{'speedup':>9}"
+              f"{'raw (KB)':>11}{'gzip (KB)':>11}{'br (KB)':>9}")
+        for path in ENDPOINTS:
+            fast_url, baseline_url = f"/api/v1{path}", f"/api/v1/baseline{path}"
+            identity = {"Accept-Encoding": "identity"}
+
+            fast = client.get(fast_url, headers=identity)
+            default = client.get(baseline_url, headers=identity)
+            assert fast.json() == default.json(), f"{path}: fast path output differs"
+
+            default_ms = _time(lambda: client.get(baseline_url, headers=identity), args.repeat)
+            fast_ms = _time(lambda: client.get(fast_url, headers=identity), args.repeat)
+            sizes = {
+                encoding: int(client.get(fast_url, headers={"Accept-Encoding": encoding}).headers["content-length"])
+                for encoding in ("identity", "gzip", "br")
+            }
+            br = f"{sizes['br'] / 1024:>9.0f}" if compression.brotli is not None else f"{'n/a':>9}"
+            print(f"{path:<34}{default_ms:>13.1f}{fast_ms:>11.1f}{default_ms / fast_ms:>8.1f}x"
+                  f"{sizes['identity'] / 1024:>11.0f}{sizes['gzip'] / 1024:>11.0f}{br}")
+
+        print("\nEncoder only, validated models (ms):")
+        for path, (table, model_type) in ENDPOINTS.items():
+            timings = _encoders(engine, table, model_type, args.repeat)
+            print(f"  {path:<32}" + "  ".join(f"{name} {ms:.1f}" for name, ms in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
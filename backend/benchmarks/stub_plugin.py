@@ -0,0 +1,244 @@
+"""
+Local stand-in for metadata, indexer and download client plugins.
+
+Serves the synthetic library from ``backend.benchmarks.synthetic`` with a
+configurable artificial latency per call instead of network I/O, so
+benchmarks measure the app's own work (merging, status updates, pipeline
+bookkeeping) plus a known, constant plugin cost.
+
+``register_stub_plugin`` starts the plugin through the plugin manager and
+creates its database rows, exactly like a bundled plugin at startup.
+``match_feed_results`` is a pipeline stage that matches every indexer result,
+in place of the title parser.
+"""
+
+import asyncio
+import sys
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from backend.benchmarks.synthetic import series_data, series_index
+from backend.core.database.models import (
+    MetadataSource,
+    SeriesDetailsResponse,
+    SeriesSearchResponse,
+)
+from backend.core.plugins.base import BasePlugin
+from backend.core.plugins.download_client import DownloadClientPlugin
+from backend.core.plugins.indexer import IndexerPlugin
+from backend.core.plugins.metadata import MetadataPlugin, SeriesFetchModel
+from backend.core.services.plugin_service import reconcile_plugin_services, sync_plugins
+from backend.plugin_manager import plugin_manager
+
+
+STUB_PLUGIN_NAME = "BenchStub"
+MANIFEST = {
+    "name": STUB_PLUGIN_NAME,
+    "version": "0.0.1",
+    "description": "Synthetic metadata, indexer and download client for benchmarks",
+    "author": "benchmarks",
+    "entry_point": "stub_plugin:StubPlugin",
+    "dependencies": [],
+}
+
+
+@dataclass
+class StubSettings:
+    latency: float = 0.05  # Seconds per plugin call
+    books_per_series: int = 10
+    releases_per_book: int = 2
+    num_series: int = 1000  # Size of the library, for searches and the indexer feed
+    feed_size: int = 100
+    seed: int = 0
+
+
+class StubMetadata(MetadataPlugin):
+    name = STUB_PLUGIN_NAME
+    version = MANIFEST["version"]
+    settings: StubSettings
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def _data(self, index: int) -> dict[str, Any]:
+        s = self.settings
+        return series_data(index, s.books_per_series, s.releases_per_book, s.seed)
+
+    async def search_series(self, query: str) -> list[SeriesSearchResponse]:
+        await asyncio.sleep(self.settings.latency)
+        query = query.lower()
+        results = []
+        for index in range(self.settings.num_series):
+            series = self._data(index)["series"]
+            if query in series["title"].lower():
+                results.append(SeriesSearchResponse(
+                    external_id=series["external_id"],
+                    title=series["title"],
+                    volumes=self.settings.books_per_series,
+                    language=series["language"],
+                ))
+                if len(results) == 20:
+                    break
+        return results
+
+    async def get_series_by_id(self, external_id: str) -> SeriesDetailsResponse | None:
+        await asyncio.sleep(self.settings.latency)
+        series = self._data(series_index(external_id))["series"]
+        return SeriesDetailsResponse(**series)
+
+    async def fetch_series(self, external_id: str) -> SeriesFetchModel | None:
+        await asyncio.sleep(self.settings.latency)
+        data = self._data(series_index(external_id))
+        # Ignored and set by the caller, like in real metadata plugins
+        data["series"].update(source_id=None, group_id=None)
+        for book in data["books"]:
+            book["book"]["series_id"] = uuid4()
+        return SeriesFetchModel.model_validate(data)
+
+
+class StubIndexer(IndexerPlugin):
+    name = STUB_PLUGIN_NAME
+    version = MANIFEST["version"]
+    settings: StubSettings
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    async def connect(self) -> bool:
+        await asyncio.sleep(self.settings.latency)
+        return True
+
+    def _result(self, item: int) -> dict:
+        s = self.settings
+        index = item % s.num_series
+        volume = item // s.num_series % max(s.books_per_series, 1) + 1
+        title = series_data(index, 0, 0, s.seed)["series"]["title"]
+        info_hash = f"{item:040x}"
+        return {
+            "title": f"{title} Vol. {volume} (EPUB)",
+            "download_url": f"https://indexer.example.org/{info_hash}.torrent",
+            "link": f"magnet:?xt=urn:btih:{info_hash}",
+            "size": 5_000_000 + item,
+            "seeders": item % 50,
+        }
+
+    async def search(self, query: str) -> list[dict]:
+        await asyncio.sleep(self.settings.latency)
+        query = query.lower()
+        return [
+            result for result in map(self._result, range(self.settings.feed_size))
+            if query in result["title"].lower()
+        ]
+
+    async def get_feed(self) -> list[dict]:
+        await asyncio.sleep(self.settings.latency)
+        return [self._result(item) for item in range(self.settings.feed_size)]
+
+
+class StubDownloadClient(DownloadClientPlugin):
+    name = STUB_PLUGIN_NAME
+    version = MANIFEST["version"]
+    settings: StubSettings
+    downloads: dict[str, dict]
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    async def download(
+        self,
+        info_hash: str | None = None,
+        magnet_link: str | None = None,
+        torrent_file: str | None = None,
+    ) -> bool:
+        await asyncio.sleep(self.settings.latency)
+        key = info_hash or magnet_link or torrent_file
+        if not key:
+            return False
+        self.downloads[key] = {"hash": key, "state": "downloading", "progress": 0.0}
+        return True
+
+    async def test_connection(self) -> dict:
+        await asyncio.sleep(self.settings.latency)
+        return {"connected": True}
+
+    async def get_all_downloads(self) -> list[dict]:
+        await asyncio.sleep(self.settings.latency)
+        return list(self.downloads.values())
+
+    async def remove_download(self, info_hash: str, delete_data: bool = False) -> bool:
+        await asyncio.sleep(self.settings.latency)
+        return self.downloads.pop(info_hash, None) is not None
+
+
+class StubPlugin(BasePlugin):
+    name = STUB_PLUGIN_NAME
+    version = MANIFEST["version"]
+    description = MANIFEST["description"]
+
+    def start(self) -> None:
+        self.settings = StubSettings()
+        # Shared by all client instances, like a real client's torrent list
+        self.downloads: dict[str, dict] = {}
+
+    def stop(self) -> None:
+        pass
+
+    def get_available_sources(self) -> list[dict[str, Any]]:
+        return [{"name": "Bench Source", "description": "Synthetic library", "config_schema": {}}]
+
+    def get_available_indexers(self) -> list[dict[str, Any]]:
+        return [{"name": "Bench Indexer", "description": "Synthetic feed", "config_schema": {}}]
+
+    def get_available_clients(self) -> list[dict[str, Any]]:
+        return [{"name": "Bench Client", "description": "Accepts every download", "config_schema": {}}]
+
+    def create_metadata_source(self, config: dict[str, Any]) -> MetadataPlugin:
+        return StubMetadata(settings=self.settings, **config)
+
+    def create_indexer(self, config: dict[str, Any]) -> IndexerPlugin:
+        return StubIndexer(settings=self.settings, **config)
+
+    def create_download_client(self, config: dict[str, Any]) -> DownloadClientPlugin:
+        return StubDownloadClient(settings=self.settings, downloads=self.downloads, **config)
+
+
+async def match_feed_results(data: dict) -> dict:
+    """
+    Pipeline stage standing in for the title parser, which doesn't match
+    anything yet: every indexer result counts as parsed, so the download
+    client stage sends all of them.
+    """
+    data["parsed_results"] = {
+        result["title"]: {"series": result["title"].rsplit(" Vol. ", 1)[0]}
+        for result in data.get("indexer_results", [])
+    }
+    return data
+
+
+def register_stub_plugin(session: Session, settings: StubSettings) -> MetadataSource:
+    """
+    Start the stub plugin and register its services.
+
+    Returns:
+        The stub's metadata source row
+    """
+    instance: StubPlugin = plugin_manager.start_plugin(STUB_PLUGIN_NAME, MANIFEST, sys.modules[__name__])
+    instance.settings = settings
+    plugins = sync_plugins(session, [MANIFEST])
+    reconcile_plugin_services(session, [(plugins[STUB_PLUGIN_NAME], instance)])
+    return next(
+        source for source in plugins[STUB_PLUGIN_NAME].metadata_sources
+        if source.name == "Bench Source"
+    )
@@ -0,0 +1,279 @@
+"""
+End-to-end benchmark suite on a synthetic library.
+
+Builds a throwaway database (N series x M books x K releases, see
+``backend.benchmarks.synthetic``), registers the stub plugin from
+``backend.benchmarks.stub_plugin`` as metadata source, indexer and download
+client, and times the real code paths against it:
+
+- fetch_series for a new series and for an existing one (merge)
+- the scheduled refresh of every series
+- download status: the per-series ORM walk and the aggregate SQL recompute
+- list endpoints, through the ASGI app with compression
+- backup (export and snapshot) and restore
+- one run of the AutomatedPipeline: indexer feed, parsing, and sending every
+  feed item to the stub download client (the title parser doesn't match
+  anything yet, so the stub's ``match_feed_results`` stage fills in)
+
+Every benchmark records wall time and the number of DB queries per run.
+Results can be written as JSON and compared against an earlier run; the
+comparison exits non-zero if any benchmark got slower than the threshold.
+
+The database and plugin data live in a temporary directory (DATABASE_DIR,
+PLUGIN_DATA_DIR), which is why backend modules are imported only once those
+are set.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.suite --series 1000 --books 10 --releases 2 \\
+        --latency-ms 20 --output before.json
+    python -m backend.benchmarks.suite --series 1000 --books 10 --releases 2 \\
+        --latency-ms 20 --output after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+
+
+REGRESSION_THRESHOLD = 0.10  # Fraction slower than the baseline that counts as a regression
+LIST_ENDPOINTS = (
+    "/api/v1/series",
+    "/api/v1/books",
+    "/api/v1/releases",
+    "/api/v1/series-groups",
+    "/api/v1/library/search?q=dragon",
+)
+
+
+class Recorder:
+    """Times benchmark runs and counts the DB queries each one executes."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.results: dict[str, dict] = {}
+        self._queries = 0
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _count(*args):
+            self._queries += 1
+
+    async def measure(self, name: str, fn, repeat: int) -> None:
+        """Run ``fn(run_index)`` (sync or async) ``repeat`` times."""
+        timings, queries = [], []
+        for run in range(repeat):
+            self._queries = 0
+            start = time.perf_counter()
+            result = fn(run)
+            if inspect.isawaitable(result):
+                await result
+            timings.append(time.perf_counter() - start)
+            queries.append(self._queries)
+        self.results[name] = {
+            "median": median(timings),
+            "min": min(timings),
+            "max": max(timings),
+            "queries": median(queries),
+            "runs": timings,
+        }
+        print(f"  {name:<34} {median(timings) * 1000:10.1f} ms  {median(queries):8.0f} queries")
+
+
+async def run_suite(args, workdir: Path) -> dict[str, dict]:
+    import httpx
+    from fastapi import FastAPI
+    from sqlmodel import Session, select
+
+    from backend.api.v1 import core
+    from backend.benchmarks.stub_plugin import StubSettings, match_feed_results, register_stub_plugin
+    from backend.benchmarks.synthetic import generate_library, series_external_id
+    from backend.core import backup, scheduler
+    from backend.core.compression import CompressionMiddleware
+    from backend.core.database.database import engine, init_db
+    from backend.core.database.models import Series
+    from backend.core.notifications import notification_manager
+    from backend.core.services import metadata_service
+    from backend.core.services.library_service import (
+        _update_download_status,
+        recompute_download_statuses,
+    )
+    from backend.core.services.pipeline.stage import Stage
+    from backend.plugins.AutomatedPipeline.automated_pipe import AutomatedPipe
+
+    init_db()
+    settings = StubSettings(
+        latency=args.latency_ms / 1000,
+        books_per_series=args.books,
+        releases_per_book=args.releases,
+        num_series=args.series,
+        feed_size=args.feed_size,
+        seed=args.seed,
+    )
+    with Session(engine) as session:
+        source_id = register_stub_plugin(session, settings).id
+
+    recorder = Recorder(engine)
+    print(f"Library: {args.series} series x {args.books} books x {args.releases} releases, "
+          f"plugin latency {args.latency_ms} ms")
+
+    await recorder.measure(
+        "generate_library",
+        lambda run: generate_library(
+            engine, args.series, args.books, args.releases, source_id=source_id, seed=args.seed
+        ),
+        repeat=1,
+    )
+
+    async def fetch(index: int) -> None:
+        with Session(engine) as session:
+            await metadata_service.fetch_series(
+                str(source_id), series_external_id(index), session=session
+            )
+
+    # Series past the generated library are new, the others get merged
+    await recorder.measure("fetch_series.new", lambda run: fetch(args.series + run), args.repeat)
+    step = max(args.series // args.repeat, 1)
+    await recorder.measure("fetch_series.merge", lambda run: fetch(run * step % args.series), args.repeat)
+    await recorder.measure(
+        "refresh_all_series", lambda run: scheduler.update_all_series_metadata(), args.heavy_repeat
+    )
+
+    def per_series_status(run: int) -> None:
+        with Session(engine) as session:
+            for series in session.exec(select(Series)).all():
+                _update_download_status(session, series)
+            session.commit()
+
+    def recompute_status(run: int) -> None:
+        with Session(engine) as session:
+            recompute_download_statuses(session)
+            session.commit()
+
+    await recorder.measure("download_status.per_series", per_series_status, args.heavy_repeat)
+    await recorder.measure("download_status.recompute", recompute_status, args.repeat)
+
+    app = FastAPI()
+    app.include_router(core.router, prefix="/api/v1")
+    app.add_middleware(CompressionMiddleware)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for path in LIST_ENDPOINTS:
+            async def get(run: int, path=path) -> None:
+                response = await client.get(path)
+                response.raise_for_status()
+            await recorder.measure(f"GET {path}", get, args.repeat)
+
+    pipeline = AutomatedPipe()
+    pipeline.on_parsed_results(Stage("match_feed_results", match_feed_results))
+
+    async def run_pipeline(run: int) -> None:
+        data = await pipeline.execute({})
+        if len(data["sent_items"]) != args.feed_size:
+            raise RuntimeError(f"Pipeline sent {len(data['sent_items'])} of {args.feed_size} feed items")
+
+    await recorder.measure("automated_pipeline", run_pipeline, args.repeat)
+
+    backups = workdir / "backups"
+    for mode in backup.BackupMode:
+        await recorder.measure(
+            f"backup.{mode.name.lower()}",
+            lambda run, mode=mode: backup.backup_database(backups / f"{mode.value}-{run}.zip", mode=mode),
+            args.heavy_repeat,
+        )
+        recorder.results[f"backup.{mode.name.lower()}"]["bytes"] = (backups / f"{mode.value}-0.zip").stat().st_size
+    for mode in backup.BackupMode:
+        await recorder.measure(
+            f"restore.{mode.name.lower()}",
+            lambda run, mode=mode: backup.restore_database(backups / f"{mode.value}-0.zip", overwrite=True),
+            args.heavy_repeat,
+        )
+
+    await notification_manager.shutdown()
+    return recorder.results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Print the change of every benchmark against a baseline run; returns the regressed names."""
+    regressions = []
+    print(f"\nCompared to baseline (regression threshold {threshold:.0%}):")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"  {name:<34} (new)")
+            continue
+        before, after = baseline[name]["median"], result["median"]
+        change = after / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"  {name:<34} {before * 1000:10.1f} -> {after * 1000:10.1f} ms  {change:+7.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=1_000)
+    parser.add_argument("--books", type=int, default=10, help="Books per series")
+    parser.add_argument("--releases", type=int, default=2, help="Releases per book")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Artificial latency of every plugin call")
+    parser.add_argument("--feed-size", type=int, default=100, help="Items in the stub indexer feed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs of the fast benchmarks")
+    parser.add_argument("--heavy-repeat", type=int, default=1,
+                        help="Runs of whole-library benchmarks (refresh, backup, restore)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    if "backend.core.database.database" in sys.modules:
+        raise RuntimeError("The database module must not be imported before the suite sets DATABASE_DIR")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        os.environ["DATABASE_DIR"] = str(workdir)
+        os.environ["PLUGIN_DATA_DIR"] = str(workdir / "plugin-data")
+        results = asyncio.run(run_suite(args, workdir))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["meta"]["args"]["series"] != args.series:
+            print("Warning: the baseline was run on a different library size")
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Synthetic libraries for benchmarks: N series x M books x K releases.
+
+Every series is derived deterministically from its index, so the rows
+bulk-inserted by ``generate_library`` are exactly what the stub metadata
+source (``backend.benchmarks.stub_plugin``) returns for the same external
+ID. Refreshing a generated library therefore exercises the real merge path
+(every series, book and release already exists) without any network access.
+"""
+
+import random
+import uuid
+from datetime import date, timedelta
+from typing import Any
+
+from sqlmodel import Session, insert
+
+from backend.core.database.models import Book, LanguageCode, PublishingStatus, Release, Series, SeriesGroup
+
+
+WORDS = (
+    "sword magic tower dragon academy princess demon lord hero villainess "
+    "reincarnated otherworld slime kingdom alchemist saint witch knight "
+    "spirit contract guild adventurer dungeon cafe butler maid apothecary"
+).split()
+
+# Release dates are spread around today, so some books are unreleased
+RELEASE_SPREAD_DAYS = 5 * 365
+INSERT_BATCH_SERIES = 1000
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(3, 6)))
+
+
+def series_external_id(index: int) -> str:
+    return f"bench-{index}"
+
+
+def series_index(external_id: str) -> int:
+    return int(external_id.removeprefix("bench-"))
+
+
+def series_data(index: int, books_per_series: int, releases_per_book: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Field values of one synthetic series, its books and their releases.
+
+    Returns:
+        {"series": {...}, "books": [{"book": {...}, "releases": [{...}]}]},
+        the shape of SeriesFetchModel
+    """
+    rng = random.Random(f"{seed}:{index}")
+    external_id = series_external_id(index)
+    title = _title(rng)
+    authors = [f"Author {rng.randint(1, 5000)}"]
+    today = date.today()
+    first_release = today - timedelta(days=rng.randint(0, RELEASE_SPREAD_DAYS))
+    interval = rng.randint(60, 240)
+
+    books = []
+    for volume in range(1, books_per_series + 1):
+        release_date = first_release + timedelta(days=interval * (volume - 1))
+        book_id = f"{external_id}-{volume}"
+        books.append({
+            "book": {
+                "external_id": book_id,
+                "title": f"{title} Vol. {volume}",
+                "authors": authors,
+                "language": LanguageCode.EN,
+                "release_date": release_date,
+                "sort_order": volume,
+            },
+            "releases": [
+                {
+                    "external_id": f"{book_id}-{number}",
+                    "title": f"{title} Vol. {volume} ({'EPUB' if number % 2 else 'Print'})",
+                    "url": f"https://example.org/{book_id}/{number}",
+                    "format": "EPUB" if number % 2 else "Print",
+                    "language": LanguageCode.EN,
+                    # English editions follow the original by a few months
+                    "release_date": release_date + timedelta(days=90 + 7 * number),
+                }
+                for number in range(1, releases_per_book + 1)
+            ],
+        })
+
+    return {
+        "series": {
+            "external_id": external_id,
+            "title": title,
+            "romaji": title.lower(),
+            "aliases": [_title(rng)],
+            "authors": authors,
+            "publishers": [f"Publisher {rng.randint(1, 200)}"],
+            "tags": rng.sample(WORDS, 3),
+            "language": LanguageCode.JA,
+            "publishing_status": rng.choice(list(PublishingStatus)),
+        },
+        "books": books,
+    }
+
+
+def generate_library(
+    engine,
+    num_series: int,
+    books_per_series: int,
+    releases_per_book: int = 0,
+    source_id: uuid.UUID | None = None,
+    seed: int = 0,
+) -> None:
+    """Insert a synthetic library using Core bulk inserts."""
+    with Session(engine) as session:
+        for start in range(0, num_series, INSERT_BATCH_SERIES):
+            groups, series_rows, book_rows, release_rows = [], [], [], []
+            for index in range(start, min(start + INSERT_BATCH_SERIES, num_series)):
+                data = series_data(index, books_per_series, releases_per_book, seed)
+                group_id, series_id = uuid.uuid4(), uuid.uuid4()
+                groups.append({"id": group_id, "title": data["series"]["title"], "main_series_id": str(series_id)})
+                series_rows.append({
+                    **data["series"],
+                    "id": series_id,
+                    "group_id": group_id,
+                    "source_id": source_id,
+                })
+                for book in data["books"]:
+                    book_id = uuid.uuid4()
+                    book_rows.append({**book["book"], "id": book_id, "series_id": series_id})
+                    release_rows.extend(
+                        {**release, "id": uuid.uuid4(), "book_id": book_id}
+                        for release in book["releases"]
+                    )
+            session.execute(insert(SeriesGroup), groups)
+            session.execute(insert(Series), series_rows)
+            if book_rows:
+                session.execute(insert(Book), book_rows)
+            if release_rows:
+                session.execute(insert(Release), release_rows)
+        session.commit()
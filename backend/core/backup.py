@@ -1,14 +1,21 @@
 import json
 import zipfile
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+import hashlib
 import shutil
-from sqlmodel import Session, select
-from .database.database import engine, db_dir
+import sqlite3
+import uuid
+from sqlalchemy import inspect
+from sqlmodel import Session, SQLModel, create_engine, select, func, Date, DateTime, Enum as SAEnum, Uuid
+from .database.database import engine, db_dir, init_db
+from .database.search import drop_search_index, is_search_supported
 from .database.models import (
     Collection,
+    CollectionSeriesGroupLink,
     SeriesGroup,
     Series,
     Book,
@@ -17,21 +24,74 @@ from .database.models import (
     MetadataSource,
     Indexer,
     DownloadClient,
+    Parser,
     Plugin,
     Notification,
+    Task,
 )
+from .services.library_service import recompute_download_statuses
+from .exceptions import TaskCancelledError
+from .jobs import JOB_METADATA
 from .logging_config import get_logger
 
 
 logger = get_logger(__name__)
 
-BACKUP_VERSION = "1.0"
+BACKUP_VERSION = "2.0"
+# 1.0: single database.json document, 2.0: one NDJSON entry per table
+SUPPORTED_BACKUP_VERSIONS = {"1.0", "2.0"}
+
+# Rows fetched from the database and written to the archive per batch
+EXPORT_BATCH_SIZE = 1000
+# Rows inserted per executemany() call during restore
+RESTORE_BATCH_SIZE = 1000
+# Database pages copied per step of a snapshot backup (the read lock is released in between)
+SNAPSHOT_PAGES_PER_STEP = 1024
+# Restarts caused by concurrent writes before falling back to a single-step copy
+SNAPSHOT_MAX_RESTARTS = 3
+SNAPSHOT_ENTRY_NAME = "database/lnauto.db"
+MANIFEST_ENTRY_NAME = "manifest.json"
+FILE_CHUNK_SIZE = 1024 * 1024
+
+# Formats that don't shrink further, stored with ZIP_STORED
+ALREADY_COMPRESSED_SUFFIXES = {
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".br", ".zst",
+    ".epub", ".cbz", ".pdf", ".mp3", ".mp4", ".mkv",
+}
+
+
+class BackupMode(str, Enum):
+    EXPORT = "ndjson"  # Portable per-table NDJSON export
+    SNAPSHOT = "sqlite"  # Page-level copy of the SQLite database file
+
+# Export/restore order (parents before children, for foreign keys)
+TABLE_MODELS = [
+    ("plugins", Plugin),
+    ("metadata_sources", MetadataSource),
+    ("indexers", Indexer),
+    ("download_clients", DownloadClient),
+    ("parsers", Parser),
+    ("collections", Collection),
+    ("series_groups", SeriesGroup),
+    ("collection_series_groups", CollectionSeriesGroupLink),
+    ("series", Series),
+    ("books", Book),
+    ("chapters", Chapter),
+    ("releases", Release),
+    ("notifications", Notification),
+]
 
 # Type for progress callback function
 from typing import Callable
 ProgressCallback = Callable[[int, str], None]
 
 
+def table_entry_name(table_name: str) -> str:
+    """Archive entry holding a table's rows in a 2.0 backup."""
+    return f"database/{table_name}.ndjson"
+
+
 def serialize_model(obj: Any) -> dict | None:
     """Convert SQLModel instance to JSON-serializable dict."""
     if obj is None:
@@ -45,17 +105,423 @@ def serialize_model(obj: Any) -> dict | None:
     return data
 
 
+def _json_default(value: Any) -> Any:
+    """Encode column values the same way model_dump(mode="json") does."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _iter_table_batches(session: Session, model_class: Any) -> Iterator[list[dict]]:
+    """Stream a table's rows as lists of column dicts, EXPORT_BATCH_SIZE at a time."""
+    table = model_class.__table__
+    result = session.connection().execution_options(yield_per=EXPORT_BATCH_SIZE).execute(
+        table.select()
+    )
+    for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+
+def _iter_ndjson_records(zipf: zipfile.ZipFile, entry_name: str) -> Iterator[dict]:
+    """Yield records from an NDJSON archive entry without reading it into memory."""
+    with zipf.open(entry_name) as entry:
+        for line in entry:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _column_converters(model_class: Any) -> dict[str, Callable[[Any], Any]]:
+    """Per-column parsers turning JSON values back into the types the column binds."""
+    converters: dict[str, Callable[[Any], Any]] = {}
+    for column in model_class.__table__.columns:
+        column_type = column.type
+        if isinstance(column_type, Uuid):
+            converters[column.name] = lambda v: v if isinstance(v, uuid.UUID) else uuid.UUID(v)
+        elif isinstance(column_type, DateTime):
+            converters[column.name] = datetime.fromisoformat
+        elif isinstance(column_type, Date):
+            converters[column.name] = date.fromisoformat
+        elif isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+            converters[column.name] = column_type.enum_class
+    return converters
+
+
+def _record_to_row(
+    record: dict,
+    columns: list[str],
+    converters: dict[str, Callable[[Any], Any]],
+    model_class: Any,
+) -> dict:
+    """
+    Build an insert parameter dict from a backup record.
+
+    Unknown keys (dropped columns) are ignored and missing ones (columns added
+    since the backup was taken) get the model's default.
+    """
+    row = {}
+    for name in columns:
+        if name in record:
+            value = record[name]
+            if value is not None and name in converters:
+                value = converters[name](value)
+        else:
+            value = model_class.model_fields[name].get_default(call_default_factory=True)
+        row[name] = value
+    return row
+
+
+def _bulk_insert_table(
+    conn: Any,
+    model_class: Any,
+    records: Iterator[dict],
+    on_batch: Callable[[int], None],
+) -> int:
+    """Insert records into a model's table with executemany() in RESTORE_BATCH_SIZE batches."""
+    table = model_class.__table__
+    columns = [column.name for column in table.columns]
+    converters = _column_converters(model_class)
+    statement = table.insert()
+
+    count = 0
+    batch: list[dict] = []
+    for record in records:
+        batch.append(_record_to_row(record, columns, converters, model_class))
+        if len(batch) >= RESTORE_BATCH_SIZE:
+            conn.execute(statement, batch)
+            count += len(batch)
+            on_batch(len(batch))
+            batch = []
+    if batch:
+        conn.execute(statement, batch)
+        count += len(batch)
+        on_batch(len(batch))
+    return count
+
+
+def _prepare_bulk_load() -> None:
+    """
+    Recreate empty tables without secondary indexes or search triggers.
+
+    Indexes and the search index are rebuilt once by init_db() after the load,
+    which is much cheaper than maintaining them row by row.
+    """
+    # The task table tracks the running restore itself and is left alone
+    tables = [t for t in SQLModel.metadata.sorted_tables if t.name != Task.__tablename__]
+    SQLModel.metadata.drop_all(engine, tables=tables)
+    SQLModel.metadata.create_all(engine, tables=tables)
+    with engine.begin() as conn:
+        for table in tables:
+            for index in table.indexes:
+                index.drop(conn, checkfirst=True)
+        if is_search_supported(engine):
+            drop_search_index(conn)
+
+
+def _count_rows(session: Session) -> dict[str, int]:
+    return {
+        table_name: session.exec(select(func.count()).select_from(model_class)).one()
+        for table_name, model_class in TABLE_MODELS
+    }
+
+
+def _write_database_export(zipf: zipfile.ZipFile, report_progress: ProgressCallback) -> dict[str, int]:
+    """Stream every table into the archive as NDJSON. Returns the row count per table."""
+    # Backup database tables
+    report_progress(10, "Exporting database tables...")
+    row_counts: dict[str, int] = {}
+    with Session(engine) as session:
+        expected_rows = _count_rows(session)
+        total_rows = max(1, sum(expected_rows.values()))
+        exported_rows = 0
+
+        # Each table is streamed in batches straight into its own archive entry
+        for table_name, model_class in TABLE_MODELS:
+            row_counts[table_name] = 0
+            with zipf.open(table_entry_name(table_name), "w", force_zip64=True) as entry:
+                for batch in _iter_table_batches(session, model_class):
+                    entry.write(
+                        "".join(
+                            json.dumps(row, default=_json_default, separators=(",", ":")) + "\n"
+                            for row in batch
+                        ).encode("utf-8")
+                    )
+                    row_counts[table_name] += len(batch)
+                    exported_rows += len(batch)
+                    progress = 10 + int(min(1, exported_rows / total_rows) * 50)  # 10-60%
+                    report_progress(
+                        progress,
+                        f"Exporting {table_name} ({row_counts[table_name]}/{expected_rows[table_name]})...",
+                    )
+    return row_counts
+
+
+class _SnapshotRestarted(Exception):
+    pass
+
+
+def _copy_database(
+    raw_connection: Any,
+    target_path: Path,
+    pages: int,
+    progress: Callable[[int, int, int], None] | None,
+) -> None:
+    target = sqlite3.connect(target_path)
+    try:
+        raw_connection.driver_connection.backup(target, pages=pages, progress=progress, sleep=0)
+    finally:
+        target.close()
+
+
+def _write_database_snapshot(zipf: zipfile.ZipFile, report_progress: ProgressCallback) -> dict[str, int]:
+    """
+    Add a page-level copy of the database to the archive using the SQLite backup API.
+
+    Pages are copied SNAPSHOT_PAGES_PER_STEP at a time, releasing the read lock
+    between steps so writers are not blocked. SQLite restarts the copy when
+    another connection writes in between, so the result is always a
+    transactionally consistent snapshot; after SNAPSHOT_MAX_RESTARTS restarts
+    the copy is finished in a single step instead. Returns the row count per table.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError(f"Snapshot backups require SQLite (got '{engine.dialect.name}')")
+
+    snapshot_path = db_dir / f"lnauto.db.snapshot-{uuid.uuid4().hex}"
+    raw_connection = engine.raw_connection()
+    try:
+        restarts = 0
+        last_remaining: int | None = None
+
+        def on_step(status: int, remaining: int, total: int) -> None:
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining > last_remaining:
+                # A concurrent write invalidated the copy and SQLite started over
+                restarts += 1
+                if restarts > SNAPSHOT_MAX_RESTARTS:
+                    raise _SnapshotRestarted()
+            last_remaining = remaining
+            copied = total - remaining
+            progress = 10 + int((copied / max(1, total)) * 40)  # 10-50%
+            report_progress(progress, f"Copying database pages ({copied}/{total})...")
+
+        report_progress(10, "Creating database snapshot...")
+        try:
+            _copy_database(raw_connection, snapshot_path, SNAPSHOT_PAGES_PER_STEP, on_step)
+        except _SnapshotRestarted:
+            # Too much write traffic to finish incrementally; copy in a single
+            # step, holding the read lock for the duration of the copy only
+            logger.info(f"Snapshot restarted {restarts} times, copying in a single step")
+            report_progress(10, "Creating database snapshot (single pass)...")
+            _copy_database(raw_connection, snapshot_path, -1, None)
+
+        snapshot_engine = create_engine(f"sqlite:///{snapshot_path}")
+        try:
+            with Session(snapshot_engine) as session:
+                row_counts = _count_rows(session)
+        finally:
+            snapshot_engine.dispose()
+
+        report_progress(50, "Compressing database snapshot...")
+        zipf.write(snapshot_path, SNAPSHOT_ENTRY_NAME)
+        return row_counts
+    finally:
+        raw_connection.close()
+        snapshot_path.unlink(missing_ok=True)
+
+
+def _compress_type(file_path: Path) -> int:
+    """Store already-compressed formats as-is, deflating them again only costs CPU."""
+    if file_path.suffix.lower() in ALREADY_COMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _write_file_hashed(zipf: zipfile.ZipFile, file_path: Path, arcname: str) -> str:
+    """Add a file to the archive, hashing it in the same pass. Returns the SHA-256 hex digest."""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = _compress_type(file_path)
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source, zipf.open(zinfo, "w", force_zip64=True) as target:
+        while chunk := source.read(FILE_CHUNK_SIZE):
+            digest.update(chunk)
+            target.write(chunk)
+    return digest.hexdigest()
+
+
+def _hash_file(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source:
+        while chunk := source.read(FILE_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(backup_file: Path) -> dict[str, dict[str, Any]]:
+    """Plugin file manifest of a backup (empty for backups made before manifests existed)."""
+    with zipfile.ZipFile(backup_file, "r") as zipf:
+        if MANIFEST_ENTRY_NAME not in zipf.namelist():
+            return {}
+        return json.loads(zipf.read(MANIFEST_ENTRY_NAME))["files"]
+
+
+def _collect_plugin_files() -> list[tuple[Path, str]]:
+    """(file path, archive name) of every plugin config and data file to back up."""
+    files = []
+    plugins_config_dir = db_dir / "plugins"
+    if plugins_config_dir.exists():
+        files.extend(
+            (file_path, f"config/plugins/{file_path.relative_to(plugins_config_dir).as_posix()}")
+            for file_path in plugins_config_dir.rglob("*")
+            if file_path.is_file()
+        )
+    # Plugin data, excluding large cache/temp files
+    plugin_data_dir = db_dir / "plugin-data"
+    if plugin_data_dir.exists():
+        files.extend(
+            (file_path, f"plugin-data/{file_path.relative_to(plugin_data_dir).as_posix()}")
+            for file_path in plugin_data_dir.rglob("*")
+            if file_path.is_file() and file_path.suffix not in [".tmp", ".cache", ".lock"]
+        )
+    return files
+
+
+def _write_plugin_files(
+    zipf: zipfile.ZipFile,
+    backup_name: str,
+    base_manifest: dict[str, dict[str, Any]],
+    report_progress: ProgressCallback,
+) -> dict[str, dict[str, Any]]:
+    """
+    Add plugin config/data files to the archive and build the backup manifest.
+
+    Files whose size and mtime (or, failing that, content hash) match the base
+    manifest are not stored again; their entry keeps pointing at the archive
+    that holds the content, so a restore never has to walk the chain.
+    """
+    report_progress(60, "Backing up plugin files...")
+    files = _collect_plugin_files()
+    manifest: dict[str, dict[str, Any]] = {}
+    stored = 0
+
+    total_files = len(files)
+    for idx, (file_path, arcname) in enumerate(files):
+        if total_files > 0 and idx % max(1, total_files // 10) == 0:
+            progress = 60 + int((idx / total_files) * 35)  # 60-95%
+            report_progress(progress, f"Backing up plugin files ({idx}/{total_files})...")
+
+        stat = file_path.stat()
+        entry = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+        base_entry = base_manifest.get(arcname)
+
+        if base_entry and base_entry["size"] == stat.st_size:
+            if base_entry["mtime"] == stat.st_mtime_ns:
+                manifest[arcname] = base_entry
+                continue
+            sha256 = _hash_file(file_path)
+            if sha256 == base_entry["sha256"]:
+                manifest[arcname] = {**entry, "sha256": sha256, "backup": base_entry["backup"]}
+                continue
+
+        entry["sha256"] = _write_file_hashed(zipf, file_path, arcname)
+        entry["backup"] = backup_name
+        manifest[arcname] = entry
+        stored += 1
+
+    logger.info(f"Backed up {stored} plugin file(s), {total_files - stored} unchanged file(s) referenced")
+    return manifest
+
+
+def _restore_target_path(arcname: str) -> Path:
+    if arcname.startswith("config/"):
+        return db_dir / arcname.removeprefix("config/")
+    return db_dir / arcname
+
+
+def _plugin_file_sources(zipf: zipfile.ZipFile, backup_file: Path) -> dict[str, str]:
+    """
+    Map each plugin file in a backup to the archive holding its content.
+
+    Raises:
+        ValueError: If a base backup in the chain is missing.
+    """
+    if MANIFEST_ENTRY_NAME in zipf.namelist():
+        manifest = json.loads(zipf.read(MANIFEST_ENTRY_NAME))["files"]
+        # The archive may have been renamed (e.g. an uploaded copy); entries
+        # naming the original file refer to this archive
+        own_name = json.loads(zipf.read("metadata.json")).get("filename", backup_file.name)
+        sources = {
+            arcname: backup_file.name if entry["backup"] == own_name else entry["backup"]
+            for arcname, entry in manifest.items()
+        }
+    else:
+        # Backup made before manifests existed, everything is in this archive
+        sources = {
+            f.filename: backup_file.name
+            for f in zipf.filelist
+            if f.filename.startswith(("config/plugins/", "plugin-data/"))
+        }
+
+    missing = {
+        name for name in set(sources.values())
+        if name != backup_file.name and not (backup_file.parent / name).is_file()
+    }
+    if missing:
+        raise ValueError(f"Missing base backup(s) required by this backup: {', '.join(sorted(missing))}")
+    return sources
+
+
+def _restore_plugin_files(
+    zipf: zipfile.ZipFile,
+    backup_file: Path,
+    sources: dict[str, str],
+    report_progress: ProgressCallback,
+) -> int:
+    """
+    Restore plugin config/data files, pulling unchanged files from the
+    earlier backups in the chain. Returns the number of restored files.
+    """
+    report_progress(75, "Restoring plugin files...")
+    archives = {backup_file.name: zipf}
+    try:
+        total_files = len(sources)
+        for idx, (arcname, source_name) in enumerate(sources.items()):
+            if idx % max(1, total_files // 5) == 0:
+                progress = 75 + int((idx / max(1, total_files)) * 25)  # 75-100%
+                report_progress(progress, f"Restoring plugin files ({idx}/{total_files})...")
+
+            if source_name not in archives:
+                archives[source_name] = zipfile.ZipFile(backup_file.parent / source_name, "r")
+
+            target_path = _restore_target_path(arcname)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            with archives[source_name].open(arcname) as source, open(target_path, "wb") as target:
+                shutil.copyfileobj(source, target, FILE_CHUNK_SIZE)
+    finally:
+        for name, archive in archives.items():
+            if name != backup_file.name:
+                archive.close()
+
+    return len(sources)
+
+
 def backup_database(
     backup_path: str | Path | None = None,
-    progress_callback: ProgressCallback | None = None
+    progress_callback: ProgressCallback | None = None,
+    mode: BackupMode = BackupMode.EXPORT,
+    base_backup: str | Path | None = None,
 ) -> Path:
     """
     Creates a backup of the database, plugin data, and configuration in a portable ZIP format.
     
     The backup includes:
-    - All database tables exported as JSON
+    - The database, either streamed in batches as one NDJSON entry per table
+      (BackupMode.EXPORT) or as a consistent SQLite file snapshot (BackupMode.SNAPSHOT)
     - Plugin configuration files
     - Plugin data directories
+    - A manifest of every plugin file (size, mtime, hash and the archive holding it)
     - Backup metadata (version, timestamp, etc.)
     
     Args:
@@ -63,6 +529,10 @@ def backup_database(
                     creates a timestamped backup in the config directory.
         progress_callback: Optional callback function(progress: int, message: str)
                           to report progress. Progress is 0-100.
+        mode: How the database is stored. Snapshots are much faster to create and
+              restore, exports are portable across schema versions.
+        base_backup: Optional earlier backup in the same directory. Plugin files
+                     unchanged since it are referenced instead of stored again.
     
     Returns:
         Path: The path to the created backup file.
@@ -80,83 +550,53 @@ def backup_database(
     if backup_path is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = db_dir / f"backup_{timestamp}.zip"
+        # Backups queued back to back can finish within the same second
+        suffix = 1
+        while backup_path.exists():
+            backup_path = db_dir / f"backup_{timestamp}_{suffix}.zip"
+            suffix += 1
     else:
         backup_path = Path(backup_path)
 
     backup_path.parent.mkdir(parents=True, exist_ok=True)
 
+    base_manifest: dict[str, dict[str, Any]] = {}
+    if base_backup is not None:
+        # Manifest entries reference archives by name, so the chain must share a directory
+        base_backup = backup_path.parent / Path(base_backup).name
+        if not base_backup.is_file():
+            raise FileNotFoundError(f"Base backup not found: {base_backup}")
+        base_manifest = _read_manifest(base_backup)
+
     try:
         report_progress(5, "Initializing backup...")
         logger.debug("Creating backup ZIP file...")
         
         with zipfile.ZipFile(backup_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Add metadata
-            report_progress(10, "Creating backup metadata...")
             metadata = {
                 "version": BACKUP_VERSION,
+                "filename": backup_path.name,
+                "format": mode.value,
                 "timestamp": datetime.now().isoformat(),
                 "database_path": str(db_dir / "lnauto.db"),
             }
-            zipf.writestr("metadata.json", json.dumps(metadata, indent=2))
+            if mode == BackupMode.SNAPSHOT:
+                metadata["tables"] = _write_database_snapshot(zipf, report_progress)
+            else:
+                metadata["tables"] = _write_database_export(zipf, report_progress)
+
+            # Backup plugin configuration and data files (only changed files
+            # when a base backup is given, the rest is referenced from it)
+            manifest = _write_plugin_files(zipf, backup_path.name, base_manifest, report_progress)
+            metadata["base"] = base_backup.name if base_backup else None
+            metadata["requires"] = sorted(
+                {entry["backup"] for entry in manifest.values()} - {backup_path.name}
+            )
+            zipf.writestr(MANIFEST_ENTRY_NAME, json.dumps({"files": manifest}, indent=2))
 
-            # Backup database tables
-            report_progress(15, "Exporting database tables...")
-            with Session(engine) as session:
-                tables_data = {}
-
-                # Export each table
-                # Order matters for foreign key relationships
-                table_models = [
-                    ("plugins", Plugin),
-                    ("metadata_sources", MetadataSource),
-                    ("indexers", Indexer),
-                    ("download_clients", DownloadClient),
-                    ("collections", Collection),
-                    ("series_groups", SeriesGroup),
-                    ("series", Series),
-                    ("books", Book),
-                    ("chapters", Chapter),
-                    ("releases", Release),
-                    ("notifications", Notification),
-                ]
-
-                total_tables = len(table_models)
-                for idx, (table_name, model_class) in enumerate(table_models):
-                    progress = 15 + int((idx / total_tables) * 40)  # 15-55%
-                    report_progress(progress, f"Exporting {table_name}...")
-                    
-                    records = session.exec(select(model_class)).all()
-                    tables_data[table_name] = [serialize_model(record) for record in records]
-
-            report_progress(60, "Writing database export to backup...")
-            zipf.writestr("database.json", json.dumps(tables_data, indent=2))
-
-            # Backup plugin configuration directory
-            report_progress(65, "Backing up plugin configurations...")
-            plugins_config_dir = db_dir / "plugins"
-            if plugins_config_dir.exists():
-                for file_path in plugins_config_dir.rglob("*"):
-                    if file_path.is_file():
-                        arcname = f"config/plugins/{file_path.relative_to(plugins_config_dir)}"
-                        zipf.write(file_path, arcname)
-
-            # Backup plugin data directory (excluding large cache/temp files)
-            report_progress(75, "Backing up plugin data...")
-            plugin_data_dir = db_dir / "plugin-data"
-            if plugin_data_dir.exists():
-                files_to_backup = [
-                    f for f in plugin_data_dir.rglob("*") 
-                    if f.is_file() and f.suffix not in [".tmp", ".cache", ".lock"]
-                ]
-                
-                total_files = len(files_to_backup)
-                for idx, file_path in enumerate(files_to_backup):
-                    if total_files > 0 and idx % max(1, total_files // 10) == 0:
-                        progress = 75 + int((idx / total_files) * 20)  # 75-95%
-                        report_progress(progress, f"Backing up plugin data ({idx}/{total_files})...")
-                    
-                    arcname = f"plugin-data/{file_path.relative_to(plugin_data_dir)}"
-                    zipf.write(file_path, arcname)
+            # Add metadata
+            report_progress(95, "Creating backup metadata...")
+            zipf.writestr("metadata.json", json.dumps(metadata, indent=2))
 
         report_progress(100, "Backup completed successfully")
         logger.info(f"Backup created successfully: {backup_path}")
@@ -171,6 +611,151 @@ def backup_database(
         raise Exception(f"Backup creation failed: {str(e)}") from e
 
 
+def _load_database_export(
+    zipf: zipfile.ZipFile, metadata: dict[str, Any], report_progress: ProgressCallback
+) -> dict[str, int]:
+    """Bulk load an NDJSON (or legacy database.json) export. Returns restored rows per table."""
+    restored_tables: dict[str, int] = {}
+
+    # Clear existing data
+    report_progress(30, "Preparing database...")
+    _prepare_bulk_load()
+
+    # Restore database tables
+    names = set(zipf.namelist())
+    if metadata.get("version") == "1.0" and "database.json" in names:
+        # Legacy single-document format, has to be loaded in one piece
+        report_progress(35, "Loading database export...")
+        tables_data = json.loads(zipf.read("database.json"))
+        table_records = {
+            table_name: iter(records) for table_name, records in tables_data.items()
+        }
+        expected_rows = {
+            table_name: len(records) for table_name, records in tables_data.items()
+        }
+    else:
+        table_records = {
+            table_name: _iter_ndjson_records(zipf, table_entry_name(table_name))
+            for table_name, _ in TABLE_MODELS
+            if table_entry_name(table_name) in names
+        }
+        expected_rows = metadata.get("tables", {})
+
+    total_rows = max(1, sum(expected_rows.get(name, 0) for name in table_records))
+    restored_rows = 0
+
+    is_sqlite = engine.dialect.name == "sqlite"
+    with engine.connect() as conn:
+        if is_sqlite:
+            # Rows arrive parents first, so skip per-row FK lookups during the load
+            foreign_keys = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+            conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+
+        for table_name, model_class in TABLE_MODELS:
+            if table_name not in table_records:
+                continue
+
+            def on_batch(batch_size: int, table_name: str = table_name) -> None:
+                nonlocal restored_rows
+                # Commit per batch so progress writes from other connections aren't locked out
+                conn.commit()
+                restored_rows += batch_size
+                progress = 35 + int(min(1, restored_rows / total_rows) * 35)  # 35-70%
+                report_progress(progress, f"Restoring {table_name} ({restored_rows}/{total_rows} rows)...")
+
+            report_progress(
+                35 + int(min(1, restored_rows / total_rows) * 35),
+                f"Restoring {table_name}...",
+            )
+            restored_tables[table_name] = _bulk_insert_table(
+                conn, model_class, table_records[table_name], on_batch
+            )
+            conn.commit()
+
+        if is_sqlite:
+            violations = conn.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+            if violations:
+                logger.warning(f"Restored data has {len(violations)} foreign key violation(s)")
+            conn.exec_driver_sql(f"PRAGMA foreign_keys = {int(foreign_keys)}")
+
+    return restored_tables
+
+
+def _copy_snapshot_into_database(snapshot_file: Path) -> None:
+    """
+    Overwrite the live database with a snapshot using the SQLite backup API.
+
+    Copying pages through SQLite (rather than swapping the file) keeps every
+    open connection, in this and other processes, pointed at the restored
+    data. Task rows are carried over so running tasks keep their state, and
+    so are the scheduler's stored jobs, so schedules and paused jobs aren't
+    rolled back to backup time (or lost with a snapshot predating the table).
+    """
+    # The job store table belongs to APScheduler, not to the SQLModel metadata
+    kept_tables = [Task.__table__, *JOB_METADATA.sorted_tables]
+    with engine.connect() as conn:
+        existing = inspect(conn)
+        kept_rows = [
+            [dict(row) for row in conn.execute(table.select()).mappings()]
+            if existing.has_table(table.name) else []
+            for table in kept_tables
+        ]
+        conn.rollback()
+
+        snapshot = sqlite3.connect(snapshot_file)
+        try:
+            snapshot.backup(conn.connection.driver_connection)
+        finally:
+            snapshot.close()
+
+        for table, rows in zip(kept_tables, kept_rows):
+            table.create(conn, checkfirst=True)
+            conn.execute(table.delete())
+            if rows:
+                conn.execute(table.insert(), rows)
+        conn.commit()
+
+
+def _restore_database_snapshot(zipf: zipfile.ZipFile, report_progress: ProgressCallback) -> dict[str, int]:
+    """Restore the database from the snapshot in the archive. Returns rows per table."""
+    if SNAPSHOT_ENTRY_NAME not in zipf.namelist():
+        raise ValueError("Invalid backup file: missing database snapshot")
+
+    staged_file = db_dir / f"lnauto.db.restore-{uuid.uuid4().hex}"
+    try:
+        report_progress(35, "Extracting database snapshot...")
+        with zipf.open(SNAPSHOT_ENTRY_NAME) as source, open(staged_file, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+        report_progress(55, "Verifying database snapshot...")
+        check = sqlite3.connect(staged_file)
+        try:
+            result = check.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            check.close()
+        if result != "ok":
+            raise ValueError(f"Database snapshot failed integrity check: {result}")
+
+        report_progress(65, "Copying snapshot into the database...")
+        _copy_snapshot_into_database(staged_file)
+    finally:
+        staged_file.unlink(missing_ok=True)
+
+    with Session(engine) as session:
+        return _count_rows(session)
+
+
+def _roll_back_restore(pre_restore_file: Path) -> None:
+    """Copy the safety backup taken before a restore back into the live database."""
+    logger.warning(f"Restore did not complete, rolling back to {pre_restore_file.name}")
+    try:
+        _copy_snapshot_into_database(pre_restore_file)
+    except Exception as e:
+        logger.error(
+            f"Rolling back the restore failed, restore {pre_restore_file} manually: {e}", exc_info=True
+        )
+
+
 def restore_database(
     backup_file: str | Path,
     overwrite: bool = False,
@@ -192,11 +777,23 @@ def restore_database(
         FileNotFoundError: If backup file doesn't exist.
         ValueError: If backup format is invalid or version incompatible.
         Exception: If restoration fails.
+
+    If loading the database fails or is cancelled after the existing data
+    was replaced, the safety copy taken beforehand is copied back. Once the
+    database is restored, cancellation is no longer honoured and the plugin
+    files are restored too.
     """
+    cancellable = True
+
     def report_progress(progress: int, message: str):
         """Helper to safely call progress callback."""
         if progress_callback:
-            progress_callback(progress, message)
+            try:
+                progress_callback(progress, message)
+            except TaskCancelledError:
+                if cancellable:
+                    raise
+                logger.info("Ignoring cancellation, the database is already restored")
     
     logger.info(f"Starting database restoration from: {backup_file}")
     logger.info(f"Overwrite mode: {overwrite}")
@@ -228,12 +825,15 @@ def restore_database(
             summary["backup_version"] = metadata.get("version")
             summary["backup_timestamp"] = metadata.get("timestamp")
 
-            if metadata.get("version") != BACKUP_VERSION:
+            if metadata.get("version") not in SUPPORTED_BACKUP_VERSIONS:
                 raise ValueError(
                     f"Incompatible backup version: {metadata.get('version')} "
-                    f"(expected {BACKUP_VERSION})"
+                    f"(expected one of {', '.join(sorted(SUPPORTED_BACKUP_VERSIONS))})"
                 )
 
+            # Make sure every backup in the chain is available before touching anything
+            file_sources = _plugin_file_sources(zipf, backup_file)
+
             # Check if database exists
             report_progress(20, "Checking existing database...")
             db_file = db_dir / "lnauto.db"
@@ -243,87 +843,44 @@ def restore_database(
                 )
 
             # Backup existing database if it exists
+            backup_existing = None
             if db_file.exists():
                 report_progress(25, "Creating safety backup of existing database...")
                 ## TODO: Workshop naming conventions
                 backup_existing = db_dir / f"lnauto.db.pre-restore.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                shutil.copy2(db_file, backup_existing)
-
-            # Clear existing data
-            report_progress(30, "Preparing database...")
-            from .database.database import init_db
-            from sqlmodel import SQLModel
-
-            # Drop and recreate all tables
-            SQLModel.metadata.drop_all(engine)
-            init_db()
+                # Copy through SQLite so changes still in the WAL are included
+                raw_connection = engine.raw_connection()
+                try:
+                    _copy_database(raw_connection, backup_existing, -1, None)
+                finally:
+                    raw_connection.close()
+
+            try:
+                if metadata.get("format") == BackupMode.SNAPSHOT.value:
+                    summary["restored_tables"] = _restore_database_snapshot(zipf, report_progress)
+                else:
+                    summary["restored_tables"] = _load_database_export(zipf, metadata, report_progress)
 
-            # Restore database tables
-            if "database.json" in zipf.namelist():
-                report_progress(35, "Loading database export...")
-                tables_data = json.loads(zipf.read("database.json"))
+                # Rebuild indexes and the search index in one pass each, and
+                # create anything added to the schema since the backup was taken
+                report_progress(70, "Rebuilding indexes...")
+                init_db()
 
                 with Session(engine) as session:
-                    # Restore in correct order (respecting foreign keys)
-                    restore_order = [
-                        ("plugins", Plugin),
-                        ("metadata_sources", MetadataSource),
-                        ("indexers", Indexer),
-                        ("download_clients", DownloadClient),
-                        ("collections", Collection),
-                        ("series_groups", SeriesGroup),
-                        ("series", Series),
-                        ("books", Book),
-                        ("chapters", Chapter),
-                        ("releases", Release),
-                        ("notifications", Notification),
-                    ]
-
-                    total_tables = len(restore_order)
-                    for idx, (table_name, model_class) in enumerate(restore_order):
-                        progress = 35 + int((idx / total_tables) * 35)  # 35-70%
-                        
-                        if table_name in tables_data:
-                            records = tables_data[table_name]
-                            report_progress(progress, f"Restoring {table_name} ({len(records)} records)...")
-                            
-                            for record_data in records:
-                                # Create model instance from dict
-                                instance = model_class.model_validate(record_data)
-                                session.add(instance)
-
-                            summary["restored_tables"][table_name] = len(records)
-
-                    report_progress(70, "Committing database changes...")
+                    # Bring stored statuses in line with the restored books/releases
+                    recompute_download_statuses(session)
                     session.commit()
-
-            # Restore plugin configuration files
-            report_progress(75, "Restoring plugin configurations...")
-            config_files = [f for f in zipf.filelist if f.filename.startswith("config/plugins/")]
-            for idx, file_info in enumerate(config_files):
-                if idx % max(1, len(config_files) // 5) == 0:
-                    progress = 75 + int((idx / max(1, len(config_files))) * 10)  # 75-85%
-                    report_progress(progress, f"Restoring config files ({idx}/{len(config_files)})...")
-                
-                target_path = db_dir / file_info.filename.replace("config/", "")
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                with zipf.open(file_info) as source, open(target_path, "wb") as target:
-                    shutil.copyfileobj(source, target)
-                summary["restored_files"] += 1
-
-            # Restore plugin data files
-            report_progress(85, "Restoring plugin data...")
-            data_files = [f for f in zipf.filelist if f.filename.startswith("plugin-data/")]
-            for idx, file_info in enumerate(data_files):
-                if idx % max(1, len(data_files) // 5) == 0:
-                    progress = 85 + int((idx / max(1, len(data_files))) * 15)  # 85-100%
-                    report_progress(progress, f"Restoring data files ({idx}/{len(data_files)})...")
-                
-                target_path = db_dir / file_info.filename
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                with zipf.open(file_info) as source, open(target_path, "wb") as target:
-                    shutil.copyfileobj(source, target)
-                summary["restored_files"] += 1
+            except Exception:
+                # Tables may already be dropped or half loaded
+                if backup_existing is not None:
+                    _roll_back_restore(backup_existing)
+                raise
+            cancellable = False
+
+            # Restore plugin configuration and data files
+            summary["restored_files"] = _restore_plugin_files(
+                zipf, backup_file, file_sources, report_progress
+            )
 
         report_progress(100, "Restore completed successfully")
         return summary
@@ -361,6 +918,9 @@ def list_backups(backup_dir: Path | None = None) -> list[dict[str, Any]]:
                     "size": backup_file.stat().st_size,
                     "created": datetime.fromtimestamp(backup_file.stat().st_ctime).isoformat(),
                     "version": metadata.get("version"),
+                    "format": metadata.get("format", BackupMode.EXPORT.value),
+                    "base": metadata.get("base"),
+                    "requires": metadata.get("requires", []),
                     "timestamp": metadata.get("timestamp"),
                 }
             )
@@ -369,3 +929,29 @@ def list_backups(backup_dir: Path | None = None) -> list[dict[str, Any]]:
             continue
 
     return sorted(backups, key=lambda x: x["created"], reverse=True)
+
+
+def backup_task(
+    progress_callback: ProgressCallback,
+    mode: str = BackupMode.EXPORT.value,
+    base_backup: str | None = None,
+) -> dict[str, Any]:
+    """Task manager entry point for backup_database()."""
+    backup_path = backup_database(
+        progress_callback=progress_callback, mode=BackupMode(mode), base_backup=base_backup
+    )
+    return {
+        "filename": backup_path.name,
+        "path": str(backup_path),
+        "size": backup_path.stat().st_size,
+    }
+
+
+def restore_task(
+    progress_callback: ProgressCallback, backup_file: str, overwrite: bool = False
+) -> dict[str, Any]:
+    """Task manager entry point for restore_database(). Removes the uploaded file afterwards."""
+    try:
+        return restore_database(backup_file, overwrite=overwrite, progress_callback=progress_callback)
+    finally:
+        Path(backup_file).unlink(missing_ok=True)
@@ -1,8 +1,10 @@
 import logging
+import os
 from contextlib import contextmanager
 from pathlib import Path
 from sqlmodel import SQLModel, create_engine, Session, select
 
+from backend.core.database.search import init_search_index
 from backend.core.logging_config import get_logger
 
 
@@ -13,7 +15,8 @@ logger = get_logger(__name__)
 backend_dir = Path(
     __file__
 ).parent.parent.parent  # goes from core/database/ up to backend/
-db_dir = backend_dir / "config"
+# DATABASE_DIR relocates the database, e.g. to a throwaway directory for benchmarks
+db_dir = Path(os.environ.get("DATABASE_DIR", backend_dir / "config"))
 db_dir.mkdir(parents=True, exist_ok=True)
 
 db_path = db_dir / "lnauto.db"
@@ -25,7 +28,17 @@ engine = create_engine(
 
 def init_db():
     logger.info(f"Initializing database at: {db_path}")
+    if engine.dialect.name == "sqlite":
+        # Readers (API, long exports) no longer block writers (task progress, scheduler).
+        # The journal mode is stored in the database file, so this only takes effect once.
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
     SQLModel.metadata.create_all(engine)
+    # create_all() skips existing tables, so add indexes introduced since they were created
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    init_search_index(engine)
     logger.info("Database initialized successfully")
 
 
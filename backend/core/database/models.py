@@ -4,7 +4,7 @@ from enum import Enum
 from sqlmodel import Field, SQLModel, Relationship
 import uuid
 
-from sqlmodel import Column, JSON
+from sqlmodel import Column, JSON, Index
 
 # if TYPE_CHECKING:
 #     from .plugins import MetadataPlugin, MetadataPluginPublic
@@ -116,6 +116,14 @@ class NotificationType(str, Enum):
     SUCCESS = "SUCCESS"
 
 
+class TaskStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
 class NotificationMessage(SQLModel):
     message: str
     type: NotificationType = NotificationType.INFO
@@ -127,6 +135,9 @@ class NotificationMessage(SQLModel):
 
 
 class Notification(SQLModel, table=True):
+    # Serves unread counts and read-filtered, newest-first pagination
+    __table_args__ = (Index("ix_notification_read_timestamp", "read", "timestamp"),)
+
     id: uuid.UUID | None = Field(default_factory=uuid.uuid4, primary_key=True)
     message: str
     type: NotificationType = Field(default=NotificationType.INFO)
@@ -134,6 +145,61 @@ class Notification(SQLModel, table=True):
     read: bool = Field(default=False)
 
 
+class NotificationBulkRequest(SQLModel):
+    """
+    Selects notifications for bulk read-state and delete operations.
+
+    Filters are combined with AND. Omitting all filters marks every
+    notification; delete requires at least one filter.
+
+    Fields:
+        ids (list[uuid.UUID] | None): Explicit notification IDs.
+        before (datetime | None): Only notifications older than this timestamp.
+        type (NotificationType | None): Only notifications of this type.
+        read (bool | None): Only read (True) or unread (False) notifications.
+            Delete only; mark-read sets the read state from its ``read``
+            query parameter and rejects this filter.
+    """
+
+    ids: list[uuid.UUID] | None = None
+    before: datetime | None = None
+    type: NotificationType | None = None
+    read: bool | None = None
+
+
+class Task(SQLModel, table=True):
+    """
+    A background job (backup, restore, ...) run by the task manager.
+
+    State lives in the database so progress survives restarts and is visible
+    from every API worker.
+
+    Fields:
+        type (str): Registered task type, concurrency is limited per type.
+        params (dict | None): Keyword arguments passed to the task function.
+        pid (int | None): Process currently responsible for the task.
+        cancel_requested (bool): Set to ask a running task to stop.
+    """
+
+    # Serves the per-type running count checked when claiming tasks
+    __table_args__ = (Index("ix_task_type_status", "type", "status"),)
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    type: str
+    status: TaskStatus = Field(default=TaskStatus.PENDING)
+    progress: int = Field(default=0)
+    message: str = Field(default="")
+    params: dict | None = Field(default=None, sa_column=Column(JSON))
+    result: dict | None = Field(default=None, sa_column=Column(JSON))
+    error: str | None = Field(default=None)
+    cancel_requested: bool = Field(default=False)
+    pid: int | None = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime | None = Field(default=None)
+    completed_at: datetime | None = Field(default=None)
+    updated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
 ################################################################################
 # Plugin Models
 ################################################################################
@@ -343,6 +409,30 @@ class SeriesDetailsResponse(SQLModel):
     deleted: bool = False
 
 
+class LibrarySearchResult(SQLModel):
+    """
+    A single hit from the local library full-text search.
+
+    Fields:
+        kind (str): Either "series" or "book".
+        id (uuid.UUID): ID of the matched series or book.
+        series_id (uuid.UUID): ID of the series (the series itself for series hits).
+        title (str): Title of the matched entry.
+        score (float): Relevance score, higher is better.
+        fuzzy (bool): True if the hit came from fuzzy (trigram) matching.
+    """
+
+    kind: str
+    id: uuid.UUID
+    series_id: uuid.UUID
+    title: str
+    romaji: str | None = None
+    title_orig: str | None = None
+    img_url: str | None = None
+    score: float
+    fuzzy: bool = False
+
+
 ################################################################################
 # Database Models
 ################################################################################
@@ -0,0 +1,221 @@
+"""
+Full-text search index over the local library (SQLite FTS5).
+
+Two FTS5 tables are kept in sync with the ``series`` and ``book`` tables by
+SQL triggers, so every write path (API, metadata refresh, restore) updates the
+index without any application code:
+
+- ``library_fts``: word index (unicode61) used for ranked and prefix matching
+  over titles, romaji, original titles, aliases, authors, publishers and tags.
+- ``library_fts_trigram``: trigram index over the title fields, used for
+  fuzzy (typo tolerant) and substring matching.
+
+Series and books share both tables. The FTS rowid encodes the source row as
+``rowid * 2`` for series and ``rowid * 2 + 1`` for books, which keeps trigger
+deletes a primary key lookup instead of a full index scan.
+
+NOTE: ``VACUUM`` may renumber implicit rowids; call ``rebuild_search_index``
+afterwards.
+"""
+
+import re
+
+from sqlalchemy.engine import Connection, Engine
+
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+FTS_TABLE = "library_fts"
+TRIGRAM_TABLE = "library_fts_trigram"
+
+# bm25() takes one weight per column, including UNINDEXED ones.
+# Columns: kind, entity_id, series_id, img_url, title, romaji, title_orig,
+#          aliases, authors, publishers, tags
+BM25_WEIGHTS = (0.0, 0.0, 0.0, 0.0, 10.0, 6.0, 6.0, 4.0, 2.0, 1.0, 1.0)
+
+_SERIES_VALUES = """
+    NEW.rowid * 2, 'series', NEW.id, NEW.id, NEW.img_url,
+    NEW.title, NEW.romaji, NEW.title_orig, NEW.aliases, NEW.authors, NEW.publishers,
+    coalesce(NEW.genres, '') || ' ' || coalesce(NEW.tags, '')
+"""
+
+_BOOK_VALUES = """
+    NEW.rowid * 2 + 1, 'book', NEW.id, NEW.series_id, NEW.img_url,
+    NEW.title, NEW.romaji, NEW.title_orig, NULL, NEW.authors, NULL, NULL
+"""
+
+_FTS_COLUMNS = (
+    "rowid, kind, entity_id, series_id, img_url, "
+    "title, romaji, title_orig, aliases, authors, publishers, tags"
+)
+
+_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        kind UNINDEXED,
+        entity_id UNINDEXED,
+        series_id UNINDEXED,
+        img_url UNINDEXED,
+        title, romaji, title_orig, aliases, authors, publishers, tags,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TRIGRAM_TABLE} USING fts5(
+        title, romaji, title_orig,
+        tokenize = 'trigram'
+    )
+    """,
+]
+
+_TRIGGERS = [
+    # ----- Series -----
+    f"""
+    CREATE TRIGGER IF NOT EXISTS series_fts_insert AFTER INSERT ON series BEGIN
+        INSERT INTO {FTS_TABLE}({_FTS_COLUMNS}) VALUES ({_SERIES_VALUES});
+        INSERT INTO {TRIGRAM_TABLE}(rowid, title, romaji, title_orig)
+            VALUES (NEW.rowid * 2, NEW.title, NEW.romaji, NEW.title_orig);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS series_fts_delete AFTER DELETE ON series BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid * 2;
+        DELETE FROM {TRIGRAM_TABLE} WHERE rowid = OLD.rowid * 2;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS series_fts_update
+    AFTER UPDATE OF title, romaji, title_orig, aliases, authors, publishers, genres, tags, img_url
+    ON series BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid * 2;
+        DELETE FROM {TRIGRAM_TABLE} WHERE rowid = OLD.rowid * 2;
+        INSERT INTO {FTS_TABLE}({_FTS_COLUMNS}) VALUES ({_SERIES_VALUES});
+        INSERT INTO {TRIGRAM_TABLE}(rowid, title, romaji, title_orig)
+            VALUES (NEW.rowid * 2, NEW.title, NEW.romaji, NEW.title_orig);
+    END
+    """,
+    # ----- Books -----
+    f"""
+    CREATE TRIGGER IF NOT EXISTS book_fts_insert AFTER INSERT ON book BEGIN
+        INSERT INTO {FTS_TABLE}({_FTS_COLUMNS}) VALUES ({_BOOK_VALUES});
+        INSERT INTO {TRIGRAM_TABLE}(rowid, title, romaji, title_orig)
+            VALUES (NEW.rowid * 2 + 1, NEW.title, NEW.romaji, NEW.title_orig);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS book_fts_delete AFTER DELETE ON book BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid * 2 + 1;
+        DELETE FROM {TRIGRAM_TABLE} WHERE rowid = OLD.rowid * 2 + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS book_fts_update
+    AFTER UPDATE OF title, romaji, title_orig, authors, img_url, series_id
+    ON book BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid * 2 + 1;
+        DELETE FROM {TRIGRAM_TABLE} WHERE rowid = OLD.rowid * 2 + 1;
+        INSERT INTO {FTS_TABLE}({_FTS_COLUMNS}) VALUES ({_BOOK_VALUES});
+        INSERT INTO {TRIGRAM_TABLE}(rowid, title, romaji, title_orig)
+            VALUES (NEW.rowid * 2 + 1, NEW.title, NEW.romaji, NEW.title_orig);
+    END
+    """,
+]
+
+
+def is_search_supported(bind: Engine | Connection) -> bool:
+    """FTS5 search is only available on SQLite databases."""
+    return bind.dialect.name == "sqlite"
+
+
+def init_search_index(engine: Engine) -> None:
+    """
+    Create the FTS tables and sync triggers if missing.
+
+    The index is rebuilt from scratch when its row count no longer matches the
+    library (first run on an existing database, or after tables were dropped
+    and recreated by a restore).
+    """
+    if not is_search_supported(engine):
+        logger.warning(f"Library search index not created: unsupported dialect '{engine.dialect.name}'")
+        return
+
+    with engine.begin() as conn:
+        for statement in _SCHEMA + _TRIGGERS:
+            conn.exec_driver_sql(statement)
+
+        indexed = conn.exec_driver_sql(f"SELECT count(*) FROM {FTS_TABLE}").scalar_one()
+        expected = conn.exec_driver_sql(
+            "SELECT (SELECT count(*) FROM series) + (SELECT count(*) FROM book)"
+        ).scalar_one()
+
+        if indexed != expected:
+            logger.info(f"Library search index out of sync ({indexed}/{expected} rows), rebuilding...")
+            rebuild_search_index(conn)
+
+
+def drop_search_index(conn: Connection) -> None:
+    """
+    Drop the FTS tables and their sync triggers.
+
+    Used before bulk loads so rows are not indexed one trigger at a time;
+    ``init_search_index`` recreates everything and rebuilds in one pass.
+    """
+    for trigger in ("series_fts_insert", "series_fts_delete", "series_fts_update",
+                    "book_fts_insert", "book_fts_delete", "book_fts_update"):
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {TRIGRAM_TABLE}")
+
+
+def rebuild_search_index(conn: Connection) -> None:
+    """Repopulate both FTS tables from the series and book tables."""
+    conn.exec_driver_sql(f"DELETE FROM {FTS_TABLE}")
+    conn.exec_driver_sql(f"DELETE FROM {TRIGRAM_TABLE}")
+
+    conn.exec_driver_sql(
+        f"INSERT INTO {FTS_TABLE}({_FTS_COLUMNS}) "
+        f"SELECT {_SERIES_VALUES.replace('NEW.', '')} FROM series"
+    )
+    conn.exec_driver_sql(
+        f"INSERT INTO {FTS_TABLE}({_FTS_COLUMNS}) "
+        f"SELECT {_BOOK_VALUES.replace('NEW.', '')} FROM book"
+    )
+    conn.exec_driver_sql(
+        f"INSERT INTO {TRIGRAM_TABLE}(rowid, title, romaji, title_orig) "
+        "SELECT rowid * 2, title, romaji, title_orig FROM series "
+        "UNION ALL "
+        "SELECT rowid * 2 + 1, title, romaji, title_orig FROM book"
+    )
+
+    # Merge index b-trees after a bulk load
+    conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    conn.exec_driver_sql(f"INSERT INTO {TRIGRAM_TABLE}({TRIGRAM_TABLE}) VALUES ('optimize')")
+    logger.info("Library search index rebuilt")
+
+
+def tokenize_query(query: str) -> list[str]:
+    """Split a user query into lowercase word tokens (FTS operators are ignored)."""
+    return re.findall(r"\w+", query.lower())
+
+
+def build_match_query(tokens: list[str], prefix: bool = True) -> str:
+    """Build an FTS5 MATCH expression requiring every token (optionally as a prefix)."""
+    suffix = "*" if prefix else ""
+    return " ".join(f'"{token}"{suffix}' for token in tokens)
+
+
+def query_trigrams(tokens: list[str]) -> set[str]:
+    """Trigrams of every token long enough to produce one."""
+    return {
+        token[i:i + 3]
+        for token in tokens
+        if len(token) >= 3
+        for i in range(len(token) - 2)
+    }
+
+
+def build_trigram_query(trigrams: set[str]) -> str:
+    """Build an FTS5 MATCH expression matching any of the given trigrams."""
+    return " OR ".join(f'"{gram}"' for gram in sorted(trigrams))
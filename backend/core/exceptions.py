@@ -21,3 +21,8 @@ class InvalidStateError(Exception):
 class ValidationError(Exception):
     """Raised when validation fails."""
     pass
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a background task when cancellation was requested."""
+    pass
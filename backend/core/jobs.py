@@ -0,0 +1,339 @@
+"""
+Execution policy and run history for scheduler jobs.
+
+- Every job defaults to one instance at a time with coalescing (JOB_DEFAULTS):
+  a run that overruns its interval is skipped instead of piling up, and runs
+  missed while the loop was busy collapse into one, started if it is at most
+  ``misfire_grace_time`` late.
+- Interval jobs get a jitter proportional to their interval, so jobs sharing
+  an interval (and restarts) don't line them up.
+- Heavy jobs (whole-library refreshes, the download pipeline) are decorated
+  with ``heavy_job`` and share HEAVY_JOB_CONCURRENCY slots. Between units of
+  work they call ``yield_to_interactive()``, which waits (bounded) while API
+  requests are in flight so the UI keeps the DB and plugin rate limiters.
+- ``job_history`` keeps the last runs of every job from the scheduler's
+  events, with outcome and duration, for ``/system/jobs``, and pushes each
+  run to WebSocket clients as ``{"event": "job", ...}`` messages.
+- Core jobs live in the app database (``add_persistent_job``), so their next
+  run time and paused state survive restarts. Jobs that can't be stored by
+  reference (bound methods, plugin jobs) are re-added on every start and go
+  to the MEMORY_JOBSTORE.
+"""
+
+import asyncio
+import functools
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.util import obj_to_ref
+from sqlalchemy import MetaData
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.core.database.models import NotificationMessage, NotificationType
+from backend.core.exceptions import ResourceNotFoundError, ValidationError
+from backend.core.logging_config import get_logger
+from backend.core.metrics import HEAVY_JOB_WAIT, SCHEDULER_JOB_DURATION, SCHEDULER_JOB_RUNS
+from backend.core.notifications import notification_manager
+
+
+logger = get_logger(__name__)
+
+JOB_DEFAULTS = {
+    "max_instances": 1,
+    "coalesce": True,
+    "misfire_grace_time": 15 * 60,
+}
+# Interval jobs start up to this fraction of their interval late, capped
+JITTER_FRACTION = 0.05
+MAX_JITTER_SECONDS = 5 * 60
+HEAVY_JOB_CONCURRENCY = 1
+# Heavy jobs pause while API requests are in flight, but never longer than this per yield
+INTERACTIVE_MAX_WAIT_SECONDS = 5.0
+INTERACTIVE_POLL_SECONDS = 0.05
+HISTORY_SIZE = 50
+# Persistent job store table in the app database, and the store for runtime-only jobs
+JOB_TABLE = "scheduler_job"
+MEMORY_JOBSTORE = "memory"
+# Holds the job store's table definition, so snapshot restores can carry it over
+JOB_METADATA = MetaData()
+
+_INTERVAL_UNITS = {"weeks": 604800, "days": 86400, "hours": 3600, "minutes": 60, "seconds": 1}
+
+
+def interval_jitter(**interval: float) -> int:
+    """Jitter in seconds for an interval given as IntervalTrigger keyword arguments."""
+    seconds = sum(_INTERVAL_UNITS[unit] * value for unit, value in interval.items() if unit in _INTERVAL_UNITS)
+    return int(min(seconds * JITTER_FRACTION, MAX_JITTER_SECONDS))
+
+
+def apply_job_policy(job_config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Turn a plugin's job definition into ``add_job`` arguments.
+
+    Plugins may set ``"heavy": True`` to run the job within the heavy job
+    budget. Interval jobs without an explicit jitter get the default one.
+    """
+    config = dict(job_config)
+    if config.pop("heavy", False):
+        config["func"] = heavy_job(config["func"])
+    if config.get("trigger") == "interval" and "jitter" not in config:
+        config["jitter"] = interval_jitter(**{
+            unit: config[unit] for unit in _INTERVAL_UNITS if unit in config
+        })
+    return config
+
+
+class _InteractiveActivity:
+    """Counts HTTP requests in flight (see ActivityMiddleware)."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+
+    async def wait_idle(self, max_wait: float) -> float:
+        """Wait until no request is in flight or ``max_wait`` passed; returns seconds waited."""
+        start = time.perf_counter()
+        while self.in_flight and time.perf_counter() - start < max_wait:
+            await asyncio.sleep(INTERACTIVE_POLL_SECONDS)
+        return time.perf_counter() - start
+
+
+interactive_activity = _InteractiveActivity()
+_heavy_slots = asyncio.Semaphore(HEAVY_JOB_CONCURRENCY)
+
+
+async def yield_to_interactive(max_wait: float = INTERACTIVE_MAX_WAIT_SECONDS) -> None:
+    """Let in-flight API requests finish before a heavy job continues."""
+    await asyncio.sleep(0)
+    await interactive_activity.wait_idle(max_wait)
+
+
+def heavy_job(func: Callable) -> Callable:
+    """Run a coroutine job within the shared heavy job budget."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        async with _heavy_slots:
+            waited = time.perf_counter() - start
+            HEAVY_JOB_WAIT.labels(func.__name__).observe(waited)
+            if waited >= 1:
+                logger.info(f"Heavy job '{func.__name__}' waited {waited:.1f}s for a free slot")
+            return await func(*args, **kwargs)
+
+    wrapper.heavy = True
+    return wrapper
+
+
+class ActivityMiddleware:
+    """ASGI middleware tracking HTTP requests in flight, for ``yield_to_interactive``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        interactive_activity.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            interactive_activity.in_flight -= 1
+
+
+@dataclass
+class JobRun:
+    job_id: str
+    scheduled_at: datetime | None
+    started_at: datetime
+    outcome: str = "running"  # running, success, error, skipped (still running), missed
+    manual: bool = False  # Triggered through the API
+    finished_at: datetime | None = None
+    duration: float | None = None
+    error: str | None = None
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "scheduled_at": self.scheduled_at.isoformat() if self.scheduled_at else None,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration": self.duration,
+            "outcome": self.outcome,
+            "manual": self.manual,
+            "error": self.error,
+        }
+
+
+class JobHistory:
+    """The last HISTORY_SIZE runs of every job, recorded from scheduler events."""
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        self.size = size
+        self.runs: dict[str, deque[JobRun]] = {}
+        self._running: dict[str, deque[JobRun]] = {}
+        # Jobs whose next run was requested through the API
+        self._manual: set[str] = set()
+        self._broadcasts: set[asyncio.Task] = set()
+
+    def attach(self, scheduler) -> None:
+        scheduler.add_listener(
+            self._on_event,
+            EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES,
+        )
+
+    def get_runs(self, job_id: str) -> list[JobRun]:
+        """Runs of a job, newest first."""
+        return list(reversed(self.runs.get(job_id, ())))
+
+    def last_run(self, job_id: str) -> JobRun | None:
+        runs = self.runs.get(job_id)
+        return runs[-1] if runs else None
+
+    def expect_manual(self, job_id: str) -> None:
+        self._manual.add(job_id)
+
+    def running_count(self, job_id: str) -> int:
+        return len(self._running.get(job_id, ()))
+
+    def _add(self, run: JobRun) -> None:
+        if run.job_id in self._manual:
+            self._manual.discard(run.job_id)
+            run.manual = True
+        self.runs.setdefault(run.job_id, deque(maxlen=self.size)).append(run)
+        self._publish(run)
+
+    def _finish(self, run: JobRun, outcome: str, error: BaseException | None = None) -> None:
+        run.outcome = outcome
+        run.finished_at = datetime.now(timezone.utc)
+        run.duration = time.perf_counter() - run._start
+        run.error = repr(error) if error is not None else None
+        SCHEDULER_JOB_RUNS.labels(run.job_id, outcome).inc()
+        if outcome in ("success", "error"):
+            SCHEDULER_JOB_DURATION.labels(run.job_id).observe(run.duration)
+        self._publish(run)
+
+    def _publish(self, run: JobRun) -> None:
+        """Push a run to WebSocket clients; finished manual runs also become notifications."""
+        notification_manager.send_event("job", json.dumps(run.to_dict()))
+        if not run.manual or run.outcome == "running":
+            return
+        if run.outcome == "success":
+            message = f"Job '{run.job_id}' finished in {run.duration:.1f}s."
+            notification_type = NotificationType.SUCCESS
+        elif run.outcome == "error":
+            message = f"Job '{run.job_id}' failed: {run.error}"
+            notification_type = NotificationType.ERROR
+        else:
+            message = f"Job '{run.job_id}' did not run: previous run still in progress."
+            notification_type = NotificationType.WARNING
+        try:
+            task = asyncio.get_running_loop().create_task(
+                notification_manager.broadcast(NotificationMessage(type=notification_type, message=message))
+            )
+        except RuntimeError:
+            return  # No event loop, e.g. a job run in a script
+        self._broadcasts.add(task)
+        task.add_done_callback(self._broadcasts.discard)
+
+    def _on_event(self, event: JobEvent) -> None:
+        # APScheduler itself logs skipped, missed and failed runs
+        now = datetime.now(timezone.utc)
+        if event.code == EVENT_JOB_SUBMITTED:
+            run = JobRun(event.job_id, event.scheduled_run_times[-1], now)
+            self._add(run)
+            self._running.setdefault(event.job_id, deque()).append(run)
+        elif event.code in (EVENT_JOB_EXECUTED, EVENT_JOB_ERROR):
+            running = self._running.get(event.job_id)
+            if not running:
+                return
+            run = running.popleft()
+            if event.code == EVENT_JOB_ERROR:
+                self._finish(run, "error", event.exception)
+            else:
+                self._finish(run, "success")
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            run = JobRun(event.job_id, event.scheduled_run_times[-1], now)
+            self._add(run)
+            self._finish(run, "skipped")
+        elif event.code == EVENT_JOB_MISSED:
+            run = JobRun(event.job_id, event.scheduled_run_time, now)
+            self._add(run)
+            self._finish(run, "missed")
+
+
+job_history = JobHistory()
+
+
+def describe_job(job) -> dict[str, Any]:
+    """Summary of a scheduler job for the API."""
+    last_run = job_history.last_run(job.id)
+    next_run_time = getattr(job, "next_run_time", None)
+    return {
+        "id": job.id,
+        "name": job.name,
+        "trigger": str(job.trigger),
+        # Jobs added before the scheduler starts have no next run time yet
+        "next_run_time": next_run_time.isoformat() if next_run_time else None,
+        "paused": not job.pending and next_run_time is None,
+        "heavy": getattr(job.func, "heavy", False),
+        # Scheduler defaults are applied to pending jobs on start
+        **{key: getattr(job, key, default) for key, default in JOB_DEFAULTS.items()},
+        "running": job_history.running_count(job.id),
+        "last_run": last_run.to_dict() if last_run else None,
+    }
+
+
+def add_persistent_job(scheduler, func: Callable, trigger: BaseTrigger, id: str, **kwargs) -> None:
+    """
+    Add a job to the persistent store, keeping the schedule stored by earlier runs.
+
+    The scheduler must already be started (paused), so the store is readable.
+    If the stored job has the same function and trigger, its next run time
+    (None while paused) is kept; otherwise the job is scheduled from now.
+    """
+    existing = scheduler.get_job(id)
+    if (
+        existing is not None
+        and existing.func_ref == obj_to_ref(func)
+        and str(existing.trigger) == str(trigger)
+    ):
+        trigger = existing.trigger
+        kwargs["next_run_time"] = existing.next_run_time
+    scheduler.add_job(func, trigger, id=id, replace_existing=True, **kwargs)
+
+
+def get_job(scheduler, job_id: str):
+    job = scheduler.get_job(job_id)
+    if job is None:
+        raise ResourceNotFoundError("Job", job_id)
+    return job
+
+
+def run_job_now(scheduler, job_id: str):
+    """
+    Run a job as soon as possible, through the scheduler and its policy.
+
+    Interval jobs are rescheduled from this run; cron jobs keep their times.
+    A run requested while the job is still running is skipped like a
+    scheduled one.
+    """
+    job = get_job(scheduler, job_id)
+    if job.next_run_time is None:
+        raise ValidationError(f"Job '{job_id}' is paused, resume it first")
+    job_history.expect_manual(job_id)
+    return scheduler.modify_job(job_id, next_run_time=datetime.now(timezone.utc))
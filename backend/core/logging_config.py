@@ -4,12 +4,24 @@ Centralized logging configuration for the LN-Auto application.
 Provides two separate log files:
 1. Main application log (main.log) - For core application events
 2. Plugin log (plugins.log) - For all plugin-related events
+
+Log calls only put the record on an in-memory queue; formatting, console
+output, file writes and rotation happen on a QueueListener thread, so heavy
+logging never blocks the event loop. Levels are set on loggers (root plus
+optional per-logger overrides), never on the handlers, so enabling DEBUG for
+one plugin doesn't turn it on for everything else.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 # Avoid circular import by computing LOG_DIR directly
@@ -34,11 +46,147 @@ PLUGIN_LOG_FILE = "plugins.log"
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
 BACKUP_COUNT = 5
 
+# Loggers under this prefix go to the plugin log file
+PLUGIN_LOGGER_PREFIX = "plugins."
+
+# Default budget for repetitive messages on rate limited loggers
+RATE_LIMIT_MESSAGES = 10
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+# Record attributes that are not user supplied `extra` fields
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+# Background thread writing queued records to the real handlers
+_listener: QueueListener | None = None
+# Logger name -> level overrides applied on top of the root level
+_logger_levels: dict[str, int] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including `extra` fields."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _PluginRecordFilter(logging.Filter):
+    """Keep only plugin records (plugins=True) or only non-plugin records."""
+    
+    def __init__(self, plugins: bool):
+        super().__init__()
+        self.plugins = plugins
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.name.startswith(PLUGIN_LOGGER_PREFIX) == self.plugins
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most `max_messages` records per message template and level
+    every `window_seconds`.
+    
+    Records are grouped by their unformatted message (``record.msg``), so
+    callers must use lazy %-style arguments rather than f-strings for
+    repeats to be recognized. The first record of a new window reports how
+    many were dropped in the previous one.
+    """
+    
+    def __init__(self, max_messages: int = RATE_LIMIT_MESSAGES, window_seconds: float = RATE_LIMIT_WINDOW_SECONDS):
+        super().__init__()
+        self.max_messages = max_messages
+        self.window_seconds = window_seconds
+        # (template, level) -> [window start, passed, suppressed]
+        self._windows: dict[tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (str(record.msg), record.levelno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.window_seconds:
+                suppressed = window[2] if window else 0
+                if len(self._windows) > 1000:
+                    self._windows.clear()
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+                return True
+            if window[1] < self.max_messages:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+class _QueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps records structured.
+    
+    The stock handler formats the message on the calling thread and strips
+    exc_info; here only the arguments are merged into the message (so records
+    are safe to hand to another thread) and the traceback is rendered once.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def parse_level(level: int | str) -> int:
+    """
+    Convert a level name (e.g. "debug") or number into a logging level.
+    
+    Raises:
+        ValueError: If the level is unknown
+    """
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(level.strip().upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
+
+
+def parse_logger_levels(spec: str) -> dict[str, int]:
+    """
+    Parse per-logger level overrides, e.g. "plugins.RanobeDB=DEBUG,backend.core.scheduler=WARNING".
+    
+    Raises:
+        ValueError: If an entry is malformed or names an unknown level
+    """
+    levels = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, level = entry.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Invalid logger level override: {entry}")
+        levels[name.strip()] = parse_level(level)
+    return levels
+
 
 def setup_logging(
     log_level: int = DEFAULT_LOG_LEVEL,
     enable_console: bool = True,
-    log_dir: Optional[Path] = None
+    log_dir: Optional[Path] = None,
+    json_format: bool = False,
+    logger_levels: Optional[dict[str, int | str]] = None,
 ) -> None:
     """
     Set up logging for the entire application.
@@ -47,7 +195,11 @@ def setup_logging(
         log_level: The logging level to use (default: INFO)
         enable_console: Whether to log to console/stdout (default: True)
         log_dir: Directory to store log files (default: LOG_DIR from constants)
+        json_format: Write one JSON object per line instead of plain text
+        logger_levels: Per-logger level overrides, e.g. {"plugins.RanobeDB": "DEBUG"}
     """
+    global _listener
+    
     # Use provided log_dir or default from constants
     log_directory = log_dir or LOG_DIR
     
@@ -59,17 +211,21 @@ def setup_logging(
     root_logger.setLevel(log_level)
     
     # Remove any existing handlers to avoid duplication
+    shutdown_logging()
     root_logger.handlers.clear()
     
     # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+    handlers: list[logging.Handler] = []
     
     # Console handler (if enabled)
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Main application file handler
     main_log_path = log_directory / MAIN_LOG_FILE
@@ -79,12 +235,11 @@ def setup_logging(
         backupCount=BACKUP_COUNT,
         encoding='utf-8'
     )
-    main_file_handler.setLevel(log_level)
     main_file_handler.setFormatter(formatter)
     
     # Add filter to main handler to exclude plugin logs
-    main_file_handler.addFilter(lambda record: not record.name.startswith('plugins.'))
-    root_logger.addHandler(main_file_handler)
+    main_file_handler.addFilter(_PluginRecordFilter(plugins=False))
+    handlers.append(main_file_handler)
     
     # Plugin file handler
     plugin_log_path = log_directory / PLUGIN_LOG_FILE
@@ -94,12 +249,22 @@ def setup_logging(
         backupCount=BACKUP_COUNT,
         encoding='utf-8'
     )
-    plugin_file_handler.setLevel(log_level)
     plugin_file_handler.setFormatter(formatter)
     
     # Add filter to plugin handler to only include plugin logs
-    plugin_file_handler.addFilter(lambda record: record.name.startswith('plugins.'))
-    root_logger.addHandler(plugin_file_handler)
+    plugin_file_handler.addFilter(_PluginRecordFilter(plugins=True))
+    handlers.append(plugin_file_handler)
+    
+    # Log calls only enqueue; the listener thread does all formatting and I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    for name in list(_logger_levels):
+        set_logger_level(name, None)
+    for name, level in (logger_levels or {}).items():
+        set_logger_level(name, level)
     
     # Log initialization message
     logger = logging.getLogger(__name__)
@@ -107,6 +272,21 @@ def setup_logging(
     logger.info(f"Main log file: {main_log_path}")
     logger.info(f"Plugin log file: {plugin_log_path}")
     logger.info(f"Log level: {logging.getLevelName(log_level)}")
+    if _logger_levels:
+        logger.info(f"Logger level overrides: {get_logger_levels()}")
+
+
+def shutdown_logging() -> None:
+    """Stop the background listener after writing out every queued record."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -135,26 +315,73 @@ def get_plugin_logger(plugin_name: str) -> logging.Logger:
     Returns:
         A configured logger instance that writes to the plugin log file
     """
-    return logging.getLogger(f"plugins.{plugin_name}")
+    return logging.getLogger(f"{PLUGIN_LOGGER_PREFIX}{plugin_name}")
+
+
+def rate_limited(
+    logger: logging.Logger,
+    max_messages: int = RATE_LIMIT_MESSAGES,
+    window_seconds: float = RATE_LIMIT_WINDOW_SECONDS,
+) -> logging.Logger:
+    """
+    Attach a RateLimitFilter to a logger (once) for repetitive messages.
+    
+    Args:
+        logger: The logger to limit, e.g. from get_logger or get_plugin_logger
+        max_messages: Records per message template and level per window
+        window_seconds: Length of the window
+    
+    Returns:
+        The same logger, for ``logger = rate_limited(get_logger(__name__))``
+    """
+    if not any(isinstance(f, RateLimitFilter) for f in logger.filters):
+        logger.addFilter(RateLimitFilter(max_messages, window_seconds))
+    return logger
 
 
 def set_log_level(level: int) -> None:
     """
     Change the log level for all loggers at runtime.
     
+    Loggers with an override (see set_logger_level) keep their own level.
+    
     Args:
         level: The new logging level (e.g., logging.DEBUG, logging.INFO)
     """
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
-    for handler in root_logger.handlers:
-        handler.setLevel(level)
-    
     logger = get_logger(__name__)
     logger.info(f"Log level changed to: {logging.getLevelName(level)}")
 
 
+def set_logger_level(name: str, level: int | str | None) -> None:
+    """
+    Override the level of one logger (and its children) at runtime.
+    
+    Args:
+        name: Logger name, e.g. "plugins.RanobeDB" or "backend.core.services"
+        level: The level to use, or None to inherit from the parent again
+    
+    Raises:
+        ValueError: If the level is unknown
+    """
+    target = logging.getLogger(name)
+    if level is None:
+        _logger_levels.pop(name, None)
+        target.setLevel(logging.NOTSET)
+        return
+    _logger_levels[name] = parse_level(level)
+    target.setLevel(_logger_levels[name])
+
+
+def get_logger_levels() -> dict[str, str]:
+    """Get the root level and the per-logger overrides, by level name."""
+    levels = {"root": logging.getLevelName(logging.getLogger().level)}
+    levels.update({name: logging.getLevelName(level) for name, level in sorted(_logger_levels.items())})
+    return levels
+
+
 def enable_debug_logging() -> None:
     """Enable debug-level logging."""
     set_log_level(DEBUG_LOG_LEVEL)
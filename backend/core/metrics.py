@@ -0,0 +1,344 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+A minimal registry of counters, gauges and histograms that needs no external
+service or client library: values live in memory and are rendered on demand
+by ``GET /metrics``. Recording a value is a dict lookup and a few additions
+under a lock; gauges that mirror existing state (WebSocket connections,
+notification queues) are read through callbacks at scrape time only.
+
+Instrumented here:
+- HTTP requests: count and latency per route, plus DB queries per request
+  (MetricsMiddleware)
+- DB queries: count and duration (instrument_engine)
+
+Other hot paths (metadata refresh, pipeline stages, scheduler jobs, plugin
+rate limiters) record into the metrics defined below.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Default latency buckets in seconds (Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+# DB queries are much faster than requests
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+# Metadata refreshes and pipeline runs take seconds to hours
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0)
+# Label used for requests that matched no route (404s, SPA fallback is a route)
+UNMATCHED_ROUTE = "<unmatched>"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], object] = {}
+        REGISTRY.register(self)
+
+    def labels(self, *values: str):
+        """Get the child for a combination of label values (strings, created on first use)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames) or not all(isinstance(v, str) for v in values):
+                raise ValueError(f"{self.name} expects string labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, e.g. requests served."""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            yield f"{self.name}{_label_str(self.labelnames, key)} {_format_value(child.value)}"
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...], lock: threading.Lock):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self) -> "_Timer":
+        """Context manager observing the duration of its block."""
+        return _Timer(self)
+
+
+class _Timer:
+    __slots__ = ("child", "start")
+
+    def __init__(self, child: _HistogramChild):
+        self.child = child
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.child.observe(time.perf_counter() - self.start)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (durations, sizes) in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets, self._lock)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        return self.labels().time()
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            with self._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_label_str(self.labelnames, key, le)} {cumulative}"
+            labels = _label_str(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down, read from a callback at scrape time.
+
+    The callback returns a number, or a dict of label values tuple -> number
+    for labelled gauges.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], float | dict[tuple[str, ...], float]],
+        labelnames: Iterable[str] = (),
+    ):
+        self.callback = callback
+        super().__init__(name, documentation, labelnames)
+
+    def _samples(self):
+        value = self.callback()
+        values = value if isinstance(value, dict) else {(): value}
+        for key, number in values.items():
+            yield f"{self.name}{_label_str(self.labelnames, key)} {_format_value(number)}"
+
+
+class Registry:
+    """All metrics of the process, rendered together by /metrics."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests served", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "DB queries executed per HTTP request", ("route",), QUERY_COUNT_BUCKETS
+)
+HTTP_REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds", "Time spent in DB queries per HTTP request", ("route",)
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "DB query execution time", buckets=QUERY_BUCKETS
+)
+RATE_LIMIT_WAIT = Histogram(
+    "plugin_rate_limit_wait_seconds", "Time plugins waited for an outbound rate limit slot", ("plugin",)
+)
+PLUGIN_HTTP_REQUESTS = Counter(
+    "plugin_http_requests_total", "Outbound HTTP calls made by plugins", ("plugin", "outcome")
+)
+METADATA_REFRESH_DURATION = Histogram(
+    "metadata_refresh_duration_seconds",
+    "Metadata refresh duration, per series and per full run",
+    ("scope",),
+    JOB_BUCKETS,
+)
+PIPELINE_STAGE_DURATION = Histogram(
+    "pipeline_stage_duration_seconds", "Pipeline stage duration", ("pipeline", "stage"), JOB_BUCKETS
+)
+SCHEDULER_JOB_RUNS = Counter(
+    "scheduler_job_runs_total", "Scheduler job runs by outcome", ("job", "outcome")
+)
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds", "Scheduler job run duration", ("job",), JOB_BUCKETS
+)
+HEAVY_JOB_WAIT = Histogram(
+    "scheduler_heavy_job_wait_seconds", "Time heavy jobs waited for a free slot", ("job",), JOB_BUCKETS
+)
+
+# (query count, seconds in queries) of the HTTP request being handled, if any
+_request_queries: ContextVar[list | None] = ContextVar("request_queries", default=None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record the count and duration of every query executed through ``engine``."""
+
+    # The start time lives on the execution context, so a failing query
+    # leaves nothing behind on the pooled connection
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._metrics_query_start
+        DB_QUERY_DURATION.observe(elapsed)
+        request = _request_queries.get()
+        if request is not None:
+            request[0] += 1
+            request[1] += elapsed
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    # Routes inside mounts (plugin routers) are relative to the mount
+    return scope.get("root_path", "") + getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request count, latency and DB usage per route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        queries = [0, 0.0]
+        token = _request_queries.set(queries)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_queries.reset(token)
+            # The router records the matched route in the (shared) scope
+            route = _route_label(scope)
+            HTTP_REQUESTS.labels(scope["method"], route, str(status)).inc()
+            HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(elapsed)
+            HTTP_REQUEST_DB_QUERIES.labels(route).observe(queries[0])
+            HTTP_REQUEST_DB_DURATION.labels(route).observe(queries[1])
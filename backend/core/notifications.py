@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections import deque
 from fastapi import WebSocket
 from sqlmodel import Session
 
@@ -9,44 +11,230 @@ from backend.core.database.models import (
     Notification,
 )
 from backend.core.logging_config import get_logger
+from backend.core.metrics import Gauge
 
 
 logger = get_logger(__name__)
 
+# Max notifications buffered per WebSocket before the oldest are dropped
+SEND_QUEUE_SIZE = 100
+# A client that can't accept a message within this time is considered dead
+SEND_TIMEOUT_SECONDS = 5.0
+# Notifications broadcast within this window are persisted and coalesced together
+FLUSH_INTERVAL_SECONDS = 0.25
+
+
+class _Connection:
+    """A connected WebSocket with its own bounded send queue and sender task."""
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.queue: deque[dict] = deque(maxlen=SEND_QUEUE_SIZE)
+        self.ready = asyncio.Event()
+        self.dropped = 0
+        self.task: asyncio.Task | None = None
+
+    def enqueue(self, payload: dict) -> None:
+        if len(self.queue) == self.queue.maxlen:
+            # deque drops the oldest entry on append
+            self.dropped += 1
+        self.queue.append(payload)
+        self.ready.set()
+
 
 class NotificationManager:
+    """
+    Notification bus for persisting and pushing notifications to WebSocket clients.
+
+    - Each connection has its own bounded queue and sender task, so a slow
+      client never blocks the others. When a client falls behind, the oldest
+      queued messages are dropped and replaced by a single summary.
+    - Broadcasts are buffered for FLUSH_INTERVAL_SECONDS and written to the
+      database in a single transaction.
+    - Broadcasts sharing a ``coalesce_key`` within one flush window are merged
+      into a single summary message (e.g. "12 new releases added to 'X'.").
+    - Sockets that error or time out are pruned automatically.
+    """
+
     def __init__(self) -> None:
         self.active_connections: list[WebSocket] = []
+        self._connections: dict[WebSocket, _Connection] = {}
+        self._pending: list[tuple[NotificationMessage, str | None, str | None]] = []
+        self._flush_task: asyncio.Task | None = None
         logger.debug("NotificationManager initialized")
 
+    @property
+    def pending_count(self) -> int:
+        """Number of broadcasts waiting to be persisted and sent."""
+        return len(self._pending)
+
+    @property
+    def queued_count(self) -> int:
+        """Total number of messages waiting in per-connection send queues."""
+        return sum(len(conn.queue) for conn in self._connections.values())
+
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
+        conn = _Connection(websocket)
+        conn.task = asyncio.create_task(self._sender(conn))
+        self._connections[websocket] = conn
         self.active_connections.append(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
+        conn = self._connections.pop(websocket, None)
+        if conn is None:
+            # Already pruned by its sender task
+            return
         self.active_connections.remove(websocket)
+        if conn.task and conn.task is not asyncio.current_task():
+            conn.task.cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def broadcast(self, notification: NotificationMessage) -> None:
+    async def broadcast(
+        self,
+        notification: NotificationMessage,
+        coalesce_key: str | None = None,
+        summary: str | None = None,
+    ) -> None:
+        """
+        Queue a notification for persistence and delivery.
+
+        Args:
+            notification: The notification to send
+            coalesce_key: Optional key; notifications sharing it within one flush
+                window are merged into a single message
+            summary: Message for the merged notification; ``{count}`` is
+                replaced by the number of merged notifications, any other
+                braces (e.g. in series titles) are kept. Required for coalescing.
+        """
         logger.info(f"Broadcasting notification [{notification.type}]: {notification.message}")
-        
+        self._pending.append((notification, coalesce_key, summary))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def flush(self) -> None:
+        """Persist and deliver all pending notifications immediately."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        try:
+            messages = self._coalesce(batch)
+        except Exception as e:
+            # Deliver the batch unmerged rather than dropping it
+            logger.error(f"Error coalescing {len(batch)} notifications: {e}", exc_info=True)
+            messages = [notification for notification, _, _ in batch]
+
+        try:
+            await asyncio.to_thread(self._persist, messages)
+        except Exception as e:
+            logger.error(f"Error persisting {len(messages)} notifications: {e}", exc_info=True)
+
+        for message in messages:
+            payload = {"event": "notification", "payload": message.model_dump_json()}
+            for conn in self._connections.values():
+                conn.enqueue(payload)
+
+    def send_event(self, event: str, payload: str) -> None:
+        """Push a non-notification event (e.g. task progress) to every client, without persisting it."""
+        for conn in self._connections.values():
+            conn.enqueue({"event": event, "payload": payload})
+
+    async def shutdown(self) -> None:
+        """Flush pending notifications and stop all sender tasks."""
+        if self._flush_task and not self._flush_task.done():
+            # Cancelling could drop a batch it already took and is persisting;
+            # waiting costs at most one flush interval
+            await self._flush_task
+        await self.flush()
+        for websocket in list(self._connections):
+            self.disconnect(websocket)
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        await self.flush()
+
+    @staticmethod
+    def _coalesce(
+        batch: list[tuple[NotificationMessage, str | None, str | None]],
+    ) -> list[NotificationMessage]:
+        """Merge notifications sharing a coalesce key, preserving first-seen order."""
+        messages: list[NotificationMessage] = []
+        groups: dict[str, tuple[int, int, str]] = {}  # key -> (index, count, summary)
+
+        for notification, coalesce_key, summary in batch:
+            if coalesce_key is None or summary is None:
+                messages.append(notification)
+                continue
+            if coalesce_key not in groups:
+                groups[coalesce_key] = (len(messages), 1, summary)
+                messages.append(notification)
+                continue
+            index, count, first_summary = groups[coalesce_key]
+            groups[coalesce_key] = (index, count + 1, first_summary)
+
+        for index, count, summary in groups.values():
+            if count > 1:
+                messages[index] = NotificationMessage(
+                    message=summary.replace("{count}", str(count)),
+                    type=messages[index].type,
+                )
+        return messages
+
+    @staticmethod
+    def _persist(messages: list[NotificationMessage]) -> None:
         with Session(engine) as session:
-            notif = Notification(
-                message=notification.message,
-                type=notification.type,
+            session.add_all(
+                Notification(message=m.message, type=m.type) for m in messages
             )
-            session.add(notif)
             session.commit()
-            session.refresh(notif)
 
-        for connection in self.active_connections:
+    async def _sender(self, conn: _Connection) -> None:
+        """Drain one connection's queue; prune the socket on error or timeout."""
+        try:
+            while True:
+                await conn.ready.wait()
+                while conn.queue:
+                    if conn.dropped:
+                        skipped = NotificationMessage(
+                            message=f"{conn.dropped} older notification(s) were skipped. See notification history.",
+                            type=NotificationType.WARNING,
+                        )
+                        conn.dropped = 0
+                        await asyncio.wait_for(
+                            conn.websocket.send_json(
+                                {"event": "notification", "payload": skipped.model_dump_json()}
+                            ),
+                            SEND_TIMEOUT_SECONDS,
+                        )
+                    payload = conn.queue.popleft()
+                    await asyncio.wait_for(
+                        conn.websocket.send_json(payload), SEND_TIMEOUT_SECONDS
+                    )
+                conn.ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Pruning dead WebSocket connection: {e!r}")
+            self.disconnect(conn.websocket)
             try:
-                await connection.send_json(
-                    {"event": "notification", "payload": notification.model_dump_json()}
-                )
-            except Exception as e:
-                logger.error(f"Error sending notification to WebSocket: {e}", exc_info=True)
+                await conn.websocket.close()
+            except Exception:
+                pass
 
 
 notification_manager = NotificationManager()
+
+Gauge(
+    "websocket_connections",
+    "Connected notification WebSocket clients",
+    lambda: len(notification_manager.active_connections),
+)
+Gauge(
+    "notification_queue_depth",
+    "Notifications waiting to be persisted (pending) or sent to clients (send)",
+    lambda: {("pending",): notification_manager.pending_count, ("send",): notification_manager.queued_count},
+    ("queue",),
+)
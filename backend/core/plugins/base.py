@@ -191,6 +191,9 @@ class BasePlugin(ABC):
             - 'func': Callable to execute
             - 'trigger': Trigger type (e.g. 'interval', 'cron')
             - Additional trigger parameters
+            - 'heavy' (optional): True for long, DB or network heavy jobs, which
+              share a concurrency budget and should yield to API requests
+              (see backend.core.jobs)
 
         Returns:
             List of job definitions
@@ -0,0 +1,435 @@
+"""
+On-demand profiling of scheduled jobs and API routes.
+
+Disabled unless the PROFILING_TOKEN environment variable is set; the API then
+requires that token in the ``X-Profiling-Token`` header. While disabled no
+hooks are installed at all, and while enabled but idle the only cost is an
+empty-dict check per request:
+
+- Arming a job points it at ``run_profiled_job`` (with the original function
+  as an argument) for the next N runs, then restores the original. Both are
+  referenced by name, so this works with the persistent job store.
+- Arming a route makes ProfilingMiddleware profile the next N requests
+  matching the route template.
+- SQL statements and their timings are collected through engine events
+  that are only registered while a capture runs.
+
+Each capture is written to PROFILE_DIR as a pstats file and can be downloaded
+as pstats, speedscope JSON or a JSON summary (top functions, SQL).
+
+cProfile profiles a whole thread, so profiling an async job or route also
+records whatever else runs on the event loop meanwhile, and work handed to
+the threadpool (sync dependencies, ``asyncio.to_thread``) shows up only as
+time waited; its SQL statements are still recorded. Only one capture runs at
+a time; executions arriving while one is active run unprofiled and don't use
+up the request.
+"""
+
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.core.constants import MOUNT_DIR
+from backend.core.exceptions import InvalidStateError, ResourceNotFoundError, ValidationError
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+PROFILING_TOKEN_ENV = "PROFILING_TOKEN"
+PROFILE_DIR = MOUNT_DIR / "profiles"
+# Upper bound for one profiling request
+MAX_PROFILE_RUNS = 20
+# Captures kept (in memory and on disk); the oldest are deleted first
+MAX_CAPTURES = 50
+# SQL statements recorded per capture
+MAX_SQL_STATEMENTS = 2000
+# Functions listed in a capture summary
+SUMMARY_FUNCTIONS = 25
+# Stack depth of the speedscope export
+SPEEDSCOPE_MAX_DEPTH = 64
+
+PROFILE_KINDS = ("job", "route")
+
+# SQL statements of the capture running in this context, if any
+_sql_capture: ContextVar[list | None] = ContextVar("sql_capture", default=None)
+
+
+@dataclass
+class ProfileRequest:
+    id: uuid.UUID
+    kind: str  # "job" or "route"
+    target: str  # Job ID or route template, e.g. "/api/v1/series/{series_id}"
+    remaining: int
+    collect_sql: bool = True
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    capture_ids: list[uuid.UUID] = field(default_factory=list)
+
+
+@dataclass
+class Capture:
+    id: uuid.UUID
+    request_id: uuid.UUID
+    kind: str
+    target: str
+    started_at: datetime
+    duration_seconds: float
+    path: Path
+    sql: list[dict] = field(default_factory=list)
+    sql_dropped: int = 0
+    error: str | None = None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "request_id": str(self.request_id),
+            "kind": self.kind,
+            "target": self.target,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(self.duration_seconds, 6),
+            "sql_statements": len(self.sql) + self.sql_dropped,
+            "sql_seconds": round(sum(s["duration_seconds"] for s in self.sql), 6),
+            "error": self.error,
+        }
+
+
+def _function_name(func: tuple[str, int, str]) -> str:
+    filename, line, name = func
+    return name if filename == "~" else f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def top_functions(stats: pstats.Stats, limit: int = SUMMARY_FUNCTIONS) -> list[dict]:
+    """The functions with the highest cumulative time."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": _function_name(func),
+            "calls": nc,
+            "total_seconds": round(tt, 6),
+            "cumulative_seconds": round(ct, 6),
+        }
+        for func, (cc, nc, tt, ct, callers) in rows
+    ]
+
+
+def to_speedscope(stats: pstats.Stats, name: str) -> dict:
+    """
+    Convert pstats to a speedscope "sampled" profile.
+
+    cProfile only records caller -> callee edges, so stacks are rebuilt from
+    the roots by splitting each function's time over its call sites in
+    proportion to the time spent through each edge (like flameprof).
+    """
+    frames: list[dict] = []
+    frame_index: dict[tuple, int] = {}
+    children: dict[tuple, list[tuple[tuple, float]]] = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+
+    def index(func: tuple) -> int:
+        if func not in frame_index:
+            frame_index[func] = len(frames)
+            filename, line, funcname = func
+            frames.append({"name": funcname, "file": filename, "line": line})
+        return frame_index[func]
+
+    samples: list[list[int]] = []
+    weights: list[float] = []
+
+    def walk(func: tuple, share: float, stack: list[int]) -> None:
+        cc, nc, tt, ct, callers = stats.stats[func]
+        stack = [*stack, index(func)]
+        scale = share / ct if ct else 0.0
+        if tt * scale > 0:
+            samples.append(stack)
+            weights.append(tt * scale)
+        if len(stack) >= SPEEDSCOPE_MAX_DEPTH:
+            return
+        for child, edge_time in children.get(func, []):
+            if child in stats.stats and frame_index.get(child) not in stack and edge_time * scale > 0:
+                walk(child, edge_time * scale, stack)
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, ct, [])
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+        "name": name,
+        "exporter": "ln-auto",
+    }
+
+
+class Profiler:
+    """Profiling requests, the running capture and finished captures."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.token: str | None = None
+        self._scheduler = None
+        self._engine: Engine | None = None
+        self.requests: dict[uuid.UUID, ProfileRequest] = {}
+        # Route template -> request, checked by ProfilingMiddleware on every request
+        self.route_requests: dict[str, ProfileRequest] = {}
+        # Job ID -> original function and arguments while the job is armed
+        self._job_funcs: dict[str, tuple[Callable, tuple]] = {}
+        self.captures: OrderedDict[uuid.UUID, Capture] = OrderedDict()
+        self._active = False
+        self._lock = threading.Lock()
+
+    def enable(self, token: str, scheduler, engine: Engine) -> None:
+        self.enabled = True
+        self.token = token
+        self._scheduler = scheduler
+        self._engine = engine
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        logger.info("Profiling API enabled")
+
+    # -- Requests --
+
+    def arm(self, kind: str, target: str, count: int = 1, collect_sql: bool = True) -> ProfileRequest:
+        """Profile the next `count` executions of a scheduler job or API route."""
+        if not self.enabled:
+            raise InvalidStateError("Profiling is disabled")
+        if kind not in PROFILE_KINDS:
+            raise ValidationError(f"Kind must be one of {', '.join(PROFILE_KINDS)}")
+        if not 1 <= count <= MAX_PROFILE_RUNS:
+            raise ValidationError(f"Count must be between 1 and {MAX_PROFILE_RUNS}")
+        if any(r.kind == kind and r.target == target for r in self.requests.values()):
+            raise ValidationError(f"{kind.capitalize()} '{target}' is already being profiled")
+
+        request = ProfileRequest(uuid.uuid4(), kind, target, count, collect_sql)
+        if kind == "job":
+            job = self._scheduler.get_job(target)
+            if job is None:
+                raise ResourceNotFoundError("Job", target)
+            self._job_funcs[target] = (job.func, job.args)
+            self._scheduler.modify_job(
+                target, func=run_profiled_job, args=(str(request.id), job.func, *job.args)
+            )
+        else:
+            self.route_requests[target] = request
+        self.requests[request.id] = request
+        logger.info(f"Profiling next {count} run(s) of {kind} '{target}'")
+        return request
+
+    def cancel(self, request_id: uuid.UUID) -> None:
+        request = self.requests.get(request_id)
+        if request is None:
+            raise ResourceNotFoundError("Profiling request", str(request_id))
+        self._finish(request)
+
+    def _finish(self, request: ProfileRequest) -> None:
+        self.requests.pop(request.id, None)
+        if request.kind == "route":
+            self.route_requests.pop(request.target, None)
+            return
+        original = self._job_funcs.pop(request.target, None)
+        if original is not None and self._scheduler.get_job(request.target) is not None:
+            func, args = original
+            self._scheduler.modify_job(request.target, func=func, args=args)
+
+    def _claim(self, request: ProfileRequest) -> bool:
+        """Take one run of a request, unless another capture is running."""
+        with self._lock:
+            if self._active or request.remaining <= 0:
+                return False
+            self._active = True
+            request.remaining -= 1
+            return True
+
+    # -- Capturing --
+
+    def _run_sync_job(self, request: ProfileRequest | None, func: Callable, args, kwargs) -> Any:
+        if request is None or not self._claim(request):
+            return func(*args, **kwargs)
+        with self._capture(request):
+            return func(*args, **kwargs)
+
+    @staticmethod
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        if _sql_capture.get() is not None:
+            conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        statements = _sql_capture.get()
+        starts = conn.info.get("profile_query_start")
+        if statements is None or not starts:
+            return
+        statements.append((statement, time.perf_counter() - starts.pop()))
+
+    def _capture(self, request: ProfileRequest) -> "_Capture":
+        return _Capture(self, request)
+
+    def _save(self, context, duration: float, exc: BaseException | None) -> None:
+        request = context.request
+        capture_id = uuid.uuid4()
+        path = PROFILE_DIR / f"{capture_id}.prof"
+        context.profile.dump_stats(path)
+        statements = context.statements or []
+        capture = Capture(
+            id=capture_id,
+            request_id=request.id,
+            kind=request.kind,
+            target=request.target,
+            started_at=context.started_at,
+            duration_seconds=duration,
+            path=path,
+            sql=[
+                {"statement": statement, "duration_seconds": round(elapsed, 6)}
+                for statement, elapsed in statements[:MAX_SQL_STATEMENTS]
+            ],
+            sql_dropped=max(0, len(statements) - MAX_SQL_STATEMENTS),
+            error=repr(exc) if exc else None,
+        )
+        self.captures[capture_id] = capture
+        request.capture_ids.append(capture_id)
+        while len(self.captures) > MAX_CAPTURES:
+            _, old = self.captures.popitem(last=False)
+            old.path.unlink(missing_ok=True)
+        logger.info(
+            f"Profiled {request.kind} '{request.target}' in {duration:.3f}s "
+            f"({len(statements)} SQL statements), capture {capture_id}"
+        )
+
+    # -- Results --
+
+    def get_capture(self, capture_id: uuid.UUID) -> Capture:
+        capture = self.captures.get(capture_id)
+        if capture is None or not capture.path.is_file():
+            raise ResourceNotFoundError("Profile capture", str(capture_id))
+        return capture
+
+    def export(self, capture_id: uuid.UUID, fmt: str) -> tuple[bytes | dict, str]:
+        """
+        Get a capture as "pstats" (binary), "speedscope" or "summary".
+
+        Returns:
+            The content and its media type
+        """
+        capture = self.get_capture(capture_id)
+        if fmt == "pstats":
+            return capture.path.read_bytes(), "application/octet-stream"
+
+        stats = pstats.Stats(str(capture.path), stream=io.StringIO())
+        if fmt == "speedscope":
+            return to_speedscope(stats, f"{capture.kind} {capture.target}"), "application/json"
+        if fmt == "summary":
+            slowest = sorted(capture.sql, key=lambda s: s["duration_seconds"], reverse=True)
+            return {
+                **capture.summary(),
+                "top_functions": top_functions(stats),
+                "sql": capture.sql,
+                "slowest_sql": slowest[:SUMMARY_FUNCTIONS],
+                "sql_dropped": capture.sql_dropped,
+            }, "application/json"
+        raise ValidationError("Format must be one of pstats, speedscope, summary")
+
+    def match_route(self, scope: Scope) -> ProfileRequest | None:
+        """The armed request whose route template matches this HTTP request, if any."""
+        for route in scope["app"].routes:
+            path = getattr(route, "path", None)
+            request = self.route_requests.get(path)
+            if request is not None and route.matches(scope)[0] == Match.FULL:
+                return request
+        return None
+
+
+class _Capture:
+    """Profile a block for a request; a sync context manager, usable around awaits."""
+
+    def __init__(self, profiler: Profiler, request: ProfileRequest):
+        self.profiler = profiler
+        self.request = request
+
+    def __enter__(self) -> "_Capture":
+        engine = self.profiler._engine
+        self.statements = [] if self.request.collect_sql else None
+        if self.statements is not None:
+            event.listen(engine, "before_cursor_execute", Profiler._before_execute)
+            event.listen(engine, "after_cursor_execute", Profiler._after_execute)
+        self.token = _sql_capture.set(self.statements)
+        self.started_at = datetime.now(timezone.utc)
+        self.start = time.perf_counter()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.profile.disable()
+        duration = time.perf_counter() - self.start
+        _sql_capture.reset(self.token)
+        profiler = self.profiler
+        if self.statements is not None:
+            event.remove(profiler._engine, "before_cursor_execute", Profiler._before_execute)
+            event.remove(profiler._engine, "after_cursor_execute", Profiler._after_execute)
+        try:
+            profiler._save(self, duration, exc)
+        finally:
+            with profiler._lock:
+                profiler._active = False
+            if self.request.remaining <= 0:
+                profiler._finish(self.request)
+        return False
+
+
+profiler = Profiler()
+
+
+async def run_profiled_job(request_id: str, func: Callable, *args, **kwargs) -> Any:
+    """Scheduled in place of an armed job's function (see Profiler.arm)."""
+    request = profiler.requests.get(uuid.UUID(request_id))
+    if not asyncio.iscoroutinefunction(func):
+        # Sync jobs run in the threadpool, where cProfile has to be enabled
+        return await asyncio.to_thread(profiler._run_sync_job, request, func, args, kwargs)
+    if request is None or not profiler._claim(request):
+        return await func(*args, **kwargs)
+    with profiler._capture(request):
+        return await func(*args, **kwargs)
+
+
+class ProfilingMiddleware:
+    """Profile requests to armed routes; only installed when profiling is enabled."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not profiler.route_requests or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = profiler.match_route(scope)
+        if request is None or not profiler._claim(request):
+            await self.app(scope, receive, send)
+            return
+        with profiler._capture(request):
+            await self.app(scope, receive, send)
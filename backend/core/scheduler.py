@@ -4,7 +4,11 @@ from datetime import date
 
 from fastapi import HTTPException, Depends
 from sqlmodel import Session, select
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from backend.core.database.database import engine
 from backend.core.database.models import (
@@ -14,29 +18,57 @@ from backend.core.database.models import (
     Series,
     MetadataSource,
 )
-from backend.core.services import metadata_service
+from backend.core.services import metadata_service, notification_service
 from backend.core.notifications import notification_manager
 from backend.core.database.models import NotificationType
-from backend.core.services.library_service import get_all_series_groups
+from backend.core.services.library_service import (
+    get_all_series_groups,
+    recompute_download_statuses,
+)
 from backend.core.logging_config import get_logger
+from backend.core.metrics import METADATA_REFRESH_DURATION
+from backend.core.jobs import (
+    JOB_DEFAULTS,
+    JOB_METADATA,
+    JOB_TABLE,
+    MEMORY_JOBSTORE,
+    add_persistent_job,
+    heavy_job,
+    interval_jitter,
+    job_history,
+    yield_to_interactive,
+)
+from backend.plugin_manager import plugin_manager
 
 
 logger = get_logger(__name__)
 
-scheduler = AsyncIOScheduler()
+scheduler = AsyncIOScheduler(
+    jobstores={
+        "default": SQLAlchemyJobStore(engine=engine, tablename=JOB_TABLE, metadata=JOB_METADATA),
+        MEMORY_JOBSTORE: MemoryJobStore(),
+    },
+    job_defaults=JOB_DEFAULTS,
+)
+job_history.attach(scheduler)
 
 ## TODO: Make interval configurable once configs are implemented
 UPDATE_SERIES_INTERVAL_MINUTES = 6 * 60  # Update series every 6 hours
+NOTIFICATION_MAX_AGE_DAYS = 30
+NOTIFICATION_MAX_ROWS = 10_000
 
 
+@heavy_job
 async def update_all_series_metadata():
     logger.info("Starting scheduled metadata update for all series...")
-    with Session(engine) as session:
+    with METADATA_REFRESH_DURATION.labels("all").time(), Session(engine) as session:
         series_list = session.exec(select(Series)).all()
 
         logger.info(f"Found {len(series_list)} series to update")
 
         for series in series_list:
+            await yield_to_interactive()
+
             # Skip series without metadata source or external_id
             if not series.metadata_source or not series.external_id:
                 logger.debug(f"Skipping series {series.id} ({series.title}) - no metadata source or external ID")
@@ -50,9 +82,10 @@ async def update_all_series_metadata():
 
             try:
                 logger.debug(f"Updating series {series.id} ({series.title})")
-                success = await metadata_service.fetch_series(
-                    str(metadata_source.id), series.external_id, session=session
-                )
+                with METADATA_REFRESH_DURATION.labels("series").time():
+                    success = await metadata_service.fetch_series(
+                        str(metadata_source.id), series.external_id, session=session
+                    )
 
                 if not success:
                     logger.warning(f"Failed to update series {series.id} ({series.title})")
@@ -86,5 +119,56 @@ async def check_release_day():
                 NotificationMessage(
                     type=NotificationType.INFO,
                     message=f"New release today: {release.title} for book {release.book.title if release.book else 'Unknown'}",
-                )
+                ),
+                coalesce_key="release-day",
+                summary="{count} new releases today.",
             )
+
+        # Books released today move into the "released" set, so statuses may shift
+        changed = recompute_download_statuses(session)
+        session.commit()
+        logger.info(f"Download status changed for {changed} series")
+
+
+async def prune_old_notifications():
+    logger.info("Applying notification retention policy...")
+    with Session(engine) as session:
+        notification_service.prune_notifications(
+            session,
+            max_age_days=NOTIFICATION_MAX_AGE_DAYS,
+            max_rows=NOTIFICATION_MAX_ROWS,
+        )
+
+
+def schedule_core_jobs() -> None:
+    """Add the built-in jobs; call with the scheduler started (paused)."""
+    # Run late rather than skip: after downtime the refresh and release check
+    # run once (coalesced) on start instead of waiting for the next slot
+    add_persistent_job(
+        scheduler,
+        update_all_series_metadata,
+        IntervalTrigger(
+            minutes=UPDATE_SERIES_INTERVAL_MINUTES,
+            jitter=interval_jitter(minutes=UPDATE_SERIES_INTERVAL_MINUTES),
+        ),
+        id="update_all_series_metadata",
+        misfire_grace_time=None,
+    )
+    add_persistent_job(
+        scheduler,
+        check_release_day,
+        CronTrigger(hour=0, minute=0),
+        id="check_release_day",
+        misfire_grace_time=None,
+    )
+    add_persistent_job(
+        scheduler, prune_old_notifications, CronTrigger(hour=3, minute=0), id="prune_old_notifications"
+    )
+    scheduler.add_job(
+        plugin_manager.unload_idle_plugins,
+        "interval",
+        minutes=1,
+        id="unload_idle_plugins",
+        jobstore=MEMORY_JOBSTORE,
+        replace_existing=True,
+    )
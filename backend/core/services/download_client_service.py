@@ -129,7 +129,7 @@ async def send_to_download_client(
                 continue
             
             # Get the plugin instance
-            plugin = plugin_manager.get_plugin(client.plugin.name)
+            plugin = await plugin_manager.ensure_loaded(client.plugin.name)
             if not plugin:
                 logger.error(f"Plugin not found: {client.plugin.name}")
                 continue
@@ -0,0 +1,175 @@
+"""Service for serving metadata source images and their resized thumbnails."""
+
+import os
+import time
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+from backend.core.constants import MOUNT_DIR
+from backend.core.database.models import MetadataSource, Plugin
+from backend.core.exceptions import ResourceNotFoundError, ValidationError
+from backend.core.plugins.metadata import MetadataPlugin
+from backend.core.logging_config import get_logger
+from backend.plugin_manager import plugin_manager
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - thumbnails are skipped without Pillow
+    Image = None
+
+
+logger = get_logger(__name__)
+
+# How long a resolved (plugin, source) -> data directory mapping is reused
+SOURCE_CACHE_TTL_SECONDS = 300
+# Widths thumbnails can be requested at
+THUMBNAIL_WIDTHS = (200, 400)
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_DIR = MOUNT_DIR / "cache" / "thumbnails"
+# Image paths are content addressed by the metadata sources, so browsers never need to revalidate
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_data_dirs: dict[tuple[str, str], tuple[float, Path]] = {}  # (plugin, source) -> (expires, data dir)
+
+
+def invalidate_image_sources(plugin_name: str | None = None) -> None:
+    """Forget cached data directories, for one plugin or all of them."""
+    for key in list(_data_dirs):
+        if plugin_name is None or key[0] == plugin_name:
+            del _data_dirs[key]
+
+
+def _on_plugin_event(event: str, plugin_name: str, plugin_instance) -> None:
+    invalidate_image_sources(plugin_name)
+
+
+plugin_manager.add_listener(_on_plugin_event)
+
+
+async def get_source_data_dir(session: Session, plugin_name: str, source_name: str) -> Path:
+    """
+    Get the resolved data directory of an enabled metadata source.
+
+    The lookup (a join query plus creating and stopping a source instance) is
+    cached for SOURCE_CACHE_TTL_SECONDS and dropped when the plugin is
+    (re)loaded or unloaded.
+    """
+    key = (plugin_name, source_name)
+    cached = _data_dirs.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    metadata_source = session.exec(
+        select(MetadataSource)
+        .join(Plugin)
+        .where(Plugin.name == plugin_name, MetadataSource.name == source_name)
+    ).first()
+    if not metadata_source or not metadata_source.enabled:
+        raise ResourceNotFoundError("Metadata source")
+
+    plugin = await plugin_manager.ensure_loaded(plugin_name)
+    if not plugin:
+        raise ResourceNotFoundError("Plugin")
+
+    source_instance = None
+    try:
+        source_instance = plugin.create_metadata_source(metadata_source.config or {})
+        if not isinstance(source_instance, MetadataPlugin) or not hasattr(source_instance, "data_dir"):
+            raise ResourceNotFoundError("Metadata plugin")
+        data_dir = Path(source_instance.data_dir).resolve()
+    finally:
+        if source_instance and hasattr(source_instance, "stop"):
+            source_instance.stop()
+
+    _data_dirs[key] = (time.monotonic() + SOURCE_CACHE_TTL_SECONDS, data_dir)
+    return data_dir
+
+
+def resolve_image(data_dir: Path, filepath: str) -> tuple[Path, os.stat_result]:
+    """Resolve an image path inside a source's data directory, with a single stat."""
+    img_path = (data_dir / filepath).resolve()
+    if not img_path.is_relative_to(data_dir):
+        raise ResourceNotFoundError("File")
+    try:
+        stat_result = img_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise ResourceNotFoundError("File")
+    if not os.path.isfile(img_path):
+        raise ValidationError("Not a file")
+    return img_path, stat_result
+
+
+def cache_headers(stat_result: os.stat_result, variant: str = "") -> dict[str, str]:
+    """Strong ETag, Last-Modified and Cache-Control headers for an image file."""
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}{variant}"'
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": IMAGE_CACHE_CONTROL,
+    }
+
+
+def is_not_modified(headers: dict[str, str], if_none_match: str | None, if_modified_since: str | None) -> bool:
+    """Whether a conditional request can be answered with 304 Not Modified."""
+    if if_none_match is not None:
+        return if_none_match.strip() == "*" or headers["ETag"] in {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+    if if_modified_since is not None:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(headers["Last-Modified"])
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def validate_thumbnail_width(width: int) -> None:
+    if width not in THUMBNAIL_WIDTHS:
+        raise ValidationError(f"Thumbnail width must be one of {', '.join(map(str, THUMBNAIL_WIDTHS))}")
+
+
+def get_thumbnail(
+    img_path: Path, stat_result: os.stat_result, cache_key: str, width: int
+) -> tuple[Path, os.stat_result] | None:
+    """
+    Get a WebP thumbnail of an image, generating and caching it on first use.
+
+    Thumbnails live under THUMBNAIL_DIR and are regenerated when the source
+    image is newer. Blocking; call from a worker thread.
+
+    Returns:
+        The thumbnail path and stat, or None when the original should be served
+        (Pillow missing, image not wider than ``width`` or not decodable)
+    """
+    validate_thumbnail_width(width)
+    if Image is None:
+        return None
+
+    thumb_path = THUMBNAIL_DIR / f"{cache_key}.w{width}.webp"
+    try:
+        thumb_stat = thumb_path.stat()
+        if thumb_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+            return thumb_path, thumb_stat
+    except FileNotFoundError:
+        pass
+
+    # Write to a unique temp file so concurrent requests never see a partial thumbnail
+    tmp_path = thumb_path.with_name(f".{uuid.uuid4().hex}.tmp")
+    try:
+        with Image.open(img_path) as img:
+            if img.width <= width:
+                return None
+            img.thumbnail((width, img.height * width // img.width + 1))
+            thumb_path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(tmp_path, "WEBP", quality=THUMBNAIL_QUALITY)
+        os.replace(tmp_path, thumb_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Could not create {width}px thumbnail of {img_path}: {e}")
+        return None
+
+    logger.debug(f"Created {width}px thumbnail of {img_path}")
+    return thumb_path, thumb_path.stat()
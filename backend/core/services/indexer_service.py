@@ -49,7 +49,7 @@ async def get_feed(indexer_id, session: Session = Depends(get_session)):
         return None
     
     # Get the plugin instance
-    plugin = plugin_manager.get_plugin(indexer.plugin.name)
+    plugin = await plugin_manager.ensure_loaded(indexer.plugin.name)
     if not plugin:
         return None
     
@@ -128,7 +128,7 @@ async def search_indexer(indexer_id, query, session: Session = Depends(get_sessi
         return None
     
     # Get the plugin instance
-    plugin = plugin_manager.get_plugin(indexer.plugin.name)
+    plugin = await plugin_manager.ensure_loaded(indexer.plugin.name)
     if not plugin:
         return None
     
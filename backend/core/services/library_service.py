@@ -1,4 +1,7 @@
-from sqlmodel import Session, select
+import logging
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select, func, case, and_, update, text
 from uuid import UUID
 from datetime import date
 
@@ -11,8 +14,14 @@ from backend.core.database.models import (
     DownloadStatus,
     PublishingStatus,
     LanguageCode,
+    LibrarySearchResult,
 )
-from backend.core.exceptions import ResourceNotFoundError, InvalidStateError
+from backend.core.database import search
+from backend.core.exceptions import ResourceNotFoundError, InvalidStateError, ValidationError
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
 
 
 def _get_earliest_english_release_date(book) -> date | None:
@@ -30,6 +39,73 @@ def _get_earliest_english_release_date(book) -> date | None:
     return min(release_dates) if release_dates else None
 
 
+def _determine_download_status(
+    publishing_status: PublishingStatus | None,
+    *,
+    any_books_downloaded: bool,
+    all_books_downloaded: bool,
+    released_all_downloaded: bool,
+    released_english_downloaded: bool,
+    latest_released_downloaded: bool,
+    latest_released_english_downloaded: bool,
+) -> DownloadStatus:
+    """
+    Decide the download status of a series from its aggregated book flags.
+
+    Shared by the per-series ORM path and the bulk SQL recomputation so both
+    always agree on the resulting status.
+    """
+    if not any_books_downloaded:
+        return DownloadStatus.NONE
+
+    latest_downloaded = latest_released_english_downloaded or latest_released_downloaded
+
+    if publishing_status in {
+        PublishingStatus.COMPLETED,
+        PublishingStatus.CANCELLED,
+    }:
+        if all_books_downloaded:
+            return DownloadStatus.COMPLETED
+        elif released_all_downloaded:
+            return DownloadStatus.CONTINUING_orig
+        elif released_english_downloaded:
+            return DownloadStatus.CONTINUING
+        elif latest_downloaded:
+            return DownloadStatus.MISSING
+        return DownloadStatus.NONE
+
+    if publishing_status == PublishingStatus.ONGOING:
+        if released_all_downloaded:
+            return DownloadStatus.CONTINUING_orig
+        elif released_english_downloaded:
+            return DownloadStatus.CONTINUING
+        elif latest_downloaded:
+            return DownloadStatus.MISSING
+        return DownloadStatus.NONE
+
+    if publishing_status in {
+        PublishingStatus.STALLED,
+        PublishingStatus.HIATUS,
+        PublishingStatus.UNKNOWN,
+    }:
+        if all_books_downloaded:
+            return DownloadStatus.STALLED
+        elif released_all_downloaded:
+            return DownloadStatus.CONTINUING_orig
+        elif released_english_downloaded:
+            return DownloadStatus.CONTINUING
+        elif latest_downloaded:
+            return DownloadStatus.MISSING
+        return DownloadStatus.NONE
+
+    raise InvalidStateError(f"Unhandled publishing status: {publishing_status}")
+
+
+def _latest_book_sort_key(book: Book, release_date: date) -> tuple:
+    """Order books by release date, then sort order (matches the SQL window ordering)."""
+    return (release_date, book.sort_order if book.sort_order is not None else -1)
+
+
 # TODO: Once configs are implemented should make language configurable.
 # TODO: Add downloaded percentage
 def _update_download_status(session: Session, series: Series):
@@ -43,94 +119,51 @@ def _update_download_status(session: Session, series: Series):
     english_books: list[Book] = [b for b in all_books if b.language == LanguageCode.EN]
 
     # Filter books that have been released (release_date is set and in the past)
-    released_books: list[Book] = []
+    released_books: list[tuple[Book, date]] = []
     for b in all_books:
         parsed_date = b.release_date
         if parsed_date is not None and parsed_date <= today:
-            released_books.append(b)
+            released_books.append((b, parsed_date))
 
-    released_english_books: list[Book] = []
+    released_english_books: list[tuple[Book, date]] = []
     for b in english_books:
         earliest_en_release = _get_earliest_english_release_date(b)
         if earliest_en_release is not None and earliest_en_release <= today:
-            released_english_books.append(b)
-
-    # Debug logging
-    # print(f"\n=== Series: {series.title} ===")
-    # print(f"Total books: {len(all_books)}")
-    # print(f"English books: {len(english_books)}")
-    # print(f"Released books: {len(released_books)}")
-    # print(f"Released English books: {len(released_english_books)}")
-    # print(f"Publishing status: {series.publishing_status}")
-
-    for b in released_english_books:
-        print(
-            f"  - {b.title}: downloaded={b.downloaded}, release_date={b.release_date}"
-        )
+            released_english_books.append((b, earliest_en_release))
 
-    all_books_downloaded = all(b.downloaded for b in all_books) if all_books else False
-    released_all_downloaded = (
-        all(b.downloaded for b in released_books) if released_books else False
+    if logger.isEnabledFor(logging.DEBUG):
+        for b, _ in released_english_books:
+            logger.debug(
+                "Released English book %s: downloaded=%s, release_date=%s",
+                b.title, b.downloaded, b.release_date,
+            )
+
+    latest_released = max(
+        released_books, key=lambda item: _latest_book_sort_key(*item), default=None
     )
-    released_english_downloaded = (
-        all(b.downloaded for b in released_english_books)
-        if released_english_books
-        else False
+    latest_released_english = max(
+        released_english_books, key=lambda item: _latest_book_sort_key(*item), default=None
     )
-    any_books_downloaded = any(b.downloaded for b in all_books)
-
-    # print(f"all_books_downloaded: {all_books_downloaded}")
-    # print(f"released_all_downloaded: {released_all_downloaded}")
-    # print(f"released_english_downloaded: {released_english_downloaded}")
-    # print(f"any_books_downloaded: {any_books_downloaded}")
 
-    if not any_books_downloaded:
-        target_status = DownloadStatus.NONE
-
-    elif series.publishing_status in {
-        PublishingStatus.COMPLETED,
-        PublishingStatus.CANCELLED,
-    }:
-        if all_books_downloaded:
-            target_status = DownloadStatus.COMPLETED
-        elif released_all_downloaded:
-            target_status = DownloadStatus.CONTINUING_orig
-        elif released_english_downloaded:
-            target_status = DownloadStatus.CONTINUING
-        elif released_english_books[-1].downloaded or released_books[-1].downloaded:
-            target_status = DownloadStatus.MISSING
-        else:
-            target_status = DownloadStatus.NONE
-
-    elif series.publishing_status == PublishingStatus.ONGOING:
-        if released_all_downloaded:
-            target_status = DownloadStatus.CONTINUING_orig
-        elif released_english_downloaded:
-            target_status = DownloadStatus.CONTINUING
-        elif released_english_books[-1].downloaded or released_books[-1].downloaded:
-            target_status = DownloadStatus.MISSING
-        else:
-            target_status = DownloadStatus.NONE
-
-    elif series.publishing_status in {
-        PublishingStatus.STALLED,
-        PublishingStatus.HIATUS,
-        PublishingStatus.UNKNOWN,
-    }:
-        if all_books_downloaded:
-            target_status = DownloadStatus.STALLED
-        elif released_all_downloaded:
-            target_status = DownloadStatus.CONTINUING_orig
-        elif released_english_downloaded:
-            target_status = DownloadStatus.CONTINUING
-        elif released_english_books[-1].downloaded or released_books[-1].downloaded:
-            target_status = DownloadStatus.MISSING
-        else:
-            target_status = DownloadStatus.NONE
-    else:
-        raise InvalidStateError(f"Unhandled publishing status: {series.publishing_status}")
+    target_status = _determine_download_status(
+        series.publishing_status,
+        any_books_downloaded=any(b.downloaded for b in all_books),
+        all_books_downloaded=all(b.downloaded for b in all_books) if all_books else False,
+        released_all_downloaded=(
+            all(b.downloaded for b, _ in released_books) if released_books else False
+        ),
+        released_english_downloaded=(
+            all(b.downloaded for b, _ in released_english_books)
+            if released_english_books
+            else False
+        ),
+        latest_released_downloaded=bool(latest_released and latest_released[0].downloaded),
+        latest_released_english_downloaded=bool(
+            latest_released_english and latest_released_english[0].downloaded
+        ),
+    )
 
-    print(f"Target status: {target_status}\n")
+    logger.debug("Download status of series %s: %s", series.id, target_status)
 
     series.download_status = target_status
     session.add(series)
@@ -145,6 +178,164 @@ def _update_download_status(session: Session, series: Series):
         session.add(series_group)
 
 
+def recompute_download_statuses(
+    session: Session, series_ids: list[UUID] | None = None
+) -> int:
+    """
+    Recompute the download status of many series at once using aggregate SQL.
+
+    Instead of walking every book and release through the ORM, per-series
+    counts (total/downloaded, released/downloaded, released English/downloaded)
+    and the earliest English release date per book are computed in the
+    database. Only series and series groups whose status actually changed are
+    written back. The caller is responsible for committing.
+
+    Args:
+        session: Database session
+        series_ids: Optional subset of series to recompute. Defaults to the whole library.
+
+    Returns:
+        int: Number of series whose download status changed.
+    """
+    today = date.today()
+
+    # Earliest English release date per book
+    earliest_en = (
+        select(
+            Release.book_id.label("book_id"),
+            func.min(Release.release_date).label("en_release_date"),
+        )
+        .where(
+            Release.book_id.is_not(None),
+            Release.language == LanguageCode.EN,
+            Release.release_date.is_not(None),
+        )
+        .group_by(Release.book_id)
+        .subquery()
+    )
+
+    is_released = and_(Book.release_date.is_not(None), Book.release_date <= today)
+    is_released_en = and_(
+        Book.language == LanguageCode.EN,
+        earliest_en.c.en_release_date.is_not(None),
+        earliest_en.c.en_release_date <= today,
+    )
+
+    def _count(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    # Book rows annotated with their latest-first rank among released books
+    ranked_books = (
+        select(
+            Book.series_id.label("series_id"),
+            Book.downloaded.label("downloaded"),
+            func.row_number()
+            .over(
+                partition_by=Book.series_id,
+                order_by=(Book.release_date.desc(), Book.sort_order.desc()),
+            )
+            .label("rank"),
+        )
+        .where(is_released)
+        .subquery()
+    )
+    ranked_en_books = (
+        select(
+            Book.series_id.label("series_id"),
+            Book.downloaded.label("downloaded"),
+            func.row_number()
+            .over(
+                partition_by=Book.series_id,
+                order_by=(earliest_en.c.en_release_date.desc(), Book.sort_order.desc()),
+            )
+            .label("rank"),
+        )
+        .join(earliest_en, earliest_en.c.book_id == Book.id)
+        .where(is_released_en)
+        .subquery()
+    )
+
+    counts_stmt = (
+        select(
+            Book.series_id,
+            func.count(Book.id),
+            _count(Book.downloaded),
+            _count(is_released),
+            _count(and_(is_released, Book.downloaded)),
+            _count(is_released_en),
+            _count(and_(is_released_en, Book.downloaded)),
+        )
+        .outerjoin(earliest_en, earliest_en.c.book_id == Book.id)
+        .group_by(Book.series_id)
+    )
+    latest_stmt = select(ranked_books.c.series_id, ranked_books.c.downloaded).where(
+        ranked_books.c.rank == 1
+    )
+    latest_en_stmt = select(
+        ranked_en_books.c.series_id, ranked_en_books.c.downloaded
+    ).where(ranked_en_books.c.rank == 1)
+    series_stmt = select(Series.id, Series.publishing_status, Series.download_status)
+
+    if series_ids is not None:
+        if not series_ids:
+            return 0
+        counts_stmt = counts_stmt.where(Book.series_id.in_(series_ids))
+        latest_stmt = latest_stmt.where(ranked_books.c.series_id.in_(series_ids))
+        latest_en_stmt = latest_en_stmt.where(ranked_en_books.c.series_id.in_(series_ids))
+        series_stmt = series_stmt.where(Series.id.in_(series_ids))
+
+    counts = {row[0]: row[1:] for row in session.exec(counts_stmt)}
+    latest_downloaded = {row[0]: bool(row[1]) for row in session.exec(latest_stmt)}
+    latest_en_downloaded = {row[0]: bool(row[1]) for row in session.exec(latest_en_stmt)}
+
+    new_statuses: dict[UUID, DownloadStatus] = {}
+    changed: list[dict] = []
+    for series_id, publishing_status, current_status in session.exec(series_stmt):
+        total, downloaded, released, released_downloaded, released_en, released_en_downloaded = (
+            counts.get(series_id, (0, 0, 0, 0, 0, 0))
+        )
+        target_status = _determine_download_status(
+            publishing_status,
+            any_books_downloaded=downloaded > 0,
+            all_books_downloaded=total > 0 and downloaded == total,
+            released_all_downloaded=released > 0 and released_downloaded == released,
+            released_english_downloaded=released_en > 0 and released_en_downloaded == released_en,
+            latest_released_downloaded=latest_downloaded.get(series_id, False),
+            latest_released_english_downloaded=latest_en_downloaded.get(series_id, False),
+        )
+        new_statuses[series_id] = target_status
+        if target_status != current_status:
+            changed.append({"id": series_id, "download_status": target_status})
+
+    if changed:
+        session.execute(update(Series), changed)
+
+    # Propagate to series groups whose main series was recomputed
+    main_series_keys = {str(series_id): status for series_id, status in new_statuses.items()}
+    group_changes: list[dict] = []
+    if main_series_keys:
+        groups_stmt = select(
+            SeriesGroup.id, SeriesGroup.main_series_id, SeriesGroup.download_status
+        )
+        if series_ids is not None:
+            groups_stmt = groups_stmt.where(
+                SeriesGroup.main_series_id.in_(list(main_series_keys))
+            )
+        for group_id, main_series_id, current_status in session.exec(groups_stmt):
+            target_status = main_series_keys.get(main_series_id)
+            if target_status is not None and target_status != current_status:
+                group_changes.append({"id": group_id, "download_status": target_status})
+
+    if group_changes:
+        session.execute(update(SeriesGroup), group_changes)
+
+    logger.info(
+        f"Recomputed download status for {len(new_statuses)} series: "
+        f"{len(changed)} series and {len(group_changes)} series groups changed"
+    )
+    return len(changed)
+
+
 def get_all_collections(session: Session) -> list[Collection]:
     """Get all collections from the database."""
     collections = session.exec(select(Collection)).all()
@@ -188,8 +379,8 @@ def get_series_by_id(session: Session, series_id: UUID) -> Series:
 
 
 def get_all_books(session: Session) -> list[Book]:
-    """Get all books from the database."""
-    books = session.exec(select(Book)).all()
+    """Get all books from the database, with their releases loaded in one extra query."""
+    books = session.exec(select(Book).options(selectinload(Book.releases))).all()
     return list(books)
 
 
@@ -207,6 +398,104 @@ def get_all_releases(session: Session) -> list[Release]:
     return list(releases)
 
 
+# Minimum share of query trigrams a fuzzy hit must contain
+FUZZY_MIN_SIMILARITY = 0.5
+# How many trigram candidates to score per requested fuzzy result
+FUZZY_CANDIDATE_FACTOR = 5
+
+
+def search_library(
+    session: Session, query: str, limit: int = 25, fuzzy: bool = True
+) -> list[LibrarySearchResult]:
+    """
+    Search series and books in the local library.
+
+    Every query word must match (as a prefix) one of the indexed fields; hits
+    are ranked with bm25, weighting titles above aliases, staff and tags. When
+    ``fuzzy`` is set and fewer than ``limit`` hits were found, the remainder is
+    filled from the trigram index so misspelled titles still match.
+    """
+    if not search.is_search_supported(session.get_bind()):
+        raise InvalidStateError("Library search requires an SQLite database")
+
+    tokens = search.tokenize_query(query)
+    if not tokens:
+        raise ValidationError("Search query must contain at least one word")
+
+    weights = ", ".join(str(w) for w in search.BM25_WEIGHTS)
+    rows = session.execute(
+        text(
+            f"SELECT kind, entity_id, series_id, title, romaji, title_orig, img_url, "
+            f"bm25({search.FTS_TABLE}, {weights}) AS rank "
+            f"FROM {search.FTS_TABLE} WHERE {search.FTS_TABLE} MATCH :match "
+            f"ORDER BY rank LIMIT :limit"
+        ),
+        {"match": search.build_match_query(tokens), "limit": limit},
+    ).all()
+
+    results = [
+        LibrarySearchResult(
+            kind=kind,
+            id=UUID(entity_id),
+            series_id=UUID(series_id),
+            title=title,
+            romaji=romaji,
+            title_orig=title_orig,
+            img_url=img_url,
+            # bm25 is lower-is-better; expose higher-is-better scores
+            score=-rank,
+        )
+        for kind, entity_id, series_id, title, romaji, title_orig, img_url, rank in rows
+    ]
+
+    trigrams = search.query_trigrams(tokens)
+    if fuzzy and len(results) < limit and trigrams:
+        seen = {r.id for r in results}
+        candidates = session.execute(
+            text(
+                f"SELECT f.kind, f.entity_id, f.series_id, f.title, f.romaji, f.title_orig, f.img_url "
+                f"FROM {search.TRIGRAM_TABLE} t JOIN {search.FTS_TABLE} f ON f.rowid = t.rowid "
+                f"WHERE {search.TRIGRAM_TABLE} MATCH :match "
+                f"ORDER BY bm25({search.TRIGRAM_TABLE}) LIMIT :limit"
+            ),
+            {
+                "match": search.build_trigram_query(trigrams),
+                "limit": limit * FUZZY_CANDIDATE_FACTOR,
+            },
+        ).all()
+
+        fuzzy_results = []
+        for kind, entity_id, series_id, title, romaji, title_orig, img_url in candidates:
+            entity_uuid = UUID(entity_id)
+            if entity_uuid in seen:
+                continue
+            # Share of the query's trigrams found in the best matching title field
+            similarity = max(
+                len(trigrams & search.query_trigrams(search.tokenize_query(field))) / len(trigrams)
+                for field in (title, romaji or "", title_orig or "")
+            )
+            if similarity < FUZZY_MIN_SIMILARITY:
+                continue
+            fuzzy_results.append(
+                LibrarySearchResult(
+                    kind=kind,
+                    id=entity_uuid,
+                    series_id=UUID(series_id),
+                    title=title,
+                    romaji=romaji,
+                    title_orig=title_orig,
+                    img_url=img_url,
+                    score=similarity,
+                    fuzzy=True,
+                )
+            )
+
+        fuzzy_results.sort(key=lambda r: r.score, reverse=True)
+        results.extend(fuzzy_results[: limit - len(results)])
+
+    return results
+
+
 def toggle_book_downloaded(session: Session, book_id: UUID) -> dict[str, str]:
     """Toggle the downloaded status of a book and update the series status."""
     book = session.get(Book, book_id)
@@ -57,7 +57,7 @@ async def get_series_details(
         raise ValidationError("external_id is required")
 
     # Get the plugin instance and create a configured source
-    plugin = plugin_manager.get_plugin(metadata_source.plugin.name)
+    plugin = await plugin_manager.ensure_loaded(metadata_source.plugin.name)
     if not plugin:
         raise ResourceNotFoundError("Plugin", metadata_source.plugin.name)
     
@@ -100,7 +100,7 @@ async def search_series(query: str, source_id: str, session: Session = Depends(g
         raise ResourceNotFoundError("Plugin for metadata source", source_id)
 
     # Get the plugin instance and create a configured source
-    plugin = plugin_manager.get_plugin(metadata_source.plugin.name)
+    plugin = await plugin_manager.ensure_loaded(metadata_source.plugin.name)
     if not plugin:
         raise ResourceNotFoundError("Plugin", metadata_source.plugin.name)
     
@@ -138,7 +138,8 @@ async def fetch_series(
     logger.info(f"Fetching series: source_id={source_id}, external_id={external_id}, group={series_group}")
     success = False
 
-    notifications = []
+    # (notification, coalesce_key, summary) - bursts are merged by the notification bus
+    notifications: list[tuple[NotificationMessage, str | None, str | None]] = []
 
     # Query the metadata source
     metadata_source = session.get(MetadataSource, uuid.UUID(source_id))
@@ -149,7 +150,7 @@ async def fetch_series(
         raise ResourceNotFoundError("Plugin for metadata source", source_id)
 
     # Get the plugin instance and create a configured source
-    plugin = plugin_manager.get_plugin(metadata_source.plugin.name)
+    plugin = await plugin_manager.ensure_loaded(metadata_source.plugin.name)
     if not plugin:
         raise ResourceNotFoundError("Plugin", metadata_source.plugin.name)
     
@@ -184,12 +185,14 @@ async def fetch_series(
         ).first()
 
         if not existing_series:
-            notifications.append(
+            notifications.append((
                 NotificationMessage(
                     message=f"Added '{data.series.title}' to library.",
                     type=NotificationType.SUCCESS,
-                )
-            )
+                ),
+                None,
+                None,
+            ))
 
         # ----- Handle Series Group -----
         if series_group:
@@ -295,12 +298,14 @@ async def fetch_series(
                 session.add(book_obj)
 
                 if existing_series:
-                    notifications.append(
+                    notifications.append((
                         NotificationMessage(
                             message=f"New book added to '{series_obj.title}'.",
                             type=NotificationType.INFO,
-                        )
-                    )
+                        ),
+                        f"new-books:{series_obj.id}",
+                        f"{{count}} new books added to '{series_obj.title}'.",
+                    ))
 
             session.flush()
 
@@ -325,12 +330,14 @@ async def fetch_series(
                     session.add(release_obj)
                     
                     if existing_series and existing_book:
-                        notifications.append(
+                        notifications.append((
                             NotificationMessage(
                                 message=f"New release added to '{book_obj.title}'.",
                                 type=NotificationType.INFO,
-                            )
-                        )
+                            ),
+                            f"new-book-releases:{series_obj.id}",
+                            f"{{count}} new releases added to '{series_obj.title}'.",
+                        ))
 
         # ----- Add Chapters -----
         for chapter_model in data.chapters:
@@ -356,12 +363,14 @@ async def fetch_series(
                 session.add(chapter_obj)
                 
                 if existing_series:
-                    notifications.append(
+                    notifications.append((
                         NotificationMessage(
                             message=f"New chapter added to '{series_obj.title}'.",
                             type=NotificationType.INFO,
-                        )
-                    )
+                        ),
+                        f"new-chapters:{series_obj.id}",
+                        f"{{count}} new chapters added to '{series_obj.title}'.",
+                    ))
             session.flush()
 
             for release_model in chapter_model.releases:
@@ -384,12 +393,14 @@ async def fetch_series(
                     )
                     session.add(release_obj)
                     if existing_series and exisiting_chapter:
-                        notifications.append(
+                        notifications.append((
                             NotificationMessage(
                                 message=f"New release added to chapter {chapter_obj.volume}x{chapter_obj.number} of '{series_obj.title}'.",
                                 type=NotificationType.INFO,
-                            )
-                        )
+                            ),
+                            f"new-chapter-releases:{series_obj.id}",
+                            f"{{count}} new chapter releases added to '{series_obj.title}'.",
+                        ))
 
         # ----- Mark Missing Books as Deleted -----
         fetched_book_external_ids = {
@@ -418,7 +429,7 @@ async def fetch_series(
         session.rollback()
         raise Exception(f"Error adding series: {e}")
 
-    for notif in notifications:
-        await notification_manager.broadcast(notif)
+    for notif, coalesce_key, summary in notifications:
+        await notification_manager.broadcast(notif, coalesce_key=coalesce_key, summary=summary)
     
     return success
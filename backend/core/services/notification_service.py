@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlmodel import Session, select, func, delete, update, or_, and_
+
+from backend.core.database.models import Notification, NotificationType
+from backend.core.exceptions import ValidationError
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(notification: Notification) -> str:
+    """Build an opaque pagination cursor from a notification's (timestamp, id)."""
+    return f"{notification.timestamp.isoformat()}_{notification.id.hex}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a cursor produced by encode_cursor()."""
+    try:
+        timestamp, notification_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(timestamp), UUID(hex=notification_id)
+    except ValueError as e:
+        raise ValidationError(f"Invalid notification cursor: {cursor}") from e
+
+
+def _apply_filters(statement, type: NotificationType | None, read: bool | None):
+    if type is not None:
+        statement = statement.where(Notification.type == type)
+    if read is not None:
+        statement = statement.where(Notification.read == read)
+    return statement
+
+
+def list_notifications(
+    session: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    type: NotificationType | None = None,
+    read: bool | None = None,
+) -> tuple[list[Notification], str | None]:
+    """
+    Get one page of notifications, newest first.
+
+    Pagination is keyset based on (timestamp, id), so pages stay stable while
+    new notifications are written.
+
+    Returns:
+        The page of notifications and the cursor for the next page (None on the last page).
+    """
+    statement = _apply_filters(select(Notification), type, read)
+
+    if cursor:
+        timestamp, notification_id = decode_cursor(cursor)
+        statement = statement.where(
+            or_(
+                Notification.timestamp < timestamp,
+                and_(Notification.timestamp == timestamp, Notification.id < notification_id),
+            )
+        )
+
+    statement = statement.order_by(
+        Notification.timestamp.desc(), Notification.id.desc()
+    ).limit(limit + 1)
+
+    notifications = list(session.exec(statement).all())
+    next_cursor = None
+    if len(notifications) > limit:
+        notifications = notifications[:limit]
+        next_cursor = encode_cursor(notifications[-1])
+    return notifications, next_cursor
+
+
+def count_unread(session: Session) -> int:
+    """Count unread notifications (served by the read/timestamp index)."""
+    return session.exec(
+        select(func.count()).select_from(Notification).where(Notification.read == False)
+    ).one()
+
+
+def _bulk_where(
+    ids: list[UUID] | None,
+    before: datetime | None,
+    type: NotificationType | None,
+    read: bool | None = None,
+) -> list:
+    conditions = []
+    if ids is not None:
+        conditions.append(Notification.id.in_(ids))
+    if before is not None:
+        conditions.append(Notification.timestamp < before)
+    if type is not None:
+        conditions.append(Notification.type == type)
+    if read is not None:
+        conditions.append(Notification.read == read)
+    return conditions
+
+
+def mark_notifications_read(
+    session: Session,
+    read: bool = True,
+    ids: list[UUID] | None = None,
+    before: datetime | None = None,
+    type: NotificationType | None = None,
+) -> int:
+    """Set the read state of every notification matching the filters (all if none given)."""
+    result = session.execute(
+        update(Notification)
+        .where(Notification.read != read, *_bulk_where(ids, before, type))
+        .values(read=read)
+    )
+    session.commit()
+    return result.rowcount
+
+
+def delete_notifications(
+    session: Session,
+    ids: list[UUID] | None = None,
+    before: datetime | None = None,
+    type: NotificationType | None = None,
+    read: bool | None = None,
+) -> int:
+    """Delete every notification matching the filters. At least one filter is required."""
+    conditions = _bulk_where(ids, before, type, read)
+    if not conditions:
+        raise ValidationError("Refusing to delete all notifications without a filter")
+
+    result = session.execute(delete(Notification).where(*conditions))
+    session.commit()
+    return result.rowcount
+
+
+def prune_notifications(session: Session, max_age_days: int, max_rows: int) -> int:
+    """
+    Apply the notification retention policy.
+
+    Deletes notifications older than ``max_age_days`` and then everything
+    beyond the newest ``max_rows``.
+
+    Returns:
+        int: Number of deleted notifications.
+    """
+    deleted = session.execute(
+        delete(Notification).where(
+            Notification.timestamp < datetime.utcnow() - timedelta(days=max_age_days)
+        )
+    ).rowcount
+
+    cutoff = session.exec(
+        select(Notification.timestamp)
+        .order_by(Notification.timestamp.desc())
+        .offset(max_rows - 1)
+        .limit(1)
+    ).first()
+    if cutoff is not None:
+        deleted += session.execute(
+            delete(Notification).where(Notification.timestamp < cutoff)
+        ).rowcount
+
+    session.commit()
+    logger.info(f"Pruned {deleted} notifications (max age {max_age_days}d, max rows {max_rows})")
+    return deleted
@@ -14,7 +14,7 @@ from backend.core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-def get_parser_instance(
+async def get_parser_instance(
     parser_id: UUID,
     session: Session
 ) -> tuple[Parser, ParserPlugin]:
@@ -44,7 +44,7 @@ def get_parser_instance(
     if not plugin.enabled:
         raise ResourceNotFoundError(f"Plugin '{plugin.name}' is disabled")
     
-    plugin_instance = plugin_manager.get_plugin(plugin.name)
+    plugin_instance = await plugin_manager.ensure_loaded(plugin.name)
     if not plugin_instance:
         raise ResourceNotFoundError(f"Plugin '{plugin.name}' is not loaded")
     
@@ -86,7 +86,7 @@ async def parse_content(
     if not session:
         raise ValueError("Database session is required")
     
-    parser, parser_instance = get_parser_instance(parser_id, session)
+    parser, parser_instance = await get_parser_instance(parser_id, session)
     
     logger.info(f"Parsing content with parser '{parser.name}': title={title}, infohash={infohash}")
     
@@ -2,6 +2,7 @@
 
 from collections.abc import Callable
 
+from backend.core.metrics import PIPELINE_STAGE_DURATION
 from backend.core.services.pipeline.stage import Stage
 
 
@@ -93,6 +94,8 @@ class Pipe:
             return data
 
         current_data = data
+        pipeline = type(self).__name__
         for stage in self.stages:
-            current_data = await stage.execute(current_data)
+            with PIPELINE_STAGE_DURATION.labels(pipeline, stage.name).time():
+                current_data = await stage.execute(current_data)
         return current_data
@@ -0,0 +1,144 @@
+"""Service for syncing plugin manifests and plugin-provided services with the database."""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlmodel import Session, select, update
+
+from backend.core.database.models import (
+    Plugin,
+    MetadataSource,
+    Indexer,
+    DownloadClient,
+    Parser,
+)
+from backend.core.plugins.base import BasePlugin
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _ServiceType:
+    model: type
+    getter: str  # BasePlugin method returning the advertised services
+    label: str
+    # Only services registered automatically (empty config) are managed; user
+    # configurable ones are added through the UI and never touched here.
+    auto_only: bool = False
+
+
+SERVICE_TYPES = [
+    _ServiceType(MetadataSource, "get_available_sources", "metadata source"),
+    _ServiceType(Indexer, "get_available_indexers", "indexer", auto_only=True),
+    _ServiceType(DownloadClient, "get_available_clients", "download client", auto_only=True),
+    _ServiceType(Parser, "get_available_parsers", "parser"),
+]
+
+
+def sync_plugins(session: Session, manifests: Iterable[dict]) -> dict[str, Plugin]:
+    """
+    Create or update a Plugin row for every manifest.
+
+    Returns:
+        Dictionary of plugin name -> Plugin row
+    """
+    existing = {plugin.name: plugin for plugin in session.exec(select(Plugin)).all()}
+
+    for manifest in manifests:
+        name = manifest.get("name")
+        version = manifest.get("version")
+        db_plugin = existing.get(name)
+
+        if not db_plugin:
+            db_plugin = Plugin(
+                name=name,
+                version=version,
+                author=manifest.get("author", ""),
+                description=manifest.get("description", ""),
+                enabled=True,
+            )
+            session.add(db_plugin)
+            existing[name] = db_plugin
+            logger.info(f"Added new plugin to database: {name} v{version}")
+        else:
+            db_plugin.version = version
+            db_plugin.description = manifest.get("description", "")
+            db_plugin.author = manifest.get("author", "")
+            logger.debug(f"Updated existing plugin: {name} v{version}")
+
+    session.commit()
+    return existing
+
+
+def _advertised(instance: BasePlugin, service_type: _ServiceType) -> list[dict]:
+    try:
+        services = getattr(instance, service_type.getter)()
+    except NotImplementedError:
+        return []  # Plugin doesn't support this service type
+    if service_type.auto_only:
+        services = [s for s in services if not s.get("user_configurable", False)]
+    return services
+
+
+def reconcile_plugin_services(
+    session: Session, plugins: Iterable[tuple[Plugin, BasePlugin]]
+) -> None:
+    """
+    Register the services advertised by loaded plugins.
+
+    Existing rows for all given plugins are loaded with one query per service
+    type and diffed in memory: new advertised services are inserted and
+    services that are no longer advertised are disabled, each in one batch.
+    Disabled services are never re-enabled automatically.
+
+    Used at startup and whenever a plugin is (re)loaded at runtime.
+    """
+    plugins = list(plugins)
+    if not plugins:
+        return
+    plugin_ids = [plugin.id for plugin, _ in plugins]
+
+    for service_type in SERVICE_TYPES:
+        model = service_type.model
+        rows = session.exec(select(model).where(model.plugin_id.in_(plugin_ids))).all()
+        existing: dict[tuple, object] = {(row.plugin_id, row.name): row for row in rows}
+
+        new_rows = []
+        to_disable = []
+        for plugin, instance in plugins:
+            advertised = _advertised(instance, service_type)
+            advertised_names = {s["name"] for s in advertised}
+
+            for row in rows:
+                if row.plugin_id != plugin.id or not row.enabled or row.name in advertised_names:
+                    continue
+                if service_type.auto_only and row.config:
+                    continue  # User-configured, leave it alone
+                to_disable.append(row.id)
+                logger.info(
+                    f"Disabled {service_type.label} '{row.name}' (no longer advertised by {plugin.name})"
+                )
+
+            for info in advertised:
+                if (plugin.id, info["name"]) in existing:
+                    continue
+                row = model(
+                    name=info["name"],
+                    version=plugin.version,
+                    author=plugin.author,
+                    description=info.get("description"),
+                    config={},
+                    enabled=True,
+                    plugin_id=plugin.id,
+                )
+                existing[(plugin.id, info["name"])] = row
+                new_rows.append(row)
+                logger.info(f"Registered new {service_type.label} '{info['name']}' from {plugin.name}")
+
+        if to_disable:
+            session.execute(update(model).where(model.id.in_(to_disable)).values(enabled=False))
+        session.add_all(new_rows)
+
+    session.commit()
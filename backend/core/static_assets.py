@@ -0,0 +1,162 @@
+"""
+In-memory index of the built frontend (STATIC_DIR) for serving it from the backend.
+
+The directory is walked once at startup instead of hitting the filesystem on
+every request:
+
+- Precompressed ``.br``/``.gz`` siblings written by the build are served when
+  the client accepts them. Compressible files without a ``.gz`` sibling are
+  gzipped once in memory.
+- Vite's content-hashed bundles under ``assets/`` are cached as immutable;
+  everything else (including ``index.html``) is revalidated with its ETag.
+- SPA routes are answered from an in-memory copy of ``index.html``.
+
+The frontend is only rebuilt alongside a backend restart, so the index is
+never refreshed while running.
+"""
+
+import gzip
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+from backend.core.compression import accepted_encodings
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Vite writes content-hashed bundles here (build.assetsDir)
+HASHED_ASSETS_DIR = "assets"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# Files smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 1024
+COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+    "text/javascript",
+}
+# Content-Encoding -> precompressed file suffix, in order of preference
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass
+class StaticAsset:
+    path: Path
+    media_type: str
+    headers: dict[str, str]
+    # Content-Encoding -> (precompressed file, or body kept in memory, and the file's stat)
+    encodings: dict[str, tuple[Path | None, bytes | None, os.stat_result | None]] = field(default_factory=dict)
+    stat_result: os.stat_result | None = None
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+class StaticAssets:
+    """Index of STATIC_DIR answering asset and SPA requests from memory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.assets: dict[str, StaticAsset] = {}
+        self.index: StaticAsset | None = None
+        self.loaded = False
+
+    def load(self) -> None:
+        """Walk the static directory and build the asset index."""
+        self.assets = {}
+        self.index = None
+        self.loaded = True
+        if not self.root.is_dir():
+            logger.warning(f"Static directory does not exist, frontend will not be served: {self.root}")
+            return
+
+        compressed_suffixes = tuple(ENCODING_SUFFIXES.values())
+        in_memory = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(compressed_suffixes):
+                    continue
+                path = Path(dirpath) / filename
+                relative = path.relative_to(self.root).as_posix()
+                asset = self._index_file(path, relative)
+                self.assets[relative] = asset
+                in_memory += sum(1 for _, data, _ in asset.encodings.values() if data is not None)
+
+        self.index = self.assets.get("index.html")
+        if self.index is not None:
+            # Served for every SPA route: keep the identity body in memory too
+            self.index.encodings["identity"] = (None, self.index.path.read_bytes(), self.index.stat_result)
+
+        logger.info(
+            f"Indexed {len(self.assets)} static files from {self.root} "
+            f"({in_memory} compressed in memory)"
+        )
+
+    def _index_file(self, path: Path, relative: str) -> StaticAsset:
+        stat_result = path.stat()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        immutable = relative.startswith(f"{HASHED_ASSETS_DIR}/")
+        headers = {
+            "ETag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+        }
+        asset = StaticAsset(path=path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+        if not _is_compressible(media_type):
+            return asset
+        headers["Vary"] = "Accept-Encoding"
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            variant = path.with_name(path.name + suffix)
+            if variant.is_file():
+                asset.encodings[encoding] = (variant, None, variant.stat())
+        if "gzip" not in asset.encodings and stat_result.st_size >= COMPRESS_MIN_BYTES:
+            data = gzip.compress(path.read_bytes(), compresslevel=9, mtime=0)
+            if len(data) < stat_result.st_size:
+                asset.encodings["gzip"] = (None, data, None)
+        return asset
+
+    def response(self, full_path: str, accept_encoding: str = "", if_none_match: str | None = None) -> Response | None:
+        """
+        Build the response for a request path.
+
+        Unknown paths get index.html so client-side routing can handle them.
+
+        Returns:
+            The response, or None if the frontend isn't built
+        """
+        if not self.loaded:
+            self.load()
+
+        asset = self.assets.get(full_path.lstrip("/")) or self.index
+        if asset is None:
+            return None
+
+        encoding = "identity"
+        if asset.encodings:
+            accepted = accepted_encodings(accept_encoding)
+            encoding = next((e for e in ENCODING_SUFFIXES if e in asset.encodings and e in accepted), "identity")
+
+        headers = dict(asset.headers)
+        if encoding != "identity":
+            # Each representation needs its own strong ETag
+            headers["ETag"] = headers["ETag"][:-1] + f'-{encoding}"'
+            headers["Content-Encoding"] = encoding
+        if if_none_match is not None and headers["ETag"] in {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }:
+            return Response(status_code=304, headers=headers)
+
+        variant, data, stat_result = asset.encodings.get(encoding, (asset.path, None, asset.stat_result))
+        if data is not None:
+            return Response(data, media_type=asset.media_type, headers=headers)
+        return FileResponse(variant, media_type=asset.media_type, headers=headers, stat_result=stat_result)
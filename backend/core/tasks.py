@@ -0,0 +1,410 @@
+"""
+Persistent background task manager for heavy jobs (backup, restore).
+
+- Task state lives in the ``task`` table, so progress survives restarts and
+  is visible from every API worker.
+- Tasks run in a process pool; a CPU-heavy zip job never blocks the event loop.
+- Each API worker runs a dispatcher that claims pending tasks with a single
+  atomic UPDATE, which enforces the per-type concurrency limit across workers.
+- Progress written by the worker processes is picked up by every API worker
+  and pushed to its WebSocket clients as ``{"event": "task", ...}`` messages.
+- Cancellation is cooperative: ``cancel`` sets a flag that the task's progress
+  callback checks, raising TaskCancelledError inside the task.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from sqlmodel import Session, select, update, delete, func, and_
+
+from backend.core.database.database import engine
+from backend.core.database.models import Task, TaskStatus
+from backend.core.exceptions import (
+    ResourceNotFoundError,
+    TaskCancelledError,
+    ValidationError,
+)
+from backend.core.notifications import notification_manager
+from backend.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Worker processes shared by all task types
+TASK_POOL_SIZE = 2
+# How often the dispatcher looks for pending tasks and progress updates
+TASK_POLL_INTERVAL_SECONDS = 1.0
+# Minimum time between progress writes from a running task
+PROGRESS_WRITE_INTERVAL_SECONDS = 0.5
+# Finished tasks older than this are removed on startup
+TASK_RETENTION_DAYS = 7
+
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+# A task function receives a progress callback(progress, message) followed by
+# the task's params as keyword arguments and returns a JSON-serializable result.
+TaskFunction = Callable[..., dict[str, Any] | None]
+
+
+@dataclass
+class TaskType:
+    func: TaskFunction
+    max_concurrent: int = 1
+    # Called in the API worker that ran the task, after it completed
+    on_completed: Callable[[], None] | None = None
+
+
+################################################################################
+# Worker process side
+################################################################################
+
+
+class _ProgressReporter:
+    """Progress callback handed to task functions; also polls for cancellation."""
+
+    def __init__(self, task_id: uuid.UUID) -> None:
+        self.task_id = task_id
+        self._last_write = 0.0
+        self._last_progress = -1
+
+    def __call__(self, progress: int, message: str) -> None:
+        now = time.monotonic()
+        if progress == self._last_progress and now - self._last_write < PROGRESS_WRITE_INTERVAL_SECONDS:
+            return
+        self._last_write = now
+        self._last_progress = progress
+
+        try:
+            with Session(engine) as session:
+                cancel_requested = session.execute(
+                    update(Task)
+                    .where(Task.id == self.task_id)
+                    .values(progress=progress, message=message, updated_at=datetime.utcnow())
+                    .returning(Task.cancel_requested)
+                ).scalar()
+                session.commit()
+        except Exception as e:
+            # Progress is best effort, the database may be busy with the task itself
+            logger.debug(f"Could not record progress for task {self.task_id}: {e}")
+            return
+
+        if cancel_requested:
+            raise TaskCancelledError(f"Task {self.task_id} was cancelled")
+
+
+def _finish_task(task_id: uuid.UUID, status: TaskStatus, **values: Any) -> None:
+    now = datetime.utcnow()
+    with Session(engine) as session:
+        session.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(status=status, completed_at=now, updated_at=now, **values)
+        )
+        session.commit()
+
+
+def _is_cancellation(error: BaseException | None) -> bool:
+    # Task functions may wrap errors, so check the whole cause chain
+    while error is not None:
+        if isinstance(error, TaskCancelledError):
+            return True
+        error = error.__cause__
+    return False
+
+
+def _run_task(task_id: uuid.UUID, func: TaskFunction, params: dict[str, Any]) -> None:
+    """Entry point executed in a worker process."""
+    with Session(engine) as session:
+        session.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(pid=os.getpid(), updated_at=datetime.utcnow())
+        )
+        session.commit()
+
+    reporter = _ProgressReporter(task_id)
+    try:
+        result = func(reporter, **params)
+    except Exception as e:
+        if _is_cancellation(e):
+            logger.info(f"Task {task_id} cancelled")
+            _finish_task(task_id, TaskStatus.CANCELLED, message="Cancelled")
+        else:
+            logger.error(f"Task {task_id} failed: {e}", exc_info=True)
+            _finish_task(task_id, TaskStatus.FAILED, progress=100, message=f"Failed: {e}", error=str(e))
+        return
+
+    _finish_task(task_id, TaskStatus.COMPLETED, progress=100, result=result)
+
+
+################################################################################
+# API worker side
+################################################################################
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class TaskManager:
+    """Submits, dispatches and tracks persistent background tasks."""
+
+    def __init__(self) -> None:
+        self._types: dict[str, TaskType] = {}
+        self._executor: ProcessPoolExecutor | None = None
+        self._futures: dict[uuid.UUID, Future] = {}
+        self._loop_task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._last_update = datetime.utcnow()
+
+    def register(
+        self,
+        task_type: str,
+        func: TaskFunction,
+        max_concurrent: int = 1,
+        on_completed: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Register a task type. ``func`` must be a module-level function (it is pickled).
+
+        ``on_completed`` runs on the event loop of the API worker that launched
+        the task once it completed successfully, for state the worker process
+        can't reach (e.g. the scheduler).
+        """
+        self._types[task_type] = TaskType(func=func, max_concurrent=max_concurrent, on_completed=on_completed)
+
+    # ----- Public API -----
+
+    def submit(self, task_type: str, params: dict[str, Any] | None = None) -> Task:
+        """Persist a new pending task; it starts once a slot for its type is free."""
+        if task_type not in self._types:
+            raise ValidationError(f"Unknown task type: {task_type}")
+
+        with Session(engine) as session:
+            task = Task(type=task_type, params=params or {}, message="Queued")
+            session.add(task)
+            session.commit()
+            session.refresh(task)
+
+        logger.info(f"Queued {task_type} task {task.id}")
+        self._wakeup.set()
+        return task
+
+    def get(self, task_id: uuid.UUID) -> Task:
+        with Session(engine) as session:
+            task = session.get(Task, task_id)
+            if task is None:
+                raise ResourceNotFoundError("Task", str(task_id))
+            return task
+
+    def list_tasks(self, task_type: str | None = None, limit: int = 50) -> list[Task]:
+        with Session(engine) as session:
+            statement = select(Task).order_by(Task.created_at.desc()).limit(limit)
+            if task_type is not None:
+                statement = statement.where(Task.type == task_type)
+            return list(session.exec(statement).all())
+
+    def cancel(self, task_id: uuid.UUID) -> Task:
+        """
+        Cancel a pending task immediately, or ask a running one to stop.
+
+        A running task stops at its next progress report, and it is up to the
+        task to leave things consistent (a restore rolls the database back).
+        """
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            task = session.get(Task, task_id)
+            if task is None:
+                raise ResourceNotFoundError("Task", str(task_id))
+            if task.status in FINISHED_STATUSES:
+                raise ValidationError(f"Task {task_id} has already finished")
+
+            if task.status == TaskStatus.PENDING:
+                task.status = TaskStatus.CANCELLED
+                task.message = "Cancelled"
+                task.completed_at = now
+            else:
+                task.cancel_requested = True
+                task.message = "Cancelling..."
+            task.updated_at = now
+            session.add(task)
+            session.commit()
+            session.refresh(task)
+            return task
+
+    def delete(self, task_id: uuid.UUID) -> None:
+        """Remove a finished task."""
+        with Session(engine) as session:
+            task = session.get(Task, task_id)
+            if task is None:
+                raise ResourceNotFoundError("Task", str(task_id))
+            if task.status not in FINISHED_STATUSES:
+                raise ValidationError(f"Task {task_id} is still {task.status.value}")
+            session.delete(task)
+            session.commit()
+
+    # ----- Lifecycle -----
+
+    async def start(self) -> None:
+        await asyncio.to_thread(self._recover)
+        self._executor = ProcessPoolExecutor(
+            max_workers=TASK_POOL_SIZE,
+            # Fork would copy the event loop, scheduler threads and open connections
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._loop_task = asyncio.create_task(self._run())
+        logger.info(f"Task manager started with {TASK_POOL_SIZE} worker processes")
+
+    async def shutdown(self) -> None:
+        if self._loop_task:
+            self._loop_task.cancel()
+        if self._executor:
+            # Running tasks finish in their worker; anything interrupted is
+            # marked failed by _recover() on the next start
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _recover(self) -> None:
+        """Fail tasks whose process died and drop old finished tasks."""
+        with Session(engine) as session:
+            running = session.exec(select(Task).where(Task.status == TaskStatus.RUNNING)).all()
+            now = datetime.utcnow()
+            for task in running:
+                if task.pid is None or not _is_process_alive(task.pid):
+                    logger.warning(f"Task {task.id} ({task.type}) was interrupted, marking as failed")
+                    task.status = TaskStatus.FAILED
+                    task.error = "Interrupted by a restart"
+                    task.message = "Failed: interrupted by a restart"
+                    task.completed_at = now
+                    task.updated_at = now
+                    session.add(task)
+
+            session.execute(
+                delete(Task).where(
+                    Task.status.in_(FINISHED_STATUSES),
+                    Task.completed_at < now - timedelta(days=TASK_RETENTION_DAYS),
+                )
+            )
+            session.commit()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await asyncio.to_thread(self._claim_pending)
+                for task_id, task_type, params in claimed:
+                    self._launch(task_id, task_type, params)
+                await self._publish_updates()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Task dispatcher error: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), TASK_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _claim_pending(self) -> list[tuple[uuid.UUID, str, dict[str, Any]]]:
+        """
+        Claim pending tasks for every registered type while slots are free.
+
+        The running-count check and the status change happen in one UPDATE,
+        so two API workers can never exceed a type's limit together.
+        """
+        claimed = []
+        with Session(engine) as session:
+            for task_type, spec in self._types.items():
+                while True:
+                    oldest_pending = (
+                        select(Task.id)
+                        .where(Task.type == task_type, Task.status == TaskStatus.PENDING)
+                        .order_by(Task.created_at)
+                        .limit(1)
+                        .scalar_subquery()
+                    )
+                    running = (
+                        select(func.count())
+                        .select_from(Task)
+                        .where(Task.type == task_type, Task.status == TaskStatus.RUNNING)
+                        .scalar_subquery()
+                    )
+                    now = datetime.utcnow()
+                    row = session.execute(
+                        update(Task)
+                        .where(and_(Task.id == oldest_pending, running < spec.max_concurrent))
+                        .values(
+                            status=TaskStatus.RUNNING,
+                            pid=os.getpid(),
+                            message="Starting...",
+                            started_at=now,
+                            updated_at=now,
+                        )
+                        .returning(Task.id, Task.params)
+                    ).first()
+                    session.commit()
+                    if row is None:
+                        break
+                    claimed.append((row[0], task_type, row[1] or {}))
+        return claimed
+
+    def _launch(self, task_id: uuid.UUID, task_type: str, params: dict[str, Any]) -> None:
+        logger.info(f"Starting {task_type} task {task_id}")
+        future = self._executor.submit(_run_task, task_id, self._types[task_type].func, params)
+        self._futures[task_id] = future
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(
+            lambda f: loop.call_soon_threadsafe(self._on_done, task_id, task_type, f)
+        )
+
+    def _on_done(self, task_id: uuid.UUID, task_type: str, future: Future) -> None:
+        self._futures.pop(task_id, None)
+        if future.cancelled():
+            _finish_task(task_id, TaskStatus.CANCELLED, message="Cancelled")
+        elif (error := future.exception()) is not None:
+            # The worker process itself died (e.g. BrokenProcessPool)
+            logger.error(f"Task {task_id} crashed: {error!r}")
+            _finish_task(task_id, TaskStatus.FAILED, progress=100, message=f"Failed: {error}", error=str(error))
+        elif (on_completed := self._types[task_type].on_completed) is not None:
+            with Session(engine) as session:
+                status = session.exec(select(Task.status).where(Task.id == task_id)).first()
+            if status == TaskStatus.COMPLETED:
+                try:
+                    on_completed()
+                except Exception as e:
+                    logger.error(f"Completion hook of {task_type} task {task_id} failed: {e}", exc_info=True)
+        # Free slot, look for the next pending task right away
+        self._wakeup.set()
+
+    async def _publish_updates(self) -> None:
+        """Push tasks changed since the last poll to this worker's WebSocket clients."""
+        since = self._last_update
+
+        def load() -> list[Task]:
+            with Session(engine) as session:
+                return list(session.exec(
+                    select(Task).where(Task.updated_at > since).order_by(Task.updated_at)
+                ).all())
+
+        tasks = await asyncio.to_thread(load)
+        if not tasks:
+            return
+        self._last_update = tasks[-1].updated_at
+        for task in tasks:
+            notification_manager.send_event("task", task.model_dump_json())
+
+
+task_manager = TaskManager()
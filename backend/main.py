@@ -1,8 +1,6 @@
 import os
 import sys
-import time
 import asyncio
-import logging
 from pathlib import Path
 
 from fastapi import (
@@ -13,15 +11,13 @@ from fastapi import (
     BackgroundTasks,
     Request,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.base import JobLookupError
 
-from fastapi.responses import FileResponse
 from sqlmodel import Session, select
-import yaml
 
 from backend.core.database.database import init_db, engine
 from backend.core.database.models import (
@@ -29,46 +25,95 @@ from backend.core.database.models import (
     PluginBase,
     Plugin,
     PluginType,
-    MetadataSource,
-    Indexer,
-    DownloadClient,
-    Parser,
 )
 from backend.core.notifications import notification_manager
+from backend.core.tasks import task_manager
+from backend.core.services.plugin_service import sync_plugins, reconcile_plugin_services
 from backend.plugin_manager import PluginManager, plugin_manager
-from backend.core.constants import PLUGIN_DIRS, STATIC_DIR
+from backend.core.constants import STATIC_DIR
+from backend.core.compression import CompressionMiddleware
+from backend.core.profiling import PROFILING_TOKEN_ENV, ProfilingMiddleware, profiler
+from backend.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, MetricsMiddleware, instrument_engine
+from backend.core.static_assets import StaticAssets
+from backend.core.jobs import MEMORY_JOBSTORE, ActivityMiddleware, apply_job_policy
 from backend.core.exceptions import (
     ResourceNotFoundError,
     InvalidStateError,
     ValidationError,
 )
-from backend.core.logging_config import setup_logging, get_logger
-
-from backend.core.scheduler import (
-    UPDATE_SERIES_INTERVAL_MINUTES,
-    check_release_day,
-    update_all_series_metadata,
+from backend.core.logging_config import (
+    setup_logging,
+    shutdown_logging,
+    get_logger,
+    parse_level,
+    parse_logger_levels,
 )
 
+from backend.core.scheduler import scheduler, schedule_core_jobs
+
 
-from .api.v1 import core, metadata, system, plugins, indexers, parsers, download_clients
+from .api.v1 import core, metadata, system, plugins, indexers, parsers, download_clients, profiling
 
 # Initialize logging at the very start
+# LOG_LEVEL=DEBUG, LOG_JSON=1, LOG_LEVELS="plugins.RanobeDB=DEBUG,backend.core.scheduler=WARNING"
 setup_logging(
-    log_level=logging.INFO,
-    enable_console=True
+    log_level=parse_level(os.environ.get("LOG_LEVEL", "INFO")),
+    enable_console=True,
+    json_format=os.environ.get("LOG_JSON", "").lower() in ("1", "true", "yes"),
+    logger_levels=parse_logger_levels(os.environ.get("LOG_LEVELS", "")),
 )
 logger = get_logger(__name__)
 
 
 
-scheduler = AsyncIOScheduler()
-scheduler.add_job(
-    update_all_series_metadata,
-    "interval",
-    minutes=UPDATE_SERIES_INTERVAL_MINUTES,
-)
-scheduler.add_job(check_release_day, "cron", hour=0, minute=0)
+static_assets = StaticAssets(STATIC_DIR)
+
+
+# Scheduler job IDs registered by each plugin, so they can be removed on unload
+plugin_jobs: dict[str, list[str]] = {}
+
+
+def register_plugin_jobs(plugin_name: str, plugin_instance) -> None:
+    try:
+        jobs = plugin_instance.get_scheduler_jobs()
+
+        for job_config in jobs:
+            # Plugin jobs are re-registered on every load, so they are never persisted
+            job = scheduler.add_job(**{
+                "replace_existing": True,
+                **apply_job_policy(job_config),
+                "jobstore": MEMORY_JOBSTORE,
+            })
+            plugin_jobs.setdefault(plugin_name, []).append(job.id)
+            logger.info(f"Scheduled job '{job_config.get('id', 'unnamed')}' from {plugin_name} plugin")
+
+    except Exception as e:
+        logger.error(f"Error registering scheduled jobs for {plugin_name}: {e}", exc_info=True)
+
+
+def remove_plugin_jobs(plugin_name: str) -> None:
+    for job_id in plugin_jobs.pop(plugin_name, []):
+        try:
+            scheduler.remove_job(job_id)
+            logger.info(f"Removed scheduled job '{job_id}' of {plugin_name} plugin")
+        except JobLookupError:
+            pass
+
+
+def on_plugin_event(event: str, plugin_name: str, plugin_instance) -> None:
+    """Keep scheduler jobs and service rows in sync with plugins loaded at runtime."""
+    if event == "unloaded":
+        remove_plugin_jobs(plugin_name)
+        return
+
+    with Session(engine) as session:
+        plugin = session.exec(select(Plugin).where(Plugin.name == plugin_name)).first()
+        if plugin is not None and plugin.enabled:
+            reconcile_plugin_services(session, [(plugin, plugin_manager.describe_plugin(plugin_name))])
+
+    if event == "loaded":
+        remove_plugin_jobs(plugin_name)
+        register_plugin_jobs(plugin_name, plugin_instance)
 
 
 @asynccontextmanager
@@ -76,53 +121,18 @@ async def lifespan(app: FastAPI):
     # Perform startup tasks
     logger.info("Application starting up...")
     init_db()
+    static_assets.load()
+
+    # Started paused: jobs can be added and the persisted ones are readable,
+    # but nothing runs before startup completes
+    scheduler.start(paused=True)
+    schedule_core_jobs()
 
     with Session(engine) as session:
         logger.info("Scanning plugin directories for manifests...")
-        # Scan all plugin directories for manifests
-        for plugin_dir in PLUGIN_DIRS:
-            if not plugin_dir.exists():
-                logger.warning(f"Plugin directory does not exist: {plugin_dir}")
-                continue
-
-            logger.debug(f"Scanning plugin directory: {plugin_dir}")
-            for folder in plugin_dir.iterdir():
-                if not folder.is_dir():
-                    continue
-                manifest_file = folder / "manifest.yaml"
-                if not manifest_file.exists():
-                    continue
-
-                manifest = yaml.safe_load(manifest_file.open())
-                name = manifest.get("name")
-                version = manifest.get("version")
-                description = manifest.get("description", "")
-                author = manifest.get("author", "")
-                ptype = manifest.get("type")
-
-                logger.debug(f"Found plugin manifest: {name} v{version}")
-
-                db_plugin = session.exec(
-                    select(Plugin).where(Plugin.name == name)
-                ).first()
-
-                if not db_plugin:
-                    db_plugin = Plugin(
-                        name=name,
-                        version=version,
-                        author=author,
-                        description=description,
-                        enabled=True,
-                    )
-                    session.add(db_plugin)
-                    logger.info(f"Added new plugin to database: {name} v{version}")
-                else:
-                    db_plugin.version = version
-                    db_plugin.description = description
-                    db_plugin.author = author
-                    logger.debug(f"Updated existing plugin: {name} v{version}")
-
-        session.commit()
+        # Scan all plugin directories for manifests (parsed once, cached by mtime)
+        manifests = plugin_manager.scan_manifests()
+        sync_plugins(session, (manifest for _, manifest in manifests.values()))
 
         # Ensure PluginBase table exists
         logger.info("Loading enabled plugins...")
@@ -131,224 +141,39 @@ async def lifespan(app: FastAPI):
         )
         logger.info(f"Found {len(enabled_plugins)} enabled plugins")
 
+        ## TODO: Add unavailable field to source/indexer/client, and set/unset based on whether it exists.
         for plugin in enabled_plugins:
-            # Try to find the plugin in any of the plugin directories
-            logger.debug(f"Searching for plugin manifest: {plugin.name}")
-            manifest_file = None
-            for plugin_dir in PLUGIN_DIRS:
-                candidate = plugin_dir / plugin.name / "manifest.yaml"
-                logger.debug(f"Checking: {candidate}")
-                if candidate.exists():
-                    manifest_file = candidate
-                    logger.debug(f"Found manifest at: {manifest_file}")
-                    break
-
-            ## TODO: Add unavailable field to source/indexer/client, and set/unset based on whether it exists.
-            if manifest_file and manifest_file.exists():
-                logger.info(f"Loading plugin: {plugin.name}")
-                manifest = yaml.safe_load(manifest_file.open())
-                try:
-                    plugin_instance = plugin_manager.load_plugin_from_manifest(plugin.name, manifest)
-                except Exception as e:
-                    logger.error(f"Failed to load plugin '{plugin.name}': {e}", exc_info=True)
-                    continue
-                
-                # Register plugin's metadata sources in database
-                try:
-                    available_sources = plugin_instance.get_available_sources()
-                    advertised_names = {s["name"] for s in available_sources}
-                    
-                    # Get all existing sources for this plugin
-                    existing_sources = session.exec(
-                        select(MetadataSource).where(MetadataSource.plugin_id == plugin.id)
-                    ).all()
-                    
-                    # Disable sources that are no longer advertised
-                    for existing in existing_sources:
-                        if existing.name not in advertised_names:
-                            existing.enabled = False
-                            logger.info(f"Disabled metadata source '{existing.name}' (no longer advertised by {plugin.name})")
-                    
-                    # Add new advertised sources (don't auto re-enable disabled ones)
-                    for source_info in available_sources:
-                        existing = session.exec(
-                            select(MetadataSource)
-                            .where(MetadataSource.name == source_info["name"])
-                            .where(MetadataSource.plugin_id == plugin.id)
-                        ).first()
-                        
-                        if not existing:
-                            # Create new source
-                            metadata_source = MetadataSource(
-                                name=source_info["name"],
-                                version=plugin.version,
-                                author=plugin.author,
-                                description=source_info.get("description"),
-                                config={},  # Default empty config
-                                enabled=True,
-                                plugin_id=plugin.id
-                            )
-                            session.add(metadata_source)
-                            logger.info(f"Registered new metadata source '{source_info['name']}' from {plugin.name}")
-                except NotImplementedError:
-                    pass  # Plugin doesn't support metadata sources
-                
-                # Register plugin's indexers in database
-                try:
-                    available_indexers = plugin_instance.get_available_indexers()
-                    
-                    # Only auto-register indexers that are NOT user-configurable
-                    auto_register_indexers = [
-                        i for i in available_indexers 
-                        if not i.get("user_configurable", False)
-                    ]
-                    advertised_names = {i["name"] for i in auto_register_indexers}
-                    
-                    # Get all existing indexers for this plugin
-                    existing_indexers = session.exec(
-                        select(Indexer).where(Indexer.plugin_id == plugin.id)
-                    ).all()
-                    
-                    # Only disable auto-registered indexers that are no longer advertised
-                    # Don't touch user-configured indexers (those with custom names/configs)
-                    for existing in existing_indexers:
-                        # Check if this looks like an auto-registered indexer
-                        # Auto-registered indexers have empty config dicts
-                        if (existing.config is None or existing.config == {}) and existing.name not in advertised_names:
-                            existing.enabled = False
-                            logger.info(f"Disabled indexer '{existing.name}' (no longer advertised by {plugin.name})")
-                    
-                    # Add new advertised indexers (don't auto re-enable disabled ones)
-                    for indexer_info in auto_register_indexers:
-                        existing = session.exec(
-                            select(Indexer)
-                            .where(Indexer.name == indexer_info["name"])
-                            .where(Indexer.plugin_id == plugin.id)
-                        ).first()
-                        
-                        if not existing:
-                            indexer = Indexer(
-                                name=indexer_info["name"],
-                                version=plugin.version,
-                                author=plugin.author,
-                                description=indexer_info.get("description"),
-                                config={},
-                                enabled=True,
-                                plugin_id=plugin.id
-                            )
-                            session.add(indexer)
-                            logger.info(f"Registered new indexer '{indexer_info['name']}' from {plugin.name}")
-                except NotImplementedError:
-                    pass  # Plugin doesn't support indexers
-                
-                # Register plugin's download clients in database
-                try:
-                    available_clients = plugin_instance.get_available_clients()
-                    
-                    # Only auto-register download clients that are NOT user-configurable
-                    # User-configurable clients (like qBittorrent) should only be added via UI
-                    auto_register_clients = [
-                        c for c in available_clients 
-                        if not c.get("user_configurable", False)
-                    ]
-                    advertised_names = {c["name"] for c in auto_register_clients}
-                    
-                    # Get all existing clients for this plugin
-                    existing_clients = session.exec(
-                        select(DownloadClient).where(DownloadClient.plugin_id == plugin.id)
-                    ).all()
-                    
-                    # Only disable auto-registered clients that are no longer advertised
-                    # Don't touch user-configured clients (those with custom names/configs)
-                    for existing in existing_clients:
-                        # Check if this looks like an auto-registered client
-                        # Auto-registered clients have empty config dicts
-                        if (existing.config is None or existing.config == {}) and existing.name not in advertised_names:
-                            existing.enabled = False
-                            logger.info(f"Disabled download client '{existing.name}' (no longer advertised by {plugin.name})")
-                    
-                    # Add new advertised clients (don't auto re-enable disabled ones)
-                    for client_info in auto_register_clients:
-                        existing = session.exec(
-                            select(DownloadClient)
-                            .where(DownloadClient.name == client_info["name"])
-                            .where(DownloadClient.plugin_id == plugin.id)
-                        ).first()
-                        
-                        if not existing:
-                            download_client = DownloadClient(
-                                name=client_info["name"],
-                                version=plugin.version,
-                                author=plugin.author,
-                                description=client_info.get("description"),
-                                config={},
-                                enabled=True,
-                                plugin_id=plugin.id
-                            )
-                            session.add(download_client)
-                            logger.info(f"Registered new download client '{client_info['name']}' from {plugin.name}")
-                except NotImplementedError:
-                    pass  # Plugin doesn't support download clients
-                
-                # Register plugin's parsers in database
-                try:
-                    available_parsers = plugin_instance.get_available_parsers()
-                    advertised_names = {p["name"] for p in available_parsers}
-                    
-                    # Get all existing parsers for this plugin
-                    existing_parsers = session.exec(
-                        select(Parser).where(Parser.plugin_id == plugin.id)
-                    ).all()
-                    
-                    # Disable parsers that are no longer advertised
-                    for existing in existing_parsers:
-                        if existing.name not in advertised_names:
-                            existing.enabled = False
-                            logger.info(f"Disabled parser '{existing.name}' (no longer advertised by {plugin.name})")
-                    
-                    # Add new advertised parsers (don't auto re-enable disabled ones)
-                    for parser_info in available_parsers:
-                        existing = session.exec(
-                            select(Parser)
-                            .where(Parser.name == parser_info["name"])
-                            .where(Parser.plugin_id == plugin.id)
-                        ).first()
-                        
-                        if not existing:
-                            parser = Parser(
-                                name=parser_info["name"],
-                                version=plugin.version,
-                                author=plugin.author,
-                                description=parser_info.get("description"),
-                                config={},
-                                enabled=True,
-                                plugin_id=plugin.id
-                            )
-                            session.add(parser)
-                            logger.info(f"Registered new parser '{parser_info['name']}' from {plugin.name}")
-                except NotImplementedError:
-                    pass  # Plugin doesn't support parsers
-            else:
+            if plugin.name not in manifests:
                 logger.warning(f"Manifest not found for enabled plugin: {plugin.name}")
-        
-        session.commit()
+
+        # Install dependencies once, import plugins concurrently, then start them in order
+        loaded_plugins = plugin_manager.load_plugins({
+            plugin.name: manifests[plugin.name][1]
+            for plugin in enabled_plugins
+            if plugin.name in manifests
+        })
+
+        # Register the services each plugin advertises (sources, indexers, clients, parsers);
+        # lazy plugins advertise them through their manifest
+        reconcile_plugin_services(session, [
+            (plugin, plugin_manager.describe_plugin(plugin.name))
+            for plugin in enabled_plugins
+            if plugin.name in loaded_plugins or plugin.name in plugin_manager.lazy_plugins
+        ])
 
         logger.info("Registering scheduled jobs from plugins...")
         # Register scheduled jobs from all enabled plugins
         # Plugins decide their own scheduling logic and requirements
         for plugin_name, plugin_instance in plugin_manager.plugins.items():
-            try:
-                jobs = plugin_instance.get_scheduler_jobs()
-                
-                for job_config in jobs:
-                    scheduler.add_job(**job_config)
-                    logger.info(f"Scheduled job '{job_config.get('id', 'unnamed')}' from {plugin_name} plugin")
-                        
-            except Exception as e:
-                logger.error(f"Error registering scheduled jobs for {plugin_name}: {e}", exc_info=True)
+            register_plugin_jobs(plugin_name, plugin_instance)
+
+    # Plugins (re)loaded or unloaded from now on update routes, jobs and services live
+    plugin_manager.add_listener(on_plugin_event)
+
+    await task_manager.start()
 
     logger.info("Starting scheduler...")
-    scheduler.start()
+    scheduler.resume()
     logger.info("Application startup complete")
     
     yield
@@ -357,6 +182,11 @@ async def lifespan(app: FastAPI):
     logger.info("Application shutting down...")
     scheduler.shutdown()
     logger.info("Scheduler stopped")
+    plugin_manager.shutdown_all_plugins()
+    await task_manager.shutdown()
+    logger.info("Task manager stopped")
+    await notification_manager.shutdown()
+    logger.info("Notification bus flushed")
     logger.info("Application shutdown complete")
 
 
@@ -380,7 +210,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+app.add_middleware(CompressionMiddleware)
+# Lets heavy scheduler jobs yield to API requests in flight
+app.add_middleware(ActivityMiddleware)
+# Outermost, so latency includes compression
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine)
+# Off unless a token is configured; no profiling hooks are installed then
+if os.environ.get(PROFILING_TOKEN_ENV):
+    profiler.enable(os.environ[PROFILING_TOKEN_ENV], scheduler, engine)
+    app.add_middleware(ProfilingMiddleware)
 
 
 # Exception handlers for custom domain exceptions
@@ -418,6 +259,12 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics (text exposition format)."""
+    return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.websocket("/ws/notifications")
 async def websocket_endpoint(websocket: WebSocket):
     await notification_manager.connect(websocket)
@@ -439,15 +286,16 @@ def restart_server():
     Restart the server. Method depends on how it's running.
     TODO: Test in production.
     """
-    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Initiating restart...")
+    logger.info("Initiating restart...")
 
     # Try to touch file for uvicorn --reload
     try:
         Path(__file__).touch()
-        print("Triggered uvicorn auto-reload")
+        logger.info("Triggered uvicorn auto-reload")
     except Exception as e:
-        print(f"Could not trigger auto-reload: {e}")
-        # Fallback to exec
+        logger.warning("Could not trigger auto-reload: %s", e)
+        # Fallback to exec; flush queued log records first, exec skips atexit
+        shutdown_logging()
         python = sys.executable
         os.execl(python, python, *sys.argv)
 
@@ -464,7 +312,7 @@ async def restart_backend(background_tasks: BackgroundTasks):
     Note: This works best when the server is run with a process manager
     (like systemd, supervisor, or PM2) that can automatically restart it.
     """
-    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Restart endpoint called")
+    logger.info("Restart endpoint called")
 
     await notification_manager.broadcast(
         NotificationMessage(message="Backend server is restarting...")
@@ -487,37 +335,38 @@ app.include_router(plugins.router, prefix="/api/v1", tags=["plugins"])
 app.include_router(indexers.router, prefix="/api/v1", tags=["indexers"])
 app.include_router(parsers.router, prefix="/api/v1", tags=["parsers"])
 app.include_router(download_clients.router, prefix="/api/v1", tags=["download_clients"])
+app.include_router(profiling.router, prefix="/api/v1", include_in_schema=False)
 
-# Include plugin-registered API routers
-for plugin_name, router in plugin_manager.get_plugin_routers().items():
-    app.include_router(
-        router,
-        prefix=f"/api/v1/plugins/{plugin_name}",
-        tags=[f"plugin:{plugin_name}"]
-    )
+async def plugin_routes(scope, receive, send):
+    """Dispatch /api/v1/plugins/{plugin_name}/... to the plugin's own APIRouter.
 
+    Routers are looked up per request, so lazy plugins are loaded on their
+    first request.
+    """
+    plugin_name = scope["path_params"]["plugin_name"]
+    router = await plugin_manager.ensure_plugin_router(plugin_name)
+    if router is None:
+        response = JSONResponse({"detail": "Not Found"}, status_code=404)
+        await response(scope, receive, send)
+        return
+    await router(scope, receive, send)
 
-@app.get("/", include_in_schema=False)
-async def root_index():
-    index_file = STATIC_DIR / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
-    raise HTTPException(status_code=404)
 
+# Include plugin-registered API routers (after the core /plugins endpoints, which take precedence)
+app.mount("/api/v1/plugins/{plugin_name}", plugin_routes)
 
-# Catch-all to serve static files or SPA index
+
+@app.get("/", include_in_schema=False)
 @app.get("/{full_path:path}", include_in_schema=False)
-async def spa_fallback(full_path: str):
-    # Avoid interfering with API or websocket paths (these are registered above)
-    # If a file exists in STATIC_DIR, serve it
-    candidate = STATIC_DIR / full_path
-    if candidate.exists() and candidate.is_file():
-        return FileResponse(candidate)
-
-    # Otherwise, return index.html so client-side routing can handle the path
-    index_file = STATIC_DIR / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
-
-    # nothing found
-    raise HTTPException(status_code=404)
+async def spa_fallback(request: Request, full_path: str = ""):
+    """Serve built frontend files, or index.html so client-side routing can handle the path."""
+    # API and websocket paths are registered above and take precedence
+    response = static_assets.response(
+        full_path,
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("if-none-match"),
+    )
+    if response is None:
+        # nothing found
+        raise HTTPException(status_code=404)
+    return response
@@ -1,10 +1,25 @@
 # TODO: Handle plugin name collisions.
+import asyncio
 import subprocess
 import importlib
+import importlib.metadata
+import hashlib
+import json
 import sys
+import time
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Type, Any
+from types import ModuleType
+from typing import Callable, Dict, Type, Any
+
+import yaml
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:  # pragma: no cover - packaging ships with pip/setuptools installs
+    Requirement = None
 
 from backend.core.plugins.base import BasePlugin
 from backend.core.constants import BUNDLED_PLUGIN_DIR, USER_PLUGIN_DIR, PLUGIN_DIRS
@@ -13,6 +28,65 @@ from backend.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Plugin modules imported concurrently during startup
+PLUGIN_IMPORT_WORKERS = 8
+# Lazy plugins unused for this long are unloaded (manifest ``idle_timeout`` overrides, 0 disables)
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30 * 60
+
+# Manifest ``provides`` keys -> BasePlugin capability methods
+MANIFEST_CAPABILITIES = {
+    "sources": "get_available_sources",
+    "indexers": "get_available_indexers",
+    "clients": "get_available_clients",
+    "parsers": "get_available_parsers",
+}
+# Capability summary flags served by /api/v1/plugin-capabilities
+CAPABILITY_FLAGS = {
+    "indexers": "has_indexers",
+    "clients": "has_download_clients",
+    "sources": "has_metadata_sources",
+    "parsers": "has_parsers",
+}
+
+
+def requirement_satisfied(requirement: str) -> bool:
+    """Whether an installed distribution already satisfies a pip requirement string."""
+    if Requirement is None:
+        return False
+    try:
+        req = Requirement(requirement)
+    except InvalidRequirement:
+        # URLs, paths and other pip-only syntax can't be checked; let pip decide
+        return False
+    if req.marker is not None and not req.marker.evaluate():
+        return True
+    try:
+        installed = importlib.metadata.version(req.name)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return not req.specifier or req.specifier.contains(installed, prereleases=True)
+
+
+class ManifestCapabilities:
+    """Capabilities of a lazy plugin, as declared in the ``provides`` section of its manifest.
+
+    Exposes the same get_available_* methods as BasePlugin so callers can
+    inspect a plugin without importing it.
+    """
+
+    def __init__(self, manifest: dict):
+        self.name = manifest.get("name")
+        self.version = manifest.get("version")
+        self.description = manifest.get("description", "")
+        self.enabled = True
+        self._provides = manifest.get("provides") or {}
+
+    def __getattr__(self, attr: str):
+        for key, method in MANIFEST_CAPABILITIES.items():
+            if attr == method:
+                return lambda: list(self._provides.get(key) or [])
+        raise AttributeError(attr)
+
 
 class PluginManager:
     """Manages the loading and lifecycle of plugins.
@@ -21,12 +95,33 @@ class PluginManager:
     - Provide multiple configured sources/indexers/clients (factory pattern)
     - Run continuously for generic functionality (event listeners, background tasks)
     - Register their capabilities and configuration requirements
+
+    Plugins whose manifest sets ``lazy: true`` are only registered at startup:
+    their capabilities come from the manifest ``provides`` section, and the
+    module is imported and started the first time get_plugin() (or
+    get_plugin_router(), when the manifest sets ``api_router: true``) asks
+    for it. Their dependencies are still installed when they are registered,
+    and async code uses ensure_loaded()/ensure_plugin_router(), which do the
+    first-use import and start in a worker thread. Lazy plugins left unused
+    for ``idle_timeout`` seconds are unloaded again by unload_idle_plugins().
+    A lazy plugin's scheduled jobs are registered by the "loaded" listener,
+    so they only start after its first load (and stop when it is unloaded).
     """
     
     def __init__(self, plugin_dirs: list[Path] | None = None):
         self.plugin_dirs = plugin_dirs if plugin_dirs is not None else PLUGIN_DIRS
         self.plugins: Dict[str, BasePlugin] = {}  # name -> running instance
         self.plugin_routers: Dict[str, Any] = {}  # name -> APIRouter instance
+        self._manifest_cache: Dict[Path, tuple[int, dict]] = {}  # path -> (mtime_ns, manifest)
+        self.load_timings: Dict[str, Dict[str, float]] = {}  # name -> phase -> seconds
+        self.lazy_plugins: Dict[str, tuple[str, dict]] = {}  # name -> (folder name, manifest)
+        self._last_used: Dict[str, float] = {}  # lazy plugin name -> monotonic time of last use
+        self._folders: Dict[str, str] = {}  # name -> plugin folder name
+        self._listeners: list[Callable[[str, str, BasePlugin | None], None]] = []
+        self._capabilities: Dict[str, Dict[str, list]] = {}  # name -> provides key -> services
+        self._capability_summary: Dict[str, bool] = {flag: False for flag in CAPABILITY_FLAGS.values()}
+        self.capabilities_etag = self._summary_etag(self._capability_summary)
+        self._load_lock = threading.RLock()
         
         # Ensure user plugin directory exists
         USER_PLUGIN_DIR.mkdir(parents=True, exist_ok=True)
@@ -34,14 +129,53 @@ class PluginManager:
 
     def install_dependencies(self, dependencies: list[str]):
         ## TODO: Manage dependencies somehow.
-        logger.info(f"Installing dependencies: {dependencies}")
-        for dep in dependencies:
-            try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
-                logger.info(f"Successfully installed dependency: {dep}")
-            except Exception as e:
-                logger.error(f"Failed to install dependency '{dep}': {e}", exc_info=True)
-                raise
+        missing = [dep for dep in dependencies if not requirement_satisfied(dep)]
+        if not missing:
+            logger.debug(f"Dependencies already satisfied: {dependencies}")
+            return
+
+        logger.info(f"Installing dependencies: {missing}")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+            logger.info(f"Successfully installed dependencies: {missing}")
+        except Exception as e:
+            logger.error(f"Failed to install dependencies {missing}: {e}", exc_info=True)
+            raise
+
+    def read_manifest(self, manifest_file: Path) -> dict:
+        """Parse a plugin manifest, reusing the cached result while its mtime is unchanged."""
+        mtime = manifest_file.stat().st_mtime_ns
+        cached = self._manifest_cache.get(manifest_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with manifest_file.open() as f:
+            manifest = yaml.safe_load(f) or {}
+        self._manifest_cache[manifest_file] = (mtime, manifest)
+        return manifest
+
+    def scan_manifests(self) -> Dict[str, tuple[Path, dict]]:
+        """Find every plugin manifest. Returns folder name -> (plugin path, manifest).
+
+        When a folder exists in several plugin directories, the first one wins
+        (bundled before user plugins), matching find_plugin_path().
+        """
+        found: Dict[str, tuple[Path, dict]] = {}
+        for plugin_dir in self.plugin_dirs:
+            if not plugin_dir.exists():
+                logger.warning(f"Plugin directory does not exist: {plugin_dir}")
+                continue
+
+            logger.debug(f"Scanning plugin directory: {plugin_dir}")
+            for folder in plugin_dir.iterdir():
+                manifest_file = folder / "manifest.yaml"
+                if folder.name in found or not folder.is_dir() or not manifest_file.exists():
+                    continue
+                try:
+                    found[folder.name] = (folder, self.read_manifest(manifest_file))
+                except Exception as e:
+                    logger.error(f"Failed to read manifest {manifest_file}: {e}", exc_info=True)
+        return found
 
     def find_plugin_path(self, folder_name: str) -> Path | None:
         """Find the plugin directory, checking bundled first, then user plugins."""
@@ -59,21 +193,260 @@ class PluginManager:
         The plugin instance is kept running for the lifetime of the application.
         """
         plugin_name = manifest.get("name", folder_name)
-        logger.info(f"Loading plugin: {plugin_name}")
-        
-        entry_point = manifest.get("entry_point")
-        if not entry_point:
-            logger.error(f"Plugin '{plugin_name}' manifest missing 'entry_point' field")
-            raise ValueError("Manifest missing 'entry_point' field")
-        
+        with self._load_lock:
+            if plugin_name in self.plugins:
+                return self.plugins[plugin_name]
+            return self._load_plugin_from_manifest(folder_name, manifest)
+
+    def _load_plugin_from_manifest(self, folder_name: str, manifest: dict):
+        plugin_name = manifest.get("name", folder_name)
+        timings = self.load_timings[plugin_name] = {}
+
+        started = time.perf_counter()
         dependencies = manifest.get("dependencies", [])
         if dependencies:
             logger.debug(f"Plugin '{plugin_name}' has dependencies: {dependencies}")
             self.install_dependencies(dependencies)
+        timings["dependencies"] = time.perf_counter() - started
 
-        module_name, class_name = entry_point.split(":")
-        logger.debug(f"Plugin '{plugin_name}' entry point: {module_name}:{class_name}")
-        
+        module = self.import_plugin_module(folder_name, manifest)
+        return self.start_plugin(folder_name, manifest, module)
+
+    def load_plugins(self, manifests: Dict[str, dict]) -> Dict[str, BasePlugin]:
+        """Load several plugins at once. ``manifests`` maps folder name -> manifest.
+
+        Dependencies (of lazy plugins too) are installed up front in a single
+        pip run, plugin modules are imported concurrently, then plugins are
+        instantiated and started one by one in the given order. A plugin that
+        fails to load is logged and skipped.
+
+        Returns:
+            Dictionary of folder name -> started plugin instance
+        """
+        started = time.perf_counter()
+
+        dependencies = sorted({dep for m in manifests.values() for dep in m.get("dependencies", []) or []})
+        if dependencies:
+            try:
+                self.install_dependencies(dependencies)
+            except Exception:
+                logger.error("Dependency installation failed, plugins needing them may not load")
+        dependency_time = time.perf_counter() - started
+
+        lazy = {folder: m for folder, m in manifests.items() if m.get("lazy", False)}
+        for folder_name, manifest in lazy.items():
+            self.register_lazy_plugin(folder_name, manifest)
+        manifests = {folder: m for folder, m in manifests.items() if folder not in lazy}
+        for folder_name, manifest in manifests.items():
+            self.load_timings[manifest.get("name", folder_name)] = {"dependencies": dependency_time}
+
+        def import_module(folder_name: str) -> ModuleType:
+            return self.import_plugin_module(folder_name, manifests[folder_name])
+
+        with ThreadPoolExecutor(max_workers=PLUGIN_IMPORT_WORKERS, thread_name_prefix="plugin-import") as pool:
+            futures = {name: pool.submit(import_module, name) for name in manifests}
+
+        loaded: Dict[str, BasePlugin] = {}
+        for folder_name, manifest in manifests.items():
+            try:
+                loaded[folder_name] = self.start_plugin(folder_name, manifest, futures[folder_name].result())
+            except Exception as e:
+                # Already logged with a traceback by import_plugin_module/start_plugin
+                logger.warning(f"Skipping plugin '{manifest.get('name', folder_name)}': {e}")
+
+        self.log_load_timings(time.perf_counter() - started)
+        return loaded
+
+    def log_load_timings(self, total: float) -> None:
+        """Log the per-plugin startup timing breakdown."""
+        lines = [
+            f"  {name}: "
+            + ", ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in phases.items())
+            for name, phases in sorted(
+                self.load_timings.items(), key=lambda item: -sum(item[1].values())
+            )
+        ]
+        logger.info(
+            f"Loaded {len(self.plugins)} plugin(s) in {total * 1000:.0f}ms"
+            f" ({len(self.lazy_plugins)} deferred)\n" + "\n".join(lines)
+        )
+
+    def register_lazy_plugin(self, folder_name: str, manifest: dict) -> None:
+        """Register a plugin to be imported and started on first use."""
+        plugin_name = manifest.get("name", folder_name)
+        self.lazy_plugins[plugin_name] = (folder_name, manifest)
+        self._folders[plugin_name] = folder_name
+        self._refresh_capabilities(plugin_name)
+        logger.info(f"Plugin '{plugin_name}' registered for lazy loading")
+        self._emit("registered", plugin_name, None)
+
+    def add_listener(self, callback: Callable[[str, str, BasePlugin | None], None]) -> None:
+        """Subscribe to plugin lifecycle events.
+
+        ``callback(event, plugin_name, instance)`` is called with event
+        "loaded" after a plugin started, "registered" after a lazy plugin was
+        registered (instance is None) and "unloaded" after a plugin stopped.
+        Callbacks may run on any thread.
+        """
+        self._listeners.append(callback)
+
+    def _emit(self, event: str, name: str, instance: BasePlugin | None) -> None:
+        for callback in self._listeners:
+            try:
+                callback(event, name, instance)
+            except Exception as e:
+                logger.error(f"Plugin listener failed on '{event}' for '{name}': {e}", exc_info=True)
+
+    def load_plugin(self, folder_name: str) -> BasePlugin | None:
+        """Load a single plugin at runtime from its folder (e.g. right after install).
+
+        Returns:
+            The started plugin, or None when its manifest defers it to first use (lazy)
+        """
+        plugin_path = self.find_plugin_path(folder_name)
+        if not plugin_path:
+            raise ValueError(f"Plugin folder '{folder_name}' not found")
+
+        manifest = self.read_manifest(plugin_path / "manifest.yaml")
+        if manifest.get("lazy", False):
+            # Installed now, so the first use only has to import and start it
+            self.install_dependencies(manifest.get("dependencies", []) or [])
+            self.register_lazy_plugin(folder_name, manifest)
+            return None
+        return self.load_plugin_from_manifest(folder_name, manifest)
+
+    def reload_plugin(self, name: str) -> BasePlugin | None:
+        """Stop a plugin, drop its modules and load it again from disk."""
+        folder_name = self._folders.get(name)
+        if folder_name is None:
+            raise ValueError(f"Plugin '{name}' is not loaded")
+
+        with self._load_lock:
+            logger.info(f"Reloading plugin: {name}")
+            if name in self.plugins:
+                self.unload_plugin(name)
+            self._purge_modules(folder_name)
+            self.lazy_plugins.pop(name, None)
+            return self.load_plugin(folder_name)
+
+    def remove_plugin(self, name: str) -> None:
+        """Stop a plugin and forget it entirely (e.g. before uninstalling its files)."""
+        with self._load_lock:
+            if name in self.plugins:
+                self.unload_plugin(name)
+            folder_name = self._folders.pop(name, None)
+            if folder_name is not None:
+                plugin_path = self.find_plugin_path(folder_name)
+                if plugin_path is not None:
+                    self._manifest_cache.pop(plugin_path / "manifest.yaml", None)
+                self._purge_modules(folder_name)
+            self.lazy_plugins.pop(name, None)
+            self._last_used.pop(name, None)
+            self._refresh_capabilities(name)
+            logger.info(f"Plugin '{name}' removed")
+
+    def _refresh_capabilities(self, name: str) -> None:
+        """Recompute a plugin's entry in the capability registry and the summary."""
+        plugin = self.describe_plugin(name)
+        capabilities = dict(self._capabilities)
+        if plugin is None:
+            capabilities.pop(name, None)
+        else:
+            entry = {}
+            for key, method in MANIFEST_CAPABILITIES.items():
+                try:
+                    entry[key] = list(getattr(plugin, method)() or [])
+                except (NotImplementedError, AttributeError):
+                    entry[key] = []
+                except Exception as e:
+                    logger.error(f"Error reading {key} of plugin '{name}': {e}", exc_info=True)
+                    entry[key] = []
+            capabilities[name] = entry
+
+        summary = {
+            flag: any(entry[key] for entry in capabilities.values())
+            for key, flag in CAPABILITY_FLAGS.items()
+        }
+        # Swap in new objects so readers on other threads never see a partial update
+        self._capabilities = capabilities
+        self._capability_summary = summary
+        self.capabilities_etag = self._summary_etag(summary)
+
+    @staticmethod
+    def _summary_etag(summary: Dict[str, bool]) -> str:
+        digest = hashlib.sha1(json.dumps(summary, sort_keys=True).encode()).hexdigest()
+        return f'"{digest[:16]}"'
+
+    def get_capabilities(self, name: str) -> Dict[str, list] | None:
+        """Get the services a plugin provides, keyed by sources/indexers/clients/parsers.
+
+        Served from the capability registry; never loads a lazy plugin.
+        """
+        return self._capabilities.get(name)
+
+    def get_capability_summary(self) -> Dict[str, bool]:
+        """Get which kinds of services are provided by any loaded or lazy plugin."""
+        return dict(self._capability_summary)
+
+    def describe_plugin(self, name: str) -> BasePlugin | ManifestCapabilities | None:
+        """Get an object exposing a plugin's get_available_* methods without loading it.
+
+        Returns the running instance when loaded, the manifest-declared
+        capabilities for a lazy plugin that isn't, or None if unknown.
+        """
+        plugin = self.plugins.get(name)
+        if plugin is not None:
+            return plugin
+        if name in self.lazy_plugins:
+            return ManifestCapabilities(self.lazy_plugins[name][1])
+        return None
+
+    def _ensure_loaded(self, name: str) -> BasePlugin | None:
+        plugin = self.plugins.get(name)
+        if plugin is None and name in self.lazy_plugins:
+            folder_name, manifest = self.lazy_plugins[name]
+            logger.info(f"Loading lazy plugin '{name}' on first use")
+            try:
+                plugin = self.load_plugin_from_manifest(folder_name, manifest)
+            except Exception:
+                return None  # Already logged by load_plugin_from_manifest
+        if name in self.lazy_plugins:
+            self._last_used[name] = time.monotonic()
+        return plugin
+
+    def unload_idle_plugins(self) -> list[str]:
+        """Unload lazy plugins that haven't been used within their idle timeout.
+
+        Returns:
+            Names of the unloaded plugins
+        """
+        now = time.monotonic()
+        unloaded = []
+        for name, (folder_name, manifest) in list(self.lazy_plugins.items()):
+            timeout = manifest.get("idle_timeout", DEFAULT_IDLE_TIMEOUT_SECONDS)
+            if not timeout or name not in self.plugins:
+                continue
+            if now - self._last_used.get(name, now) < timeout:
+                continue
+            with self._load_lock:
+                logger.info(f"Unloading plugin '{name}' after {timeout}s idle")
+                if self.unload_plugin(name) and name not in self.plugins:
+                    self._purge_modules(folder_name)
+                    self._last_used.pop(name, None)
+                    unloaded.append(name)
+        return unloaded
+
+    def _purge_modules(self, folder_name: str) -> None:
+        """Drop a plugin's modules from sys.modules so they can be garbage collected."""
+        plugin_path = self.find_plugin_path(folder_name)
+        if plugin_path is not None and plugin_path.parent == BUNDLED_PLUGIN_DIR:
+            package = f"backend.plugins.{folder_name}"
+        else:
+            package = folder_name
+        for module_name in [m for m in sys.modules if m == package or m.startswith(package + ".")]:
+            del sys.modules[module_name]
+
+    def _module_path(self, folder_name: str, module_name: str) -> str:
         # Check if this is a bundled plugin or user plugin
         plugin_path = self.find_plugin_path(folder_name)
         if not plugin_path:
@@ -91,14 +464,43 @@ class PluginManager:
                 logger.debug(f"Added user plugin directory to sys.path: {USER_PLUGIN_DIR}")
             module_path = f"{folder_name}.{module_name}"
             logger.debug(f"Loading user plugin from: {module_path}")
+        return module_path
+
+    def import_plugin_module(self, folder_name: str, manifest: dict) -> ModuleType:
+        """Import a plugin's entry point module (safe to call from worker threads)."""
+        plugin_name = manifest.get("name", folder_name)
+        logger.info(f"Loading plugin: {plugin_name}")
         
+        entry_point = manifest.get("entry_point")
+        if not entry_point:
+            logger.error(f"Plugin '{plugin_name}' manifest missing 'entry_point' field")
+            raise ValueError("Manifest missing 'entry_point' field")
+
+        module_name, class_name = entry_point.split(":")
+        logger.debug(f"Plugin '{plugin_name}' entry point: {module_name}:{class_name}")
+
+        started = time.perf_counter()
+        try:
+            return importlib.import_module(self._module_path(folder_name, module_name))
+        except Exception as e:
+            logger.error(f"Failed to load plugin '{plugin_name}': {e}", exc_info=True)
+            raise
+        finally:
+            self.load_timings.setdefault(plugin_name, {})["import"] = time.perf_counter() - started
+
+    def start_plugin(self, folder_name: str, manifest: dict, module: ModuleType) -> BasePlugin:
+        """Instantiate and start a plugin from its imported entry point module."""
+        plugin_name = manifest.get("name", folder_name)
+        class_name = manifest["entry_point"].split(":")[1]
+
+        started = time.perf_counter()
         try:
-            module = importlib.import_module(module_path)
             cls: Type[BasePlugin] = getattr(module, class_name)
             
             # Instantiate the plugin
             instance = cls()
             self.plugins[plugin_name] = instance
+            self._folders[plugin_name] = folder_name
             logger.info(f"Plugin '{plugin_name}' instantiated successfully")
             
             # Call start() to initialize the plugin
@@ -114,11 +516,15 @@ class PluginManager:
             except Exception as e:
                 logger.error(f"Error registering API router for '{plugin_name}': {e}", exc_info=True)
             
+            self._refresh_capabilities(plugin_name)
+            self._emit("loaded", plugin_name, instance)
             return instance
             
         except Exception as e:
             logger.error(f"Failed to load plugin '{plugin_name}': {e}", exc_info=True)
             raise
+        finally:
+            self.load_timings.setdefault(plugin_name, {})["start"] = time.perf_counter() - started
 
     def unload_plugin(self, name: str) -> bool:
         """Unload a plugin by name, calling its stop() method for cleanup.
@@ -142,6 +548,8 @@ class PluginManager:
                 if name in self.plugin_routers:
                     del self.plugin_routers[name]
                     logger.debug(f"Removed API router for plugin '{name}'")
+                self._refresh_capabilities(name)
+                self._emit("unloaded", name, plugin)
             return True
         logger.warning(f"Attempted to unload non-existent plugin: {name}")
         return False
@@ -154,7 +562,7 @@ class PluginManager:
         logger.info("All plugins shut down")
     
     def get_plugin(self, name: str) -> BasePlugin | None:
-        """Get a running plugin instance by name.
+        """Get a running plugin instance by name, loading it first if it is lazy.
         
         Args:
             name: Plugin name
@@ -162,7 +570,17 @@ class PluginManager:
         Returns:
             Plugin instance or None if not found
         """
-        return self.plugins.get(name)
+        return self._ensure_loaded(name)
+
+    async def ensure_loaded(self, name: str) -> BasePlugin | None:
+        """Async get_plugin(): a lazy plugin's first load runs in a worker thread.
+
+        Importing and starting a plugin, and the "loaded" listeners, can take
+        seconds and must not block the event loop.
+        """
+        if name in self.lazy_plugins and name not in self.plugins:
+            return await asyncio.to_thread(self._ensure_loaded, name)
+        return self._ensure_loaded(name)
     
     def get_all_plugins(self) -> Dict[str, BasePlugin]:
         """Get all loaded plugin instances.
@@ -180,4 +598,19 @@ class PluginManager:
         """
         return self.plugin_routers
 
+    def get_plugin_router(self, name: str) -> Any | None:
+        """Get a plugin's API router, loading the plugin first if it is lazy and declares one."""
+        if name not in self.plugin_routers and name in self.lazy_plugins:
+            if self.lazy_plugins[name][1].get("api_router", False):
+                self._ensure_loaded(name)
+        elif name in self.lazy_plugins:
+            self._last_used[name] = time.monotonic()
+        return self.plugin_routers.get(name)
+
+    async def ensure_plugin_router(self, name: str) -> Any | None:
+        """Async get_plugin_router(): a lazy plugin's first load runs in a worker thread."""
+        if name in self.lazy_plugins and name not in self.plugin_routers:
+            return await asyncio.to_thread(self.get_plugin_router, name)
+        return self.get_plugin_router(name)
+
 plugin_manager = PluginManager()
\ No newline at end of file
@@ -2,14 +2,16 @@ from typing import Any
 from backend.core.plugins.generic import GenericPlugin
 from backend.plugins.AutomatedPipeline.automated_pipe import automated_pipe
 from backend.core.notifications import notification_manager
-from backend.core.database.models import NotificationMessage, NotificationType, Plugin
-from backend.core.database.database import engine
+from backend.core.database.models import NotificationMessage, NotificationType
 from backend.plugin_manager import plugin_manager
-from sqlmodel import Session, select
+from backend.core.logging_config import get_plugin_logger
+
+
+logger = get_plugin_logger("AutomatedPipeline")
 
 
 async def run_automated_pipeline():
-    print("Running automated pipeline...")
+    logger.info("Running automated pipeline...")
     try:
         initial_data = {}
         result = await automated_pipe.execute(initial_data)
@@ -20,9 +22,10 @@ async def run_automated_pipeline():
         sent_items = result.get("sent_items", [])
         
         # Log results
-        print(f"Indexer found {len(indexer_results)} results")
-        print(f"Parser matched {len(parsed_results)} items")
-        print(f"Sent {len(sent_items)} items to download client")
+        logger.info(
+            "Indexer found %d results, parser matched %d items, sent %d items to download client",
+            len(indexer_results), len(parsed_results), len(sent_items),
+        )
         
         # Send notification based on results
         if sent_items:
@@ -40,10 +43,10 @@ async def run_automated_pipeline():
                 )
             )
         else:
-            print("No new releases found in indexer feeds")
+            logger.info("No new releases found in indexer feeds")
             
     except Exception as e:
-        print(f"Error running automated pipeline: {e}")
+        logger.exception("Error running automated pipeline")
         await notification_manager.broadcast(
             NotificationMessage(
                 type=NotificationType.ERROR,
@@ -60,11 +63,11 @@ class AutomatedPipe(GenericPlugin):
     
     def start(self) -> None:
         """Plugin start - scheduled jobs are registered separately."""
-        print(f"AutomatedPipe plugin started")
+        logger.info("AutomatedPipe plugin started")
     
     def stop(self) -> None:
         """Plugin stop."""
-        print(f"AutomatedPipe plugin stopped")
+        logger.info("AutomatedPipe plugin stopped")
     
     def get_scheduler_jobs(self) -> list[dict[str, Any]]:
         """Return the scheduled job configuration for the automated pipeline.
@@ -74,58 +77,26 @@ class AutomatedPipe(GenericPlugin):
         system needing to know about plugin-specific logic.
         """
         # Check if required plugin capabilities are available
-        with Session(engine) as session:
-            plugins = session.exec(select(Plugin).where(Plugin.enabled == True)).all()
-            
-            has_indexer_plugin = False
-            has_parser_plugin = False
-            has_download_client_plugin = False
-            
-            for plugin in plugins:
-                try:
-                    plugin_instance = plugin_manager.get_plugin(plugin.name)
-                    if plugin_instance:
-                        # Check if plugin has indexer capability
-                        try:
-                            indexers = plugin_instance.get_available_indexers()
-                            if indexers:
-                                has_indexer_plugin = True
-                        except (NotImplementedError, AttributeError):
-                            pass
-                        
-                        # Check if plugin has parser capability
-                        try:
-                            parsers = plugin_instance.get_available_parsers()
-                            if parsers:
-                                has_parser_plugin = True
-                        except (NotImplementedError, AttributeError):
-                            pass
-                        
-                        # Check if plugin has download client capability
-                        try:
-                            clients = plugin_instance.get_available_clients()
-                            if clients:
-                                has_download_client_plugin = True
-                        except (NotImplementedError, AttributeError):
-                            pass
-                except Exception:
-                    pass
-            
-            if not (has_indexer_plugin and has_parser_plugin and has_download_client_plugin):
-                missing = []
-                if not has_indexer_plugin:
-                    missing.append("Indexer capability")
-                if not has_parser_plugin:
-                    missing.append("Parser capability")
-                if not has_download_client_plugin:
-                    missing.append("Download Client capability")
-                print(
-                    f"AutomatedPipeline: Not scheduling automated_pipeline job - "
-                    f"missing plugin capabilities: {', '.join(missing)}"
-                )
-                return []  # Don't schedule any jobs
+        capabilities = plugin_manager.get_capability_summary()
+        has_indexer_plugin = capabilities["has_indexers"]
+        has_parser_plugin = capabilities["has_parsers"]
+        has_download_client_plugin = capabilities["has_download_clients"]
+
+        if not (has_indexer_plugin and has_parser_plugin and has_download_client_plugin):
+            missing = []
+            if not has_indexer_plugin:
+                missing.append("Indexer capability")
+            if not has_parser_plugin:
+                missing.append("Parser capability")
+            if not has_download_client_plugin:
+                missing.append("Download Client capability")
+            logger.info(
+                f"Not scheduling automated_pipeline job - "
+                f"missing plugin capabilities: {', '.join(missing)}"
+            )
+            return []  # Don't schedule any jobs
         
-        print("AutomatedPipeline: Scheduling automated_pipeline job (requirements met)")
+        logger.info("Scheduling automated_pipeline job (requirements met)")
         return [
             {
                 "func": run_automated_pipeline,
@@ -133,5 +104,6 @@ class AutomatedPipe(GenericPlugin):
                 "minutes": 15,
                 "id": "automated_pipeline",
                 "replace_existing": True,
+                "heavy": True,
             }
         ] 
\ No newline at end of file
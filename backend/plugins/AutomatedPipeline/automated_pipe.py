@@ -6,6 +6,9 @@ The Pipeline has 3 default stages:
 3. Send Results to Download Client plugin
 """
 
+from sqlmodel import Session
+
+from backend.core.database.database import engine
 from backend.core.services.pipeline.pipe import Pipe
 from backend.core.services.pipeline.stage import Stage
 from backend.core.services.indexer_service import get_all_feeds
@@ -18,7 +21,8 @@ from backend.api.v1.core import read_series_list
 # Default stage implementations
 async def check_indexer_feed(data: dict) -> dict:
     """Check indexer feed of all plugins."""
-    feeds = get_all_feeds()
+    with Session(engine) as session:
+        feeds = await get_all_feeds(session)
     data["indexer_results"] = feeds
     return data
 
@@ -28,7 +32,7 @@ async def parse_results(data: dict) -> dict:
     indexer_results = data.get("indexer_results", [])
     if indexer_results:
         result_titles = [result.get("title", "") for result in indexer_results]
-        parsed_data = parse_titles(result_titles)
+        parsed_data = parse_titles(result_titles) or {}
         data["parsed_results"] = parsed_data
     else:
         data["parsed_results"] = {}
@@ -45,8 +49,13 @@ async def send_to_client(data: dict) -> dict:
     for result in indexer_results:
         # Send items that were successfully parsed/matched
         if result.get("title") in parsed_results:
-            send_to_download_client(result)
-            sent_items.append(result)
+            link = result.get("link") or ""
+            sent = await send_to_download_client(
+                torrent_url=result.get("download_url"),
+                magnet_link=link if link.startswith("magnet:") else None,
+            )
+            if sent:
+                sent_items.append(result)
 
     data["sent_items"] = sent_items
     return data
@@ -20,6 +20,10 @@ from backend.core.plugins.metadata import (
 )
 from .ranobedb_api import IMAGE_BASE_URL, download_image, get_series, get_series_by_id, get_book_by_id
 from . import rate_limiter
+from backend.core.logging_config import get_plugin_logger
+
+
+logger = get_plugin_logger("RanobeDB")
 
 
 class RanobeDBPlugin(BasePlugin):
@@ -35,10 +39,10 @@ class RanobeDBPlugin(BasePlugin):
     enabled = True
     
     def start(self) -> None:
-        print("RanobeDB plugin started")
+        logger.info("RanobeDB plugin started")
     
     def stop(self) -> None:
-        print("RanobeDB plugin stopped")
+        logger.info("RanobeDB plugin stopped")
     
     def get_available_sources(self) -> List[Dict[str, Any]]:
         """Return available metadata sources this plugin can provide.
@@ -95,7 +99,6 @@ class RanobeDBMetadata(MetadataPlugin):
         """
         Determine the appropriate title based on language preference.
         """
-        print(f"Determining title for lang: {lang}")
         if lang != "en":
             # For Non-English books: romaji > romaji_orig > title > title_orig > "Unknown Title"
             title = (
@@ -114,8 +117,8 @@ class RanobeDBMetadata(MetadataPlugin):
                 or response.get("title_orig")
                 or "Unknown Title"
             )
-            
-        print(f"Determined title: {title}")
+
+        logger.debug("Determined title for lang %s: %s", lang, title)
 
         return title
 
@@ -133,10 +136,10 @@ class RanobeDBMetadata(MetadataPlugin):
             return None
 
     def start(self) -> None:
-        print("RanobeDB plugin started")
+        logger.debug("RanobeDB metadata source started")
 
     def stop(self) -> None:
-        print("RanobeDB plugin stopped")
+        logger.debug("RanobeDB metadata source stopped")
 
     async def search_series(self, query: str) -> list[SeriesSearchResponse]:
         results = await get_series(query)
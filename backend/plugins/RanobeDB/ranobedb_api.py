@@ -2,6 +2,9 @@ from anyio import Path
 import httpx
 from typing import Any
 from .rate_limiter import async_rate_limit_pause
+from backend.core.logging_config import get_plugin_logger, rate_limited
+
+logger = rate_limited(get_plugin_logger("RanobeDB"))
 
 BASE_URL = "https://ranobedb.org/api/v0"
 IMAGE_BASE_URL = "https://images.ranobedb.org"
@@ -36,7 +39,7 @@ async def download_image(filename: str, dest_path: Path) -> str |None:
 
         return str(file_path)
     except Exception as e:
-        print(f"Error downloading image {filename}: {e}")
+        logger.warning("Error downloading image %s: %s", filename, e)
         return None
 
 
@@ -9,6 +9,12 @@ import httpx
 # Import bucket classes for rate limiting
 from pyrate_limiter import Limiter, Rate, Duration, SQLiteBucket, InMemoryBucket
 
+from backend.core.logging_config import get_plugin_logger, rate_limited
+from backend.core.metrics import PLUGIN_HTTP_REQUESTS, RATE_LIMIT_WAIT
+
+# Retry warnings repeat for every queued call while the limit is hit
+logger = rate_limited(get_plugin_logger("RanobeDB"))
+
 
 # -------------------------
 # 1. Configuration (Module-level, shared resources)
@@ -56,15 +62,13 @@ def _init_limiter(data_dir: str | None = None):
             raise_when_fail=False,  # Don't raise, use delay mechanism instead
             max_delay=Duration.HOUR,  # Wait indefinitely until slot is available
         )
-        print(f"[INFO] Rate Limiter initialized with SQLite backend at {SQLITE_DB_PATH}")
-        print(f"[INFO] File locking enabled for multi-process safety")
+        logger.debug("Rate limiter initialized with SQLite backend at %s (file locking enabled)", SQLITE_DB_PATH)
 
     except ImportError as e:
-        print(f"[ERROR] filelock package required for multi-process rate limiting: {e}")
-        print(f"[ERROR] Install with: pip install filelock")
+        logger.error("filelock package required for multi-process rate limiting (pip install filelock): %s", e)
         raise
     except Exception as e:
-        print(f"[WARN] SQLite limiter init failed, falling back to in-memory: {e}")
+        logger.warning("SQLite limiter init failed, falling back to in-memory: %s", e)
         # Fallback to a non-persistent, in-memory limiter (Warning: Not global across processes!)
         memory_bucket = InMemoryBucket([REQUEST_RATE])
         GLOBAL_LIMITER = Limiter(
@@ -102,22 +106,31 @@ def async_rate_limit_pause(
         # This will automatically wait (non-blocking) if rate limit is exceeded
         max_retries = 6
         retry_delay = 1.0  # seconds
+        wait_start = time.perf_counter()
 
         for attempt in range(max_retries):
             try:
                 acquired = await GLOBAL_LIMITER.try_acquire_async(LIMIT_ITEM_NAME)
 
                 if acquired:
-                    return await func(*args, **kwargs)
+                    RATE_LIMIT_WAIT.labels("RanobeDB").observe(time.perf_counter() - wait_start)
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception:
+                        PLUGIN_HTTP_REQUESTS.labels("RanobeDB", "error").inc()
+                        raise
+                    PLUGIN_HTTP_REQUESTS.labels("RanobeDB", "success").inc()
+                    return result
 
                 if attempt < max_retries - 1:
-                    print(
-                        f"[WARN] Rate limit exceeded, retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{max_retries})"
+                    logger.warning(
+                        "Rate limit exceeded, retrying in %s seconds... (Attempt %d/%d)",
+                        retry_delay, attempt + 1, max_retries,
                     )
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
             except Exception as e:
-                print(f"[ERROR] Exception during rate limit acquire: {e}")
+                logger.error("Exception during rate limit acquire: %s", e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
@@ -146,22 +159,22 @@ async def fetch_endpoint(endpoint: str, client: httpx.AsyncClient) -> dict:
     (e.g., in a context manager) for efficiency.
     """
     url = f"https://api.external-service.com/{endpoint}"
-    print(f"[{time.strftime('%H:%M:%S')}] Attempting API call to {url}...")
+    logger.debug("Attempting API call to %s", url)
 
     try:
         response = await client.get(url, timeout=10.0)
         response.raise_for_status()  # Raises HTTPStatusError for 4xx/5xx responses
         data = response.json()
-        print(f"[{time.strftime('%H:%M:%S')}] ✅ Success: {url}")
+        logger.debug("Success: %s", url)
         return data
 
     except httpx.RequestError as e:
         # Catches network errors, DNS failures, timeouts, etc.
-        print(f"[{time.strftime('%H:%M:%S')}] ❌ Request error (Network/Timeout): {e}")
+        logger.warning("Request error (Network/Timeout): %s", e)
         return {"status": "error", "message": f"Network/Request Error: {str(e)}"}
     except httpx.HTTPStatusError as e:
         # Catches bad HTTP status codes (4xx/5xx)
-        print(f"[{time.strftime('%H:%M:%S')}] ❌ HTTP error: {e}")
+        logger.warning("HTTP error: %s", e)
         return {
             "status": "error",
             "message": f"HTTP Error {e.response.status_code}: {str(e)}",
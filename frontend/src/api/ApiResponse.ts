@@ -176,6 +176,11 @@ export type Notification = {
   read: boolean;
 }
 
+export type NotificationPage = {
+  notifications: Notification[]; // Newest first
+  nextCursor: string | null; // Pass to getNotifications() for the next, older page
+}
+
 export type BackupInfo = {
   filename: string;
   path: string;
@@ -186,7 +191,7 @@ export type BackupInfo = {
 }
 
 export type TaskProgress = {
-  status: "pending" | "running" | "completed" | "failed";
+  status: "pending" | "running" | "completed" | "failed" | "cancelled";
   progress: number;
   message: string;
   created_at: string;
@@ -8,6 +8,7 @@ import type {
   SeriesSourceResponse,
   Release,
   Notification,
+  NotificationPage,
   MetadataSource,
   PluginCapability,
   BackupResponse,
@@ -236,9 +237,15 @@ export async function getPluginCapabilities(): Promise<{
   }
 }
 
+// Resized WebP thumbnail of a locally served cover image (other URLs are returned unchanged)
+export function thumbnailUrl(url: string | undefined, width: 200 | 400) {
+  if (!url || !url.startsWith("/api/v1/image/")) return url;
+  return `${url}${url.includes("?") ? "&" : "?"}w=${width}`;
+}
+
 export async function uploadPlugin(
   file: File
-): Promise<{ success: boolean; message: string }> {
+): Promise<{ success: boolean; message: string; restart_required?: string }> {
   try {
     const formData = new FormData();
     formData.append("plugin", file);
@@ -268,13 +275,18 @@ export async function deletePlugin(
   }
 }
 
-export async function getNotifications(): Promise<Notification[]> {
+export async function getNotifications(cursor?: string | null): Promise<NotificationPage> {
   try {
-    const response = await api.get(`/system/notifications`);
-    return response.data;
+    const response = await api.get<Notification[]>(`/system/notifications`, {
+      params: cursor ? { cursor } : undefined,
+    });
+    return {
+      notifications: response.data,
+      nextCursor: response.headers["x-next-cursor"] ?? null,
+    };
   } catch (error) {
     console.error("Error fetching notifications:", error);
-    return [];
+    return { notifications: [], nextCursor: null };
   }
 }
 
@@ -3,6 +3,7 @@ import { AspectRatio, Box, Card, Checkbox, Image, Text } from "@mantine/core";
 import { useHover } from "@mantine/hooks";
 import classes from "./ItemCard.module.css";
 import { type CardItem } from "../../types/CardItems";
+import { thumbnailUrl } from "../../api/api";
 
 const stripColor: { [key: string]: string } = {
   true: "green",
@@ -59,7 +60,7 @@ function ItemCard({
           onClick={selectMode ? handleClick : undefined}
         >
           <Card.Section>
-            <Image src={item.img_url} alt={item.title} fit="contain" />
+            <Image src={thumbnailUrl(item.img_url, 400)} alt={item.title} fit="contain" />
           </Card.Section>
 
           <Card.Section
@@ -18,7 +18,7 @@ import {
 import { TbSearch } from "react-icons/tb";
 
 import { type Series } from "../api/ApiResponse.ts";
-import { getSeries } from "../api/api.ts";
+import { getSeries, thumbnailUrl } from "../api/api.ts";
 
 // TODO: Use API to fetch metadata plugins to search from.
 
@@ -153,9 +153,10 @@ function SpotlightSearch() {
                       {series.find((s) => s.id === action.id)?.img_url && (
                         <Center>
                           <Image
-                            src={
-                              series.find((s) => s.id === action.id)?.img_url
-                            }
+                            src={thumbnailUrl(
+                              series.find((s) => s.id === action.id)?.img_url,
+                              200
+                            )}
                             alt={action.label}
                             fit="contain"
                             width={40}
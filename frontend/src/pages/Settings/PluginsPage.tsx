@@ -87,7 +87,10 @@ function PluginsPage() {
           color: "green",
         });
 
-        setRestartModalOpened(true);
+        // The backend loads new plugins live; only frontend components need a rebuild
+        if (result.restart_required === "true") {
+          setRestartModalOpened(true);
+        }
         
         // Refresh plugins list
         const response = await getPlugins();
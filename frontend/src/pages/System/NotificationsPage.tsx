@@ -10,21 +10,15 @@ const PAGE_SIZES = [10, 15, 20];
 
 function NotificationsPage() {
   const [notifications, setNotifications] = useState<Notification[]>([]);
+  // Cursor of the next (older) page from the API, null once everything is loaded
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [pageSize, setPageSize] = useState(PAGE_SIZES[1]);
   const [page, setPage] = useState(1);
   const [records, setRecords] = useState(notifications.slice(0, pageSize));
 
   useEffect(() => {
-    async function fetchNotifications() {
-      const data = await getNotifications();
-
-      const sortedData = data.sort((a, b) =>
-        new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime()
-      );
-      setNotifications(sortedData);
-    }
-
-    fetchNotifications();
+    refreshNotifications();
   }, []);
 
   useEffect(() => {
@@ -33,9 +27,20 @@ function NotificationsPage() {
     setRecords(notifications.slice(from, to));
   }, [page, notifications, pageSize]);
 
+  // The API returns notifications newest first
   const refreshNotifications = async () => {
     const data = await getNotifications();
-    setNotifications(data);
+    setNotifications(data.notifications);
+    setNextCursor(data.nextCursor);
+    setPage(1);
+  };
+
+  const loadOlderNotifications = async () => {
+    setLoadingMore(true);
+    const data = await getNotifications(nextCursor);
+    setNotifications((current) => [...current, ...data.notifications]);
+    setNextCursor(data.nextCursor);
+    setLoadingMore(false);
   };
 
   return (
@@ -44,6 +49,11 @@ function NotificationsPage() {
         {/* TODO: Replace with icon
                   Add Filters */}
         <Button onClick={refreshNotifications}>Refresh Notifications</Button>
+        {nextCursor && (
+          <Button variant="light" loading={loadingMore} onClick={loadOlderNotifications}>
+            Load Older Notifications
+          </Button>
+        )}
       </Group>
       <Divider />
       <DataTable
@@ -53,7 +53,11 @@ function Status() {
       if (status?.task) {
         setTaskProgress(status.task);
 
-        if (status.task.status === "completed" || status.task.status === "failed") {
+        if (
+          status.task.status === "completed" ||
+          status.task.status === "failed" ||
+          status.task.status === "cancelled"
+        ) {
           clearInterval(interval);
           
           if (status.task.status === "completed") {
@@ -66,7 +70,7 @@ function Status() {
           } else {
             notifications.show({
               title: "Error",
-              message: status.task.error || "Operation failed",
+              message: status.task.error || status.task.message || "Operation failed",
               color: "red",
             });
           }